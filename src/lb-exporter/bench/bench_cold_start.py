@@ -0,0 +1,143 @@
+# 익스포터 콜드 스타트 측정
+# ktcloud_api_sim.py 시뮬레이터를 대상으로 lb-exporter.py 프로세스를 새로 띄우고
+# 프로세스 시작부터 HTTP 서버 응답(/healthz), 첫 메트릭 게시(/readyz 성공)까지 걸린 시간과
+# 그때까지의 API 호출 수를 KTCLOUD_LAZY_INIT=true/false 각각에 대해 측정
+#
+# 실행 방법 : python bench/bench_cold_start.py [--lbs 200] [--latency-ms 200] [--runs 3] [--json]
+
+import os
+import sys
+import json
+import time
+import argparse
+import statistics
+import subprocess
+import urllib.error
+import urllib.request
+
+from bench_exporter_cycle import EXPORTER_DIR, free_port, sim_request, start_simulator
+
+POLL_INTERVAL = 0.005  # HTTP 서버 상태 확인 간격 (초)
+
+
+def probe(url):
+    # HTTP 상태 코드를 return, 서버가 아직 응답하지 않으면 None
+    try:
+        with urllib.request.urlopen(url, timeout=1) as response:
+            return response.status
+    except urllib.error.HTTPError as e:
+        return e.code
+    except OSError:
+        return None
+
+
+def measure(sim_url, lazy, timeout):
+    """익스포터 프로세스 하나를 띄워 /healthz 응답, /readyz 성공 시점을 측정"""
+    port = free_port()
+    env = dict(
+        os.environ,
+        CLOUD_ID="bench",
+        CLOUD_PASSWORD="bench",
+        CLOUD_ZONE="DX-M1",
+        KTCLOUD_TARGETS="",
+        KTCLOUD_API_BASE_URL=sim_url,
+        KTCLOUD_LAZY_INIT="true" if lazy else "false",
+        EXPORTER_PORT=str(port),
+    )
+    base = f"http://127.0.0.1:{port}"
+    sim_request(sim_url, "/_sim/reset", "POST")
+
+    start = time.perf_counter()
+    process = subprocess.Popen(
+        [sys.executable, os.path.join(EXPORTER_DIR, "lb-exporter.py")],
+        cwd=EXPORTER_DIR,
+        env=env,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    result = {"healthz_seconds": None, "ready_seconds": None, "api_calls_until_ready": None}
+    try:
+        while time.perf_counter() - start < timeout:
+            if process.poll() is not None:
+                raise RuntimeError(f"익스포터가 종료되었습니다 (code {process.returncode})")
+            if result["healthz_seconds"] is None and probe(base + "/healthz") == 200:
+                result["healthz_seconds"] = time.perf_counter() - start
+            if result["healthz_seconds"] is not None and probe(base + "/readyz") == 200:
+                result["ready_seconds"] = time.perf_counter() - start
+                result["api_calls_until_ready"] = sim_request(sim_url, "/_sim/stats")[
+                    "total_calls"
+                ]
+                break
+            time.sleep(POLL_INTERVAL)
+    finally:
+        process.terminate()
+        process.wait()
+    return result
+
+
+def import_seconds(module, runs):
+    """새 인터프리터에서 module import에 걸리는 시간 (중앙값)"""
+    code = (
+        "import time; t = time.perf_counter(); "
+        f"import {module}; print(time.perf_counter() - t)"
+    )
+    samples = [
+        float(
+            subprocess.check_output([sys.executable, "-c", code], cwd=EXPORTER_DIR)
+        )
+        for _ in range(runs)
+    ]
+    return statistics.median(samples)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="익스포터 콜드 스타트 측정")
+    parser.add_argument("--lbs", type=int, default=200, help="가상 LB 개수")
+    parser.add_argument("--latency-ms", type=float, default=200.0, help="API 응답 지연 (ms)")
+    parser.add_argument("--runs", type=int, default=3, help="모드별 측정 횟수")
+    parser.add_argument("--timeout", type=float, default=60.0, help="측정 1회 최대 대기 (초)")
+    parser.add_argument("--json", action="store_true", help="결과를 JSON으로 출력")
+    args = parser.parse_args()
+
+    # 응답 지연이 일정해야 모드 간 비교가 가능하므로 고정 지연, 오류 없음으로 실행
+    process, sim_url = start_simulator(
+        argparse.Namespace(
+            lbs=args.lbs,
+            servers_per_lb=4,
+            latency_ms=args.latency_ms,
+            latency_dist="fixed",
+            error_rate=0.0,
+            sim_rate_limit=0.0,
+            sim_max_inflight=0,
+        )
+    )
+    try:
+        result = {"import_kcldx_seconds": import_seconds("kcldx", args.runs)}
+        for mode, lazy in (("eager", False), ("lazy", True)):
+            runs = [measure(sim_url, lazy, args.timeout) for _ in range(args.runs)]
+            result[mode] = {
+                key: statistics.median(run[key] for run in runs)
+                for key in runs[0]
+                if all(run[key] is not None for run in runs)
+            }
+    finally:
+        process.terminate()
+        process.wait()
+
+    if args.json:
+        print(json.dumps(result, indent=2))
+        return
+
+    print(f"import kcldx: {result['import_kcldx_seconds'] * 1000:.1f} ms")
+    print(f"{'mode':>6}{'/healthz (s)':>14}{'/readyz (s)':>13}{'api calls':>11}")
+    for mode in ("eager", "lazy"):
+        r = result[mode]
+        print(
+            f"{mode:>6}{r.get('healthz_seconds', float('nan')):>14.3f}"
+            f"{r.get('ready_seconds', float('nan')):>13.3f}"
+            f"{r.get('api_calls_until_ready', 0):>11}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,271 @@
+# AtomicKTCloudLBExporter 전체 수집 주기 부하 테스트
+# ktcloud_api_sim.py 시뮬레이터(별도 프로세스)를 대상으로 수집 주기를 반복 실행하고
+# 주기별 소요 시간, API 호출 수, /metrics 렌더링 시간과 크기, 최대 RSS를 측정
+#
+# 실행 방법 : python bench/bench_exporter_cycle.py [--lbs 500] [--servers-per-lb 4] [--cycles 5]
+#             [--latency-ms 50] [--error-rate 0.01] [--concurrency 8] [--async] [--json]
+# API 속도 제한 재현 : --sim-rate-limit 200 --sim-max-inflight 16 (초과 요청은 429)
+#                      --no-adaptive 이면 동시 요청 수 자동 조절 없이 --concurrency로 고정
+# 이미 실행 중인 시뮬레이터를 사용하려면 --sim-url http://127.0.0.1:18080
+
+import os
+import sys
+import json
+import time
+import asyncio
+import socket
+import logging
+import argparse
+import resource
+import statistics
+import tempfile
+import subprocess
+import importlib.util
+import urllib.request
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+EXPORTER_DIR = os.path.join(BENCH_DIR, "..")
+
+
+def free_port():
+    # 시뮬레이터에 사용할 빈 포트
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def sim_request(url, path, method="GET"):
+    request = urllib.request.Request(url + path, method=method)
+    with urllib.request.urlopen(request, timeout=5) as response:
+        return json.loads(response.read())
+
+
+def start_simulator(args):
+    """시뮬레이터를 별도 프로세스로 실행하고 응답할 때까지 대기"""
+    port = free_port()
+    process = subprocess.Popen(
+        [
+            sys.executable,
+            os.path.join(BENCH_DIR, "ktcloud_api_sim.py"),
+            "--port",
+            str(port),
+            "--lbs",
+            str(args.lbs),
+            "--servers-per-lb",
+            str(args.servers_per_lb),
+            "--latency-ms",
+            str(args.latency_ms),
+            "--latency-dist",
+            args.latency_dist,
+            "--error-rate",
+            str(args.error_rate),
+            "--rate-limit",
+            str(args.sim_rate_limit),
+            "--max-inflight",
+            str(args.sim_max_inflight),
+        ],
+        stdout=subprocess.DEVNULL,
+    )
+    url = f"http://127.0.0.1:{port}"
+    for _ in range(100):
+        try:
+            sim_request(url, "/_sim/stats")
+            return process, url
+        except OSError:
+            time.sleep(0.1)
+    process.kill()
+    raise RuntimeError("시뮬레이터가 시작되지 않았습니다.")
+
+
+def load_exporter(sim_url, args):
+    """시뮬레이터를 바라보도록 환경 변수를 설정한 뒤 lb-exporter.py를 모듈로 적재"""
+    os.environ.update(
+        {
+            "CLOUD_ID": "bench",
+            "CLOUD_PASSWORD": "bench",
+            "CLOUD_ZONE": "DX-M1",
+            "KTCLOUD_TARGETS": "",
+            "KTCLOUD_API_BASE_URL": sim_url,
+            "LB_FETCH_CONCURRENCY": str(args.concurrency),
+            "API_ADAPTIVE_CONCURRENCY": "false" if args.no_adaptive else "true",
+            "USAGE_INTERVAL": "60" if args.usage else "0",
+            "KTCLOUD_ASYNC": "true" if args.use_async else "false",
+        }
+    )
+    sys.path.insert(0, EXPORTER_DIR)
+    spec = importlib.util.spec_from_file_location(
+        "lb_exporter", os.path.join(EXPORTER_DIR, "lb-exporter.py")
+    )
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    # 수집 로그는 측정에 방해가 되므로 경고 이상만 출력
+    logging.getLogger().setLevel(logging.WARNING)
+    return module
+
+
+async def close_targets(exporter):
+    # asyncio 모드에서 대상별 connection pool 정리
+    await asyncio.gather(
+        *(t.zone_mgr.close() for t in exporter.targets if t.zone_mgr is not None)
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="익스포터 수집 주기 부하 테스트")
+    parser.add_argument("--lbs", type=int, default=500, help="가상 LB 개수")
+    parser.add_argument("--servers-per-lb", type=int, default=4, help="LB별 서버 개수")
+    parser.add_argument("--latency-ms", type=float, default=50.0, help="평균 응답 지연 (ms)")
+    parser.add_argument(
+        "--latency-dist", choices=["fixed", "uniform", "lognormal"], default="lognormal"
+    )
+    parser.add_argument("--error-rate", type=float, default=0.0, help="오류 응답 비율 (0~1)")
+    parser.add_argument("--cycles", type=int, default=5, help="측정할 수집 주기 횟수")
+    parser.add_argument(
+        "--concurrency", type=int, default=8, help="LB_FETCH_CONCURRENCY (0이면 익스포터 기본값)"
+    )
+    parser.add_argument("--usage", action="store_true", help="LB 사용량도 매 주기 수집")
+    parser.add_argument(
+        "--async",
+        dest="use_async",
+        action="store_true",
+        help="asyncio 모드(KTCLOUD_ASYNC=true)로 수집",
+    )
+    parser.add_argument(
+        "--no-adaptive",
+        action="store_true",
+        help="동시 요청 수 자동 조절 끄기 (API_ADAPTIVE_CONCURRENCY=false)",
+    )
+    parser.add_argument(
+        "--sim-rate-limit", type=float, default=0.0, help="시뮬레이터 초당 요청 수 제한"
+    )
+    parser.add_argument(
+        "--sim-max-inflight", type=int, default=0, help="시뮬레이터 동시 요청 수 제한"
+    )
+    parser.add_argument("--sim-url", help="이미 실행 중인 시뮬레이터 주소")
+    parser.add_argument("--json", action="store_true", help="결과를 JSON으로 출력")
+    args = parser.parse_args()
+
+    process = None
+    sim_url = args.sim_url
+    if not sim_url:
+        process, sim_url = start_simulator(args)
+
+    # 익스포터가 작업 디렉터리에 만드는 file(SDK log 등)은 임시 디렉터리에 기록하고 종료 시 삭제
+    work_dir = tempfile.TemporaryDirectory(prefix="bench-exporter-")
+    cwd = os.getcwd()
+    os.chdir(work_dir.name)
+
+    loop = asyncio.new_event_loop() if args.use_async else None
+    module = None
+    exporter = None
+    try:
+        module = load_exporter(sim_url, args)
+
+        # 초기화 (token 발급, subnet 조회) 비용
+        sim_request(sim_url, "/_sim/reset", "POST")
+        init_start = time.perf_counter()
+        exporter = module.AtomicKTCloudLBExporter()
+        init_seconds = time.perf_counter() - init_start
+        init_calls = sim_request(sim_url, "/_sim/stats")["total_calls"]
+
+        cycles = []
+        for _ in range(args.cycles):
+            # 모든 데이터 종류를 매 주기 수집하도록 예약 초기화
+            for target in exporter.targets:
+                target.next_due = {name: 0 for name in target.next_due}
+            sim_request(sim_url, "/_sim/reset", "POST")
+
+            cycle_start = time.perf_counter()
+            if loop is not None:
+                loop.run_until_complete(exporter.collect_metrics_async())
+            else:
+                exporter.collect_metrics()
+            cycle_seconds = time.perf_counter() - cycle_start
+
+            stats = sim_request(sim_url, "/_sim/stats")
+            render_seconds = exporter.exposition_cache.render(time.time())
+            body, gzip_body, _ = exporter.exposition_cache.payload()
+            cycles.append(
+                {
+                    "cycle_seconds": cycle_seconds,
+                    "api_calls": stats["total_calls"],
+                    "api_errors": sum(stats["errors"].values()),
+                    "api_throttled": sum(stats.get("throttled", {}).values()),
+                    "render_seconds": render_seconds,
+                    "metrics_bytes": len(body),
+                    "metrics_gzip_bytes": len(gzip_body),
+                }
+            )
+
+        result = {
+            "lbs": args.lbs,
+            "servers": args.lbs * args.servers_per_lb,
+            "concurrency": module.LB_FETCH_CONCURRENCY,
+            "adaptive": module.API_ADAPTIVE_CONCURRENCY,
+            "mode": "async" if loop is not None else "threads",
+            "init_seconds": init_seconds,
+            "init_api_calls": init_calls,
+            "cycle_seconds_median": statistics.median(c["cycle_seconds"] for c in cycles),
+            "cycle_seconds_max": max(c["cycle_seconds"] for c in cycles),
+            "render_seconds_median": statistics.median(
+                c["render_seconds"] for c in cycles
+            ),
+            # Linux의 ru_maxrss 단위는 KB
+            "peak_rss_mb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+            "cycles": cycles,
+        }
+        if exporter.rate_limiter is not None:
+            result["rate_limiter"] = exporter.rate_limiter.stats()
+    finally:
+        if loop is not None:
+            if exporter is not None:
+                loop.run_until_complete(close_targets(exporter))
+            loop.close()
+        if process is not None:
+            process.terminate()
+            process.wait()
+        # 남은 SDK log를 임시 디렉터리가 삭제되기 전에 기록
+        if module is not None:
+            module.kcl.ku._stop_sdk_log_listeners()
+        os.chdir(cwd)
+        work_dir.cleanup()
+
+    if args.json:
+        print(json.dumps(result, indent=2))
+        return
+
+    print(
+        f"LB {result['lbs']}개, 서버 {result['servers']}개, 동시 조회 {result['concurrency']}개 "
+        f"({result['mode']}{', 자동 조절' if result['adaptive'] else ''})"
+    )
+    print(
+        f"초기화: {result['init_seconds']:.3f} 초, API 호출 {result['init_api_calls']}회"
+    )
+    print(
+        f"{'cycle':>5}{'time (s)':>10}{'api calls':>11}{'errors':>8}{'429':>6}"
+        f"{'render (ms)':>13}{'size (KB)':>11}{'gzip (KB)':>11}"
+    )
+    for i, c in enumerate(cycles, start=1):
+        print(
+            f"{i:>5}{c['cycle_seconds']:>10.3f}{c['api_calls']:>11}{c['api_errors']:>8}"
+            f"{c['api_throttled']:>6}"
+            f"{c['render_seconds'] * 1000:>13.1f}{c['metrics_bytes'] / 1024:>11.1f}"
+            f"{c['metrics_gzip_bytes'] / 1024:>11.1f}"
+        )
+    print(
+        f"주기 중앙값: {result['cycle_seconds_median']:.3f} 초, "
+        f"렌더링 중앙값: {result['render_seconds_median'] * 1000:.1f} ms, "
+        f"최대 RSS: {result['peak_rss_mb']:.1f} MB"
+    )
+    for endpoint, stats in sorted(result.get("rate_limiter", {}).items()):
+        limit = stats["concurrency_limit"]
+        print(
+            f"속도 제한 [{endpoint}]: 동시 요청 수 제한 "
+            f"{'-' if limit is None else int(limit)}, "
+            f"429/5xx {sum(stats['throttle_events'].values())}회, "
+            f"대기 {stats['wait_seconds']:.2f} 초"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,198 @@
+# LB/서버 목록 파싱 결과의 메모리 사용량 측정
+# dict 결과(parse_list_lb_info, parse_list_lb_server), 레코드 결과(*_records),
+# stream 모드(JsonArrayStream으로 본문을 chunk 단위로 읽으면서 레코드로 변환)를 비교
+# 시뮬레이터와 같은 형식의 API 응답 본문(bytes)을 만들어 두고 매번 새로 파싱하므로
+# 문자열 값은 실제 응답처럼 항목마다 별도 객체로 생성됨
+# (응답 본문 자체는 측정 전에 만들어 두므로 최대 메모리에 포함되지 않음)
+#
+# 실행 방법 : python bench/bench_lb_records.py [--servers 10000 50000] [--servers-per-lb 4]
+
+import os
+import sys
+import gc
+import json
+import time
+import random
+import argparse
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+import kclutil as ku
+
+
+def make_responses(lbs, servers_per_lb, seed=1):
+    """LB 목록 응답 1개와 LB별 서버 목록 응답 본문(bytes) 생성"""
+    rng = random.Random(seed)
+    lb_items = []
+    server_texts = []
+    for i in range(lbs):
+        lb_id = str(100000 + i)
+        service_type = rng.choice(["http", "https", "tcp"])
+        healthcheck_type = "tcp" if service_type == "tcp" else "http"
+        lb_items.append(
+            {
+                "loadbalancerid": lb_id,
+                "name": f"bench-lb-{i:05d}",
+                "serviceip": f"172.25.{i // 250 % 256}.{i % 250 + 1}",
+                "serviceport": rng.choice(["80", "443", "8080"]),
+                "servicetype": service_type,
+                "loadbalanceroption": rng.choice(
+                    ["roundrobin", "leastconnection", "sourceiphash"]
+                ),
+                "healthchecktype": healthcheck_type,
+                "healthcheckurl": "/health" if healthcheck_type == "http" else "",
+                "establishedconn": str(rng.randint(0, 500)),
+                "ciphergroupname": "",
+                "networkid": f"bench-subnet-{i % 8}",
+                "state": "UP" if rng.random() > 0.02 else "DOWN",
+            }
+        )
+        servers = [
+            {
+                "ipaddress": f"10.{i // 250 % 256}.{i % 250}.{j + 1}",
+                "loadbalancerid": lb_id,
+                "virtualmachineid": f"bench-vm-{i}-{j}",
+                "publicport": "80",
+                "state": "UP" if rng.random() > 0.05 else "DOWN",
+                "serviceid": str(i * 1000 + j),
+                "cursrvrconnections": str(rng.randint(0, 200)),
+                "throughputrate": f"{rng.uniform(0, 5000):.2f}",
+                "avgsvrttfb": f"{rng.uniform(0, 300):.2f}",
+                "requestsrate": f"{rng.uniform(0, 1000):.2f}",
+            }
+            for j in range(servers_per_lb)
+        ]
+        server_texts.append(
+            json.dumps(
+                {"listloadbalancerwebserversresponse": {"loadbalancerwebserver": servers}}
+            ).encode("utf-8")
+        )
+    lb_text = json.dumps(
+        {"listloadbalancersresponse": {"loadbalancer": lb_items}}
+    ).encode("utf-8")
+    return lb_text, server_texts
+
+
+def stream_parser(path, parse_item):
+    """본문을 STREAM_CHUNK_SIZE씩 JsonArrayStream에 넣어 레코드 목록을 만드는 parse 함수"""
+
+    def parse(body):
+        stream = ku.JsonArrayStream(path, parse_item)
+        items = []
+        for start in range(0, len(body), ku.STREAM_CHUNK_SIZE):
+            items.extend(stream.feed(body[start : start + ku.STREAM_CHUNK_SIZE]))
+        items.extend(stream.close())
+        return items
+
+    return parse
+
+
+def loads_parser(parse):
+    """본문 전체를 json.loads로 dict tree로 만든 뒤 parse하는 함수"""
+    return lambda body: parse(json.loads(body))
+
+
+def measure(parse_lbs, parse_servers, lb_text, server_texts):
+    """
+    응답 전체를 파싱하여 익스포터와 같은 형태(LB 목록, lb_id -> 서버 목록)로 보관했을 때의
+    유지 메모리, 파싱 중 최대 메모리, 소요 시간 측정
+    parse 중 추가로 필요한 메모리(overhead)는 LB 목록 응답과 서버 목록 응답 단계별로
+    (단계 중 최대 메모리 - 단계가 끝난 뒤 메모리)를 구해 큰 값을 사용
+    """
+    overheads = []
+
+    def mark_phase():
+        current, peak = tracemalloc.get_traced_memory()
+        overheads.append(peak - current)
+        tracemalloc.reset_peak()
+
+    def parse_all(phase_done=lambda: None):
+        lb_list = parse_lbs(lb_text)
+        phase_done()
+        lb_servers = {}
+        for text in server_texts:
+            servers = parse_servers(text)
+            if servers:
+                lb_servers[servers[0].get("lb_id")] = servers
+        return lb_list, lb_servers
+
+    # 소요 시간은 tracemalloc 없이 측정 (tracemalloc은 할당마다 비용이 추가됨)
+    gc.collect()
+    start = time.perf_counter()
+    parse_all()
+    seconds = time.perf_counter() - start
+
+    gc.collect()
+    tracemalloc.start()
+    data = parse_all(mark_phase)
+    gc.collect()
+    mark_phase()
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del data
+    return {
+        "retained_bytes": current,
+        "overhead_bytes": max(overheads),
+        "parse_seconds": seconds,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="LB/서버 레코드 메모리 사용량 측정")
+    parser.add_argument(
+        "--servers", type=int, nargs="+", default=[10000, 50000], help="전체 서버 개수"
+    )
+    parser.add_argument("--servers-per-lb", type=int, default=4, help="LB별 서버 개수")
+    parser.add_argument("--json", action="store_true", help="결과를 JSON으로 출력")
+    args = parser.parse_args()
+
+    variants = {
+        "dict": (
+            loads_parser(ku.parse_list_lb_info),
+            loads_parser(ku.parse_list_lb_server),
+        ),
+        "records": (
+            loads_parser(ku.parse_list_lb_info_records),
+            loads_parser(ku.parse_list_lb_server_records),
+        ),
+        "stream": (
+            stream_parser(
+                ("listloadbalancersresponse", "loadbalancer"), ku.lb_info_record
+            ),
+            stream_parser(
+                ("listloadbalancerwebserversresponse", "loadbalancerwebserver"),
+                ku.lb_server_record,
+            ),
+        ),
+    }
+    results = []
+    for total in args.servers:
+        lbs = max(1, total // args.servers_per_lb)
+        lb_text, server_texts = make_responses(lbs, args.servers_per_lb)
+        for name, (parse_lbs, parse_servers) in variants.items():
+            result = measure(parse_lbs, parse_servers, lb_text, server_texts)
+            result.update(
+                {"variant": name, "lbs": lbs, "servers": lbs * args.servers_per_lb}
+            )
+            results.append(result)
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+
+    print(
+        f"{'servers':>8}{'lbs':>7}{'variant':>9}{'retained (MB)':>15}"
+        f"{'overhead (MB)':>15}{'bytes/server':>14}{'parse (s)':>11}"
+    )
+    for r in results:
+        print(
+            f"{r['servers']:>8}{r['lbs']:>7}{r['variant']:>9}"
+            f"{r['retained_bytes'] / 1024 / 1024:>15.2f}"
+            f"{r['overhead_bytes'] / 1024 / 1024:>15.2f}"
+            f"{r['retained_bytes'] / r['servers']:>14.0f}"
+            f"{r['parse_seconds']:>11.3f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
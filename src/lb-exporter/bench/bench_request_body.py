@@ -0,0 +1,73 @@
+# kclutil.get_request_body() 호출 비용 측정
+# 미리 파싱한 template 방식과 기존 yaml 변환 방식(_get_request_body_yaml)의 호출당 시간을 비교
+#
+# 실행 방법 : python bench/bench_request_body.py [--number 2000]
+
+import os
+import sys
+import timeit
+import argparse
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+import kclutil as ku
+
+# 측정에 사용할 command와 치환 값
+cases = {
+    "make_token": dict(user_id="user@example.com", user_pw="password1234"),
+    "create_vm": dict(
+        vm_name="web-vm01",
+        key_name="web-key",
+        flavor_id="f1a2b3c4-0000-0000-0000-000000000001",
+        zone_name="DX-M1",
+        subnet_id="s1a2b3c4-0000-0000-0000-000000000001",
+        vol_size=50,
+        image_id="i1a2b3c4-0000-0000-0000-000000000001",
+        vol_type="SSD",
+        userdata=ku.encode_to_base64("#!/bin/bash\necho hello"),
+    ),
+    "set_portforward": dict(
+        privateip="172.25.0.10",
+        publicip_id="p1a2b3c4-0000-0000-0000-000000000001",
+        private_port=80,
+        public_port=8080,
+        protocol="TCP",
+    ),
+    "set_firewall_net2net": dict(
+        srcnat="false",
+        protocol="TCP",
+        src_cidr="172.25.0.0/24",
+        action="true",
+        src_net_id="n1",
+        dst_cidr="0.0.0.0/0",
+        dst_net_id="n2",
+    ),
+}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="get_request_body() 호출 비용 측정")
+    parser.add_argument("--number", type=int, default=2000, help="command별 호출 횟수")
+    args = parser.parse_args()
+
+    print(f"{'command':<24}{'yaml (us)':>12}{'template (us)':>16}{'speedup':>10}")
+    for command, kwargs in cases.items():
+        # 두 방식의 결과가 같은지 먼저 확인
+        assert ku.get_request_body(command, **kwargs) == ku._get_request_body_yaml(
+            command, **kwargs
+        )
+
+        slow = timeit.timeit(
+            lambda: ku._get_request_body_yaml(command, **kwargs), number=args.number
+        )
+        fast = timeit.timeit(
+            lambda: ku.get_request_body(command, **kwargs), number=args.number
+        )
+        slow_us = slow / args.number * 1e6
+        fast_us = fast / args.number * 1e6
+        print(
+            f"{command:<24}{slow_us:>12.1f}{fast_us:>16.1f}{slow_us / fast_us:>9.0f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
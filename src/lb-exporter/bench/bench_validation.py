@@ -0,0 +1,254 @@
+# validate_* 함수의 기존 자원 목록 조회 비용 측정
+# ValidationContext의 index로 찾는 방식과 목록 전체를 순회하던 기존 방식(linear)을 비교
+# VPC._init_query("for_validate")가 조회하는 목록과 같은 형식의 가상 자원 목록과 form을 사용
+#
+# 실행 방법 : python bench/bench_validation.py [--resources 2000] [--repeat 3]
+
+import io
+import os
+import sys
+import copy
+import time
+import contextlib
+import argparse
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+import kclutil as ku
+
+
+class LinearContext(ku.ValidationContext):
+    """index 없이 매번 목록 전체를 순회하는 기존 방식"""
+
+    def _matches(self, key, value, data_list, strict=True):
+        return None
+
+    def validate_fixed_ip(self, ip_addr, old_vm_list):
+        return ku.validate_fixed_ip(ip_addr, old_vm_list)
+
+    def search_acl(self, acl, fw_list):
+        return ku.search_acl(acl, fw_list)
+
+
+def make_inventory(count):
+    """기존 자원 목록 (VM, LB, public ip, port forward, static nat, firewall 각 count개)"""
+    vm_list = [
+        {
+            "vm_id": f"vm-id-{i}",
+            "vm_name": f"bench-vm-{i:05d}",
+            "flavor_name": "2x4.itl",
+            "subnets": [{"privateip": f"172.25.{i // 250}.{i % 250 + 1}"}],
+        }
+        for i in range(count)
+    ]
+    lb_list = [
+        {
+            "lb_name": f"bench-lb-{i:05d}",
+            "service_ip": f"172.26.{i // 250}.{i % 250 + 1}",
+            "service_port": "80",
+        }
+        for i in range(count)
+    ]
+    ip_list = [
+        {"publicip": f"211.0.{i // 250}.{i % 250 + 1}", "type": "STATICNAT"}
+        for i in range(count)
+    ]
+    pf_list = [
+        {
+            "name": f"PF_{i}",
+            "publicip": f"211.1.{i // 250}.{i % 250 + 1}",
+            "privateip": f"172.27.{i // 250}.{i % 250 + 1}",
+            "public_port": "22",
+            "private_port": "22",
+        }
+        for i in range(count)
+    ]
+    sn_list = [
+        {
+            "name": f"SN_{ip['publicip']}",
+            "publicip": ip["publicip"],
+            "privateip": vm_list[i]["subnets"][0]["privateip"],
+        }
+        for i, ip in enumerate(ip_list)
+    ]
+    fw_list = [
+        {
+            "acl_id": f"acl-{i}",
+            "src_nets": [{"name": f"Tier{i % 8}_Sub"}],
+            "dst_nets": [{"name": "external"}],
+            "src_addrs": [{"name": f"172.25.{i // 250}.{i % 250 + 1}/32"}],
+            "dst_addrs": [{"name": "all"}],
+            "services": [{"protocol": "TCP", "startPort": "443", "endPort": "443"}],
+            "action": "allow",
+        }
+        for i in range(count)
+    ]
+    subnet_list = [
+        {"subnet_name": f"Tier{i}", "startip": "172.25.0.1", "endip": "172.25.255.254"}
+        for i in range(8)
+    ]
+    return {
+        "vm_list": vm_list,
+        "lb_list": lb_list,
+        "ip_list": ip_list,
+        "pf_list": pf_list,
+        "sn_list": sn_list,
+        "fw_list": fw_list,
+        "subnet_list": subnet_list,
+        "flavor_list": [{"flavor_name": "2x4.itl"}],
+        "image_list": [{"image_name": "image-0"}],
+        "snapshot_list": [],
+    }
+
+
+def make_forms(count):
+    """기존 자원과 이름이 겹치지 않는 신규 생성 form (VM, LB, public ip, firewall 각 count개)"""
+    key_vm_list = [
+        {
+            "key": f"vm{i}",
+            "params": {
+                "name": f"new-vm-{i:05d}",
+                "key": "bench-key",
+                "flavor": "2x4.itl",
+                "subnet": f"Tier{i % 8}",
+                "image": "image-0",
+                "root_vol_type": "SSD",
+                "fixed_ip": f"172.25.{100 + i // 250}.{i % 250 + 1}",
+            },
+        }
+        for i in range(count)
+    ]
+    key_lb_list = [
+        {
+            "key": f"lb{i}",
+            "params": {
+                "name": f"new-lb-{i:05d}",
+                "option": "roundrobin",
+                "service_ip": f"new_{i:03d}",
+                "service_port": 443,
+                "service_type": "tcp",
+                "healthcheck_type": "tcp",
+                "subnet": f"Tier{i % 8}",
+                "server_list": [f"bench-vm-{i:05d}"],
+                "server_port": 443,
+            },
+        }
+        for i in range(count)
+    ]
+    key_nat_list = [
+        {
+            "key": f"ip{i}",
+            "params": {
+                "type": "static_nat",
+                "public_ip": f"new_{i:03d}",
+                "target": "vm",
+                "target_name": f"bench-vm-{i:05d}",
+            },
+        }
+        for i in range(count)
+    ]
+    key_fw_list = [
+        {
+            "key": "fw",
+            "params": [
+                {
+                    "type": "net2net",
+                    "src_net": f"Tier{i % 8}",
+                    "src_cidr": f"172.25.{100 + i // 250}.{i % 250 + 1}/32",
+                    "dst_net": "external",
+                    "dst_cidr": "0.0.0.0/0",
+                    "protocol": "TCP",
+                    "start_port": 443,
+                    "end_port": 443,
+                    "action": "allow",
+                }
+                for i in range(count)
+            ],
+        }
+    ]
+    return key_vm_list, key_lb_list, key_nat_list, key_fw_list
+
+
+def run(context_class, inv, forms):
+    """VPC의 생성 전 유효성 검사 순서대로 validate_* 실행, 하나의 context를 공유"""
+    key_vm_list, key_lb_list, key_nat_list, key_fw_list = copy.deepcopy(forms)
+    context = context_class()
+
+    # 결과 메시지 출력(ku.append_msg_list)은 측정에서 제외
+    with contextlib.redirect_stdout(io.StringIO()):
+        start = time.perf_counter()
+        results = [
+            ku.validate_vm_list(
+                key_vm_list,
+                inv["flavor_list"],
+                inv["subnet_list"],
+                inv["image_list"],
+                inv["snapshot_list"],
+                inv["vm_list"],
+                "DX-M1",
+                "all",
+                context=context,
+            ),
+            ku.validate_lb_list(
+                key_lb_list,
+                inv["subnet_list"],
+                inv["vm_list"],
+                inv["lb_list"],
+                "all",
+                context=context,
+            ),
+            ku.validate_ip_list(
+                key_nat_list,
+                inv["vm_list"],
+                inv["lb_list"],
+                inv["ip_list"],
+                inv["pf_list"],
+                inv["sn_list"],
+                "all",
+                context=context,
+            ),
+            ku.validate_firewall_list(
+                key_fw_list,
+                inv["subnet_list"],
+                inv["pf_list"],
+                inv["sn_list"],
+                inv["fw_list"],
+                "all",
+                context=context,
+            ),
+        ]
+        seconds = time.perf_counter() - start
+
+    return seconds, results
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="validate_* 기존 자원 조회 index 효과 측정"
+    )
+    parser.add_argument(
+        "--resources", type=int, default=2000, help="자원 종류별 기존 자원, form 개수"
+    )
+    parser.add_argument("--repeat", type=int, default=3, help="반복 횟수 (최솟값 사용)")
+    args = parser.parse_args()
+
+    inv = make_inventory(args.resources)
+    forms = make_forms(args.resources)
+
+    print(f"자원 종류별 기존 자원 {args.resources}개, form {args.resources}개")
+    print(f"{'variant':>8}{'validate (ms)':>16}")
+    expected = None
+    for name, context_class in (
+        ("linear", LinearContext),
+        ("index", ku.ValidationContext),
+    ):
+        runs = [run(context_class, inv, forms) for _ in range(args.repeat)]
+        # index 사용 여부와 관계없이 검사 결과(메시지 포함)는 같아야 함
+        if expected is None:
+            expected = runs[0][1]
+        assert all(r[1] == expected for r in runs)
+        seconds = min(r[0] for r in runs)
+        print(f"{name:>8}{seconds * 1000:>16.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,198 @@
+# VPC 대량 자원 처리 시 이름, id 조회 비용 측정
+# _init_query가 만든 index로 찾는 방식과 목록 전체를 순회하던 기존 방식(linear)을 비교
+# API는 호출하지 않고 조회 결과를 흉내 낸 가상 자원 목록을 사용하며, 삭제 대기(time.sleep)는 생략
+#
+# 실행 방법 : python bench/bench_vpc_index.py [--resources 2000] [--repeat 3]
+
+import io
+import os
+import sys
+import time
+import contextlib
+import argparse
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+import kcldx
+
+
+class FakeResource:
+    """VPC가 사용하는 compute, storage, network 자원 객체 대신 사용 (조회 결과만 제공)"""
+
+    def __init__(self, inventory):
+        self._inventory = inventory
+
+    def __getattr__(self, name):
+        # list_xxx_info()는 가상 목록 return, 삭제 함수는 항상 성공
+        if name in self._inventory:
+            return lambda: list(self._inventory[name])
+        if name.startswith("delete_"):
+            return lambda *args, **kwargs: True
+        raise AttributeError(name)
+
+
+class FakeZoneManager:
+    external_id = "bench-external"
+
+    def __init__(self, inventory):
+        self._resource = FakeResource(inventory)
+
+    def get_zone(self):
+        return "DX-M1", "DX-M1"
+
+    def compute_resource(self):
+        return self._resource
+
+    def storage_resource(self):
+        return self._resource
+
+    def network_resource(self):
+        return self._resource
+
+
+class LinearVPC(kcldx.VPC):
+    """index 없이 매번 목록 전체를 순회하는 기존 방식"""
+
+    def _index(self, list_name, key):
+        self._indexes.pop((list_name, key), None)
+        return super()._index(list_name, key)
+
+    def _find(self, list_name, key, value):
+        return next(
+            (item for item in getattr(self, list_name) or [] if item.get(key) == value),
+            None,
+        )
+
+    def _remove_resource(self, list_name, key, value):
+        # 기존 방식은 삭제한 자원을 목록에서 제거하지 않음
+        pass
+
+
+def make_inventory(vms, lbs, ips):
+    """VPC._init_query("for_validate")가 조회하는 목록과 같은 형식의 가상 자원 목록"""
+    vm_list = [
+        {
+            "vm_id": f"vm-id-{i}",
+            "vm_name": f"bench-vm-{i:05d}",
+            "status": "ACTIVE",
+            "flavor_name": "2x4.itl",
+            "subnets": [{"privateip": f"172.25.{i // 250}.{i % 250 + 1}"}],
+        }
+        for i in range(vms)
+    ]
+    lb_list = [
+        {
+            "lb_id": f"lb-id-{i}",
+            "lb_name": f"bench-lb-{i:05d}",
+            "service_ip": f"172.26.{i // 250}.{i % 250 + 1}",
+        }
+        for i in range(lbs)
+    ]
+    ip_list = [
+        {"publicip_id": f"ip-id-{i}", "publicip": f"211.0.{i // 250}.{i % 250 + 1}"}
+        for i in range(ips)
+    ]
+    sn_list = [
+        {
+            "name": f"SN_{ip['publicip']}",
+            "staticnat_id": f"sn-id-{i}",
+            "publicip": ip["publicip"],
+            "privateip": vm_list[i % vms]["subnets"][0]["privateip"],
+        }
+        for i, ip in enumerate(ip_list)
+    ]
+    return {
+        "list_flavor_info": [
+            {"flavor_id": f"flavor-{i}", "flavor_name": f"{i}x{i * 2}.itl"}
+            for i in range(1, 65)
+        ],
+        "list_subnet_info": [
+            {"subnet_id": f"subnet-{i}", "subnet_name": f"Tier{i}"} for i in range(32)
+        ],
+        "_list_image_info": [
+            {"image_id": f"image-{i}", "image_name": f"image-{i}", "min_disk": 50}
+            for i in range(200)
+        ],
+        "list_snapshot_info": [],
+        "list_vm_info": vm_list,
+        "list_lb_info": lb_list,
+        "list_publicip_info": ip_list,
+        "list_portforward_info": [],
+        "list_staticnat_info": sn_list,
+        "list_firewall_info": [],
+    }
+
+
+def run(vpc_class, inventory, vms, lbs, ips):
+    """자원 생성, 삭제 흐름에서 수행하는 조회를 form의 모든 자원에 대해 실행"""
+    vpc = vpc_class(FakeZoneManager(inventory))
+    vpc._init_query("for_validate")
+
+    start = time.perf_counter()
+    # VM 생성 : flavor, subnet, image 조회 후 VM id 확인
+    for i in range(vms):
+        vpc._get_flavor_id(f"{i % 64 + 1}x{(i % 64 + 1) * 2}.itl")
+        vpc._get_subnet_id(f"Tier{i % 32}")
+        vpc._get_image_id_size(f"image-{i % 200}")
+        vpc._get_vm_status(vpc._get_vm_id(f"bench-vm-{i:05d}"))
+    # LB 생성 : subnet 조회, 연결 서버 4개 정보 조회
+    for i in range(lbs):
+        vpc._get_subnet_id(f"Tier{i % 32}")
+        vpc._get_vm_info([f"bench-vm-{(i * 4 + j) % vms:05d}" for j in range(4)])
+        vpc._get_lb_privateip(f"bench-lb-{i:05d}")
+    # public ip 설정 : 대상 사설 ip, public ip id, static nat 조회
+    for i in range(ips):
+        private_ip = vpc._get_vm_privateip(f"bench-vm-{i % vms:05d}")
+        vpc._get_publicip_id(f"211.0.{i // 250}.{i % 250 + 1}")
+        vpc._get_staticnat_info(private_ip, "private")
+    lookup_seconds = time.perf_counter() - start
+
+    # 삭제 : LB, VM을 하나씩 삭제하면서 목록과 index에서 제거
+    key_lb_list = [
+        {"key": f"lb{i}", "params": {"name": f"bench-lb-{i:05d}"}, "state": "created"}
+        for i in range(lbs)
+    ]
+    key_vm_list = [
+        {"key": f"vm{i}", "params": {"name": f"bench-vm-{i:05d}"}, "state": "created"}
+        for i in range(vms)
+    ]
+    # 결과 메시지 출력(ku.append_msg_list)은 측정에서 제외
+    with contextlib.redirect_stdout(io.StringIO()):
+        start = time.perf_counter()
+        vpc._delete_lb_list(key_lb_list)
+        vpc._delete_vm_list(key_vm_list)
+        delete_seconds = time.perf_counter() - start
+    if vpc_class is kcldx.VPC:
+        assert not vpc.vm_list and not vpc.lb_list
+
+    return lookup_seconds, delete_seconds
+
+
+def main():
+    parser = argparse.ArgumentParser(description="VPC 자원 조회 index 효과 측정")
+    parser.add_argument(
+        "--resources", type=int, default=2000, help="form의 자원 개수 (VM:LB:IP = 2:1:1)"
+    )
+    parser.add_argument("--repeat", type=int, default=3, help="반복 횟수 (최솟값 사용)")
+    args = parser.parse_args()
+
+    vms = max(1, args.resources // 2)
+    lbs = max(1, args.resources // 4)
+    ips = max(1, args.resources - vms - lbs)
+    inventory = make_inventory(vms, lbs, ips)
+
+    # 삭제 함수의 대기 시간은 측정에서 제외
+    kcldx.time.sleep = lambda seconds: None
+
+    print(f"VM {vms}개, LB {lbs}개, public ip {ips}개")
+    print(f"{'variant':>8}{'lookup (ms)':>14}{'delete (ms)':>14}")
+    for name, vpc_class in (("linear", LinearVPC), ("index", kcldx.VPC)):
+        results = [run(vpc_class, inventory, vms, lbs, ips) for _ in range(args.repeat)]
+        lookup_seconds = min(r[0] for r in results)
+        delete_seconds = min(r[1] for r in results)
+        print(
+            f"{name:>8}{lookup_seconds * 1000:>14.1f}{delete_seconds * 1000:>14.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
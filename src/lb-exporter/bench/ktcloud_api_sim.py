@@ -0,0 +1,454 @@
+# kt cloud open api 로컬 시뮬레이터
+# 익스포터가 호출하는 API(token 발급, subnet 목록, listLoadBalancers, listLoadBalancerWebServers,
+# usageLoadBalancerService)를 실제 응답과 같은 형식으로 흉내내는 HTTP 서버
+# LB 개수 x LB별 서버 개수, 응답 지연 분포, 오류 비율, 속도 제한(429)을 설정할 수 있음
+#
+# 실행 방법 : python bench/ktcloud_api_sim.py [--port 18080] [--lbs 200] [--servers-per-lb 4]
+#             [--latency-ms 50] [--latency-dist lognormal] [--error-rate 0.01]
+#             [--rate-limit 200] [--max-inflight 16]
+# 익스포터 연결 : KTCLOUD_API_BASE_URL=http://127.0.0.1:18080 python lb-exporter.py
+# 호출 통계 : GET /_sim/stats (command별 호출/오류/429 횟수), POST /_sim/reset (통계 초기화)
+# token 만료 재현 : POST /_sim/revoke-tokens (발급한 token을 모두 무효화, 이후 요청은 401)
+
+import json
+import math
+import time
+import random
+import argparse
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlsplit, parse_qs
+
+# 시뮬레이터가 발급하는 token(발급할 때마다 일련번호를 붙임)과 project id
+SIM_TOKEN = "sim-token"
+SIM_PROJECT_ID = "sim-project"
+SIM_EXTERNAL_ID = "sim-external-network"
+
+
+class SimulatorConfig:
+    """
+    시뮬레이터 설정
+    - lbs, servers_per_lb : 가상 LB 개수와 LB별 서버 개수
+    - latency_ms, latency_dist : 평균 응답 지연(ms)과 분포 (fixed, uniform, lognormal)
+    - error_rate, error_status : 오류 응답 비율과 상태 코드
+    - rate_limit, max_inflight : 초당 요청 수/동시 요청 수 제한 (초과하면 429, 0이면 제한 없음)
+    """
+
+    def __init__(
+        self,
+        lbs=200,
+        servers_per_lb=4,
+        subnets=4,
+        latency_ms=50.0,
+        latency_dist="lognormal",
+        error_rate=0.0,
+        error_status=503,
+        rate_limit=0.0,
+        max_inflight=0,
+        seed=0,
+    ):
+        self.lbs = lbs
+        self.servers_per_lb = servers_per_lb
+        self.subnets = subnets
+        self.latency_ms = latency_ms
+        self.latency_dist = latency_dist
+        self.error_rate = error_rate
+        self.error_status = error_status
+        self.rate_limit = rate_limit
+        self.max_inflight = max_inflight
+        self.seed = seed
+
+
+class Fleet:
+    """설정한 크기의 가상 LB/서버 목록 (API 응답 형식의 dict로 미리 생성)"""
+
+    def __init__(self, config):
+        rng = random.Random(config.seed)
+        self.subnets = [
+            {
+                "networkName": f"sim-subnet-{i}",
+                "refName": f"sim-subnet-{i}",
+                "refId": f"sim-subnet-ref-{i}",
+                "networkId": f"sim-subnet-net-{i}",
+                "cidr": f"172.25.{i}.0/24",
+                "startIp": f"172.25.{i}.1",
+                "endIp": f"172.25.{i}.100",
+                "bmStartIp": f"172.25.{i}.101",
+                "bmEndIp": f"172.25.{i}.150",
+                "lbStartIp": f"172.25.{i}.151",
+                "lbEndIp": f"172.25.{i}.200",
+                "iscsiStartIp": f"172.25.{i}.201",
+                "iscsiEndIp": f"172.25.{i}.250",
+                "gatewayIp": f"172.25.{i}.254",
+            }
+            for i in range(config.subnets)
+        ]
+        self.external = dict(
+            self.subnets[0] if self.subnets else {},
+            networkName="external",
+            refName="external",
+            networkId=SIM_EXTERNAL_ID,
+        )
+
+        self.lbs = []
+        self.servers = {}  # loadbalancerid -> 서버 목록
+        for i in range(config.lbs):
+            lb_id = str(100000 + i)
+            service_type = rng.choice(["http", "https", "tcp"])
+            healthcheck_type = "tcp" if service_type == "tcp" else "http"
+            self.lbs.append(
+                {
+                    "loadbalancerid": lb_id,
+                    "name": f"sim-lb-{i:05d}",
+                    "serviceip": f"172.25.{i // 250 % 256}.{i % 250 + 1}",
+                    "serviceport": rng.choice(["80", "443", "8080"]),
+                    "servicetype": service_type,
+                    "loadbalanceroption": rng.choice(
+                        ["roundrobin", "leastconnection", "sourceiphash"]
+                    ),
+                    "healthchecktype": healthcheck_type,
+                    "healthcheckurl": "/health" if healthcheck_type == "http" else "",
+                    "establishedconn": str(rng.randint(0, 500)),
+                    "ciphergroupname": "",
+                    "networkid": f"sim-subnet-ref-{i % max(config.subnets, 1)}",
+                    "state": "UP" if rng.random() > 0.02 else "DOWN",
+                }
+            )
+            self.servers[lb_id] = [
+                {
+                    "ipaddress": f"10.{i // 250 % 256}.{i % 250}.{j + 1}",
+                    "loadbalancerid": lb_id,
+                    "virtualmachineid": f"sim-vm-{i}-{j}",
+                    "publicport": "80",
+                    "state": "UP" if rng.random() > 0.05 else "DOWN",
+                    "serviceid": str(i * 1000 + j),
+                    "cursrvrconnections": str(rng.randint(0, 200)),
+                    "throughputrate": f"{rng.uniform(0, 5000):.2f}",
+                    "avgsvrttfb": f"{rng.uniform(0, 300):.2f}",
+                    "requestsrate": f"{rng.uniform(0, 1000):.2f}",
+                }
+                for j in range(config.servers_per_lb)
+            ]
+
+
+class SimulatorHandler(BaseHTTPRequestHandler):
+    """kt cloud open api 요청을 command/경로에 따라 가상 응답으로 처리"""
+
+    protocol_version = "HTTP/1.1"
+    # 헤더와 본문을 따로 보내므로 Nagle 알고리즘을 끄지 않으면 keep-alive 요청마다 지연 발생
+    disable_nagle_algorithm = True
+
+    def do_GET(self):
+        self.dispatch("GET")
+
+    def do_POST(self):
+        self.dispatch("POST")
+
+    def dispatch(self, method):
+        sim = self.server.simulator
+        parts = urlsplit(self.path)
+        query = {k: v[-1] for k, v in parse_qs(parts.query).items()}
+        path = parts.path.rstrip("/")
+
+        # 시뮬레이터 자체 관리 경로 (지연/오류 없이 응답)
+        if path == "/_sim/stats":
+            return self.send_json(200, sim.stats())
+        if path == "/_sim/reset" and method == "POST":
+            sim.reset_stats()
+            return self.send_json(200, {"reset": True})
+        if path == "/_sim/revoke-tokens" and method == "POST":
+            return self.send_json(200, {"revoked": sim.revoke_tokens()})
+
+        length = int(self.headers.get("Content-Length") or 0)
+        if length:
+            self.rfile.read(length)
+
+        command = self.command_of(method, path, query)
+        if command is None:
+            return self.send_json(404, {"error": f"unknown api: {method} {path}"})
+
+        throttled = sim.throttle()
+        if throttled is not None:
+            sim.count(command, throttled=True)
+            return self.send_json(429, {"error": "too many requests"}, throttled)
+        try:
+            sim.delay()
+        finally:
+            sim.finish()
+        if sim.should_fail():
+            sim.count(command, error=True)
+            return self.send_json(sim.config.error_status, {"error": "simulated"})
+        sim.count(command)
+
+        if command == "token":
+            return self.send_json(
+                201,
+                {"token": {"project": {"id": SIM_PROJECT_ID}}},
+                {"X-Subject-Token": sim.issue_token()},
+            )
+        if not sim.token_valid(self.headers.get("X-Auth-Token")):
+            return self.send_json(401, {"error": "invalid token"})
+
+        fleet = sim.fleet
+        if command == "subnet":
+            data = (
+                [fleet.external]
+                if query.get("networkType") == "UNTRUST"
+                else fleet.subnets + [fleet.external]
+            )
+            return self.send_json(200, {"httpStatus": 200, "data": data})
+        if command == "listLoadBalancers":
+            lbs = fleet.lbs
+            if "loadbalancerid" in query:
+                lbs = [lb for lb in lbs if lb["loadbalancerid"] == query["loadbalancerid"]]
+            if "name" in query:
+                lbs = [lb for lb in lbs if lb["name"] == query["name"]]
+            return self.send_json(
+                200,
+                {"listloadbalancersresponse": {"count": len(lbs), "loadbalancer": lbs}},
+            )
+        if command == "listLoadBalancerWebServers":
+            servers = fleet.servers.get(query.get("loadbalancerid"), [])
+            return self.send_json(
+                200,
+                {
+                    "listloadbalancerwebserversresponse": {
+                        "count": len(servers),
+                        "loadbalancerwebserver": servers,
+                    }
+                },
+            )
+        if command == "usageLoadBalancerService":
+            name = query.get("name", "")
+            usage = [
+                {"name": name, "inbound": 1024 * day, "outbound": 2048 * day, "date": date}
+                for day, date in enumerate(
+                    [query.get("startdt", ""), query.get("enddt", "")], start=1
+                )
+            ]
+            return self.send_json(
+                200, {"usageloadbalancerserviceresponse": {"lists": usage}}
+            )
+
+    @staticmethod
+    def command_of(method, path, query):
+        # 요청 경로로 시뮬레이터가 지원하는 api 이름 판별, 지원하지 않으면 None
+        if method == "POST" and path.endswith("/identity/auth/tokens"):
+            return "token"
+        if method == "GET" and path.endswith("/nsm/v1/network"):
+            return "subnet"
+        if method == "GET" and path.endswith("/loadbalancer/client/api"):
+            command = query.get("command")
+            if command in (
+                "listLoadBalancers",
+                "listLoadBalancerWebServers",
+                "usageLoadBalancerService",
+            ):
+                return command
+        return None
+
+    def send_json(self, code, body, headers=None):
+        data = json.dumps(body).encode("utf-8")
+        self.send_response(code)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        for key, value in (headers or {}).items():
+            self.send_header(key, value)
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, format, *args):
+        # 부하 테스트 중 요청마다 로그가 출력되지 않도록 생략
+        pass
+
+
+class KTCloudAPISimulator:
+    """
+    시뮬레이터 서버 (스레드로 실행하거나 명령행에서 단독 실행)
+    Example:
+        sim = KTCloudAPISimulator(SimulatorConfig(lbs=500)).start()
+        ku.set_api_base_url(sim.url)
+        ...
+        sim.stop()
+    """
+
+    def __init__(self, config=None, host="127.0.0.1", port=0):
+        self.config = config or SimulatorConfig()
+        self.fleet = Fleet(self.config)
+        self._rng = random.Random(self.config.seed + 1)
+        self._lock = threading.Lock()
+        self._calls = {}
+        self._errors = {}
+        self._throttled = {}
+        self._inflight = 0
+        self._bucket = self.config.rate_limit
+        self._bucket_time = time.monotonic()
+        self._tokens = set()
+        self._tokens_issued = 0
+        self.httpd = ThreadingHTTPServer((host, port), SimulatorHandler)
+        self.httpd.daemon_threads = True
+        self.httpd.simulator = self
+        self._thread = None
+
+    @property
+    def url(self):
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self):
+        self._thread = threading.Thread(
+            target=self.httpd.serve_forever, name="ktcloud-api-sim", daemon=True
+        )
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+    def delay(self):
+        # 설정한 분포에 따라 응답 지연
+        mean = self.config.latency_ms / 1000
+        if mean <= 0:
+            return
+        with self._lock:
+            if self.config.latency_dist == "fixed":
+                seconds = mean
+            elif self.config.latency_dist == "uniform":
+                seconds = self._rng.uniform(0, 2 * mean)
+            else:
+                # lognormal - 평균이 mean이 되도록 mu를 맞추고 긴 꼬리를 가지는 지연
+                sigma = 0.6
+                seconds = self._rng.lognormvariate(
+                    math.log(mean) - sigma * sigma / 2, sigma
+                )
+        time.sleep(seconds)
+
+    def throttle(self):
+        # 초당 요청 수/동시 요청 수 제한을 넘으면 429 응답에 붙일 헤더를, 아니면 None을 return
+        # 초당 요청 수 제한에는 Retry-After를 붙이고, 동시 요청 수 제한에는 붙이지 않음
+        with self._lock:
+            if self.config.rate_limit > 0:
+                now = time.monotonic()
+                self._bucket = min(
+                    self.config.rate_limit,
+                    self._bucket + (now - self._bucket_time) * self.config.rate_limit,
+                )
+                self._bucket_time = now
+                if self._bucket < 1:
+                    return {"Retry-After": "1"}
+            if 0 < self.config.max_inflight <= self._inflight:
+                return {}
+            if self.config.rate_limit > 0:
+                self._bucket -= 1
+            self._inflight += 1
+            return None
+
+    def finish(self):
+        with self._lock:
+            self._inflight -= 1
+
+    def should_fail(self):
+        if self.config.error_rate <= 0:
+            return False
+        with self._lock:
+            return self._rng.random() < self.config.error_rate
+
+    def count(self, command, error=False, throttled=False):
+        with self._lock:
+            if throttled:
+                counter = self._throttled
+            else:
+                counter = self._errors if error else self._calls
+            counter[command] = counter.get(command, 0) + 1
+
+    def issue_token(self):
+        with self._lock:
+            self._tokens_issued += 1
+            token = f"{SIM_TOKEN}-{self._tokens_issued}"
+            self._tokens.add(token)
+            return token
+
+    def token_valid(self, token):
+        with self._lock:
+            return token in self._tokens
+
+    def revoke_tokens(self):
+        # 발급한 token을 모두 무효화하고 무효화한 개수를 return
+        with self._lock:
+            count = len(self._tokens)
+            self._tokens.clear()
+            return count
+
+    def stats(self):
+        with self._lock:
+            return {
+                "calls": dict(self._calls),
+                "errors": dict(self._errors),
+                "throttled": dict(self._throttled),
+                "total_calls": sum(self._calls.values())
+                + sum(self._errors.values())
+                + sum(self._throttled.values()),
+                "tokens_issued": self._tokens_issued,
+                "lbs": self.config.lbs,
+                "servers": self.config.lbs * self.config.servers_per_lb,
+            }
+
+    def reset_stats(self):
+        with self._lock:
+            self._calls.clear()
+            self._errors.clear()
+            self._throttled.clear()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="kt cloud open api 로컬 시뮬레이터")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=18080)
+    parser.add_argument("--lbs", type=int, default=200, help="가상 LB 개수")
+    parser.add_argument("--servers-per-lb", type=int, default=4, help="LB별 서버 개수")
+    parser.add_argument("--latency-ms", type=float, default=50.0, help="평균 응답 지연 (ms)")
+    parser.add_argument(
+        "--latency-dist",
+        choices=["fixed", "uniform", "lognormal"],
+        default="lognormal",
+        help="응답 지연 분포",
+    )
+    parser.add_argument("--error-rate", type=float, default=0.0, help="오류 응답 비율 (0~1)")
+    parser.add_argument("--error-status", type=int, default=503, help="오류 응답 상태 코드")
+    parser.add_argument(
+        "--rate-limit", type=float, default=0.0, help="초당 요청 수 제한 (초과하면 429)"
+    )
+    parser.add_argument(
+        "--max-inflight", type=int, default=0, help="동시 요청 수 제한 (초과하면 429)"
+    )
+    parser.add_argument("--seed", type=int, default=0, help="가상 데이터 생성 seed")
+    args = parser.parse_args()
+
+    config = SimulatorConfig(
+        lbs=args.lbs,
+        servers_per_lb=args.servers_per_lb,
+        latency_ms=args.latency_ms,
+        latency_dist=args.latency_dist,
+        error_rate=args.error_rate,
+        error_status=args.error_status,
+        rate_limit=args.rate_limit,
+        max_inflight=args.max_inflight,
+        seed=args.seed,
+    )
+    sim = KTCloudAPISimulator(config, args.host, args.port)
+    print(
+        f"kt cloud api 시뮬레이터 시작: {sim.url} "
+        f"(LB {config.lbs}개 x 서버 {config.servers_per_lb}개)",
+        flush=True,
+    )
+    try:
+        sim.httpd.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        sim.httpd.server_close()
+
+
+if __name__ == "__main__":
+    main()
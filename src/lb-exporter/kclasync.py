@@ -0,0 +1,481 @@
+###############################################################################################
+#
+# Copyright (c) 2024 kt cloud, All rights reserved.
+#
+# kclasync.py v0.5.2
+# asyncio 기반으로 LB 조회 open api를 호출하기 위한 class 제공 (aiohttp 필요)
+#
+# AsyncZoneManager : 존에 대한 인증 토큰과 비동기 connection pool 관리
+# AsyncNetworkResource : LB 목록, LB 서버, LB 사용량 조회
+#
+# 요청 url, 응답 parsing, log 형식은 kcldx와 같으며 kclutil의 함수를 그대로 사용
+# 모든 메서드는 AsyncZoneManager.connect()를 호출한 event loop 안에서 사용해야 함
+#
+###############################################################################################
+
+import kclutil as ku
+import kcldx
+import asyncio
+import datetime
+import json
+import time
+import functools
+import aiohttp
+
+HTTP_RETRY_STATUS = (502, 503, 504)  # GET 요청을 재시도할 응답 상태 코드 (kclutil.HttpSession과 같음)
+
+
+###################################################
+#
+# class AsyncResponse
+# 본문을 모두 읽은 응답, requests.Response처럼 status_code, text, json()을 제공
+# stream 모드로 읽은 응답은 본문 대신 배열 항목(items)과 배열 밖의 값(stream)만 보관
+#
+###################################################
+
+
+class AsyncResponse:
+    __slots__ = ("status_code", "headers", "content", "stream", "items")
+
+    def __init__(self, status_code, headers, content, stream=None, items=None):
+        self.status_code = status_code
+        self.headers = headers
+        self.content = content
+        self.stream = stream
+        self.items = items
+
+    @property
+    def text(self):
+        return self.content.decode("utf-8", errors="replace")
+
+    # stream 모드이면 배열을 제외한 응답 구조 (ku.JsonArrayStream.document())
+    def json(self):
+        if self.stream is not None:
+            return self.stream.document()
+        return json.loads(self.content)
+
+
+###################################################
+#
+# class AsyncZoneManager
+# kcldx.ZoneManager의 비동기 버전, LB 조회에 필요한 token 관리와 요청 기능만 제공
+#
+###################################################
+
+
+class AsyncZoneManager:
+    # pool_size : 동시에 유지하는 connection 최대 개수 (동시에 진행할 수 있는 요청 수)
+    # keep_alive, connect_timeout, read_timeout, max_retries, retry_backoff : kcldx.ZoneManager와 같음
+    def __init__(
+        self,
+        id,
+        passwd,
+        zone_name,
+        pool_size=ku.HTTP_POOL_SIZE,
+        keep_alive=ku.HTTP_KEEP_ALIVE,
+        connect_timeout=ku.HTTP_CONNECT_TIMEOUT,
+        read_timeout=ku.HTTP_READ_TIMEOUT,
+        max_retries=ku.HTTP_MAX_RETRIES,
+        retry_backoff=ku.HTTP_RETRY_BACKOFF,
+    ):
+        self._id = id
+        self._passwd = passwd
+
+        ku.validate_zone_name(zone_name)
+        self._zone_name = zone_name
+        self._zone, _ = self.get_zone()
+
+        self._pool_size = pool_size
+        self._keep_alive = keep_alive
+        self._connect_timeout = connect_timeout
+        self._read_timeout = read_timeout
+        self._max_retries = max_retries
+        self._retry_backoff = retry_backoff
+        self._session = None
+
+        self._token = None
+        self._token_expire = datetime.datetime.now() - datetime.timedelta(hours=1)
+        self._project_id = ""
+        # token 재발급은 한 번에 하나만 수행 (single-flight)
+        self._token_lock = None
+        self._refresh_task = None
+        self._token_timer = None
+        self._logger = self._set_logger()
+
+    # log 저장 형식, 존 정보, token 만료 확인은 kcldx.ZoneManager와 같음
+    info_log = kcldx.ZoneManager.info_log
+    error_log = kcldx.ZoneManager.error_log
+    _set_logger = kcldx.ZoneManager._set_logger
+    get_zone = kcldx.ZoneManager.get_zone
+    _check_token_expire = kcldx.ZoneManager._check_token_expire
+    is_token_valid = kcldx.ZoneManager.is_token_valid
+    project_id = kcldx.ZoneManager.project_id
+
+    # 현재 event loop에 connection pool을 만들고 token 발급
+    async def connect(self):
+        connector = aiohttp.TCPConnector(
+            limit=self._pool_size, force_close=not self._keep_alive
+        )
+        self._session = aiohttp.ClientSession(
+            connector=connector,
+            timeout=aiohttp.ClientTimeout(
+                total=None,
+                sock_connect=self._connect_timeout,
+                sock_read=self._read_timeout,
+            ),
+        )
+        self._token_lock = asyncio.Lock()
+        await self._create_token()
+        return self
+
+    # token 재발급 timer를 멈추고 connection pool에 유지 중인 connection을 모두 닫음
+    async def close(self):
+        if self._token_timer is not None:
+            self._token_timer.cancel()
+        if self._refresh_task is not None:
+            self._refresh_task.cancel()
+        if self._session is not None:
+            await self._session.close()
+
+    def network_resource(self):
+        return AsyncNetworkResource(self)
+
+    # open api 호출 후 본문까지 읽은 AsyncResponse를 return
+    # 속도 제한, 429 응답 재시도, deadline 적용은 kclutil.send_request와 같음
+    async def send(self, func_name, cmd, url, headers=None, timeout=None, **kwargs):
+        limiter = ku.rate_limiter
+        retries = (
+            ku.API_THROTTLE_RETRIES if limiter is None else limiter.throttle_retries
+        )
+        attempt = 0
+        while True:
+            if limiter is None:
+                response = await self._send_observed(
+                    func_name, cmd, url, headers, timeout, **kwargs
+                )
+            else:
+                await self._acquire(limiter, func_name)
+                response = None
+                try:
+                    response = await self._send_observed(
+                        func_name, cmd, url, headers, timeout, **kwargs
+                    )
+                finally:
+                    limiter.release(
+                        func_name,
+                        None if response is None else response.status_code,
+                        None
+                        if response is None
+                        else ku.get_retry_after(response.headers),
+                    )
+            if response.status_code != 429 or attempt >= retries:
+                return response
+            if limiter is None:
+                wait = min(
+                    ku.get_retry_after(response.headers) or ku.backoff_delay(attempt),
+                    ku.API_BACKOFF_MAX,
+                )
+                remaining = ku.remaining_time()
+                if remaining is not None and wait >= remaining:
+                    return response
+                await asyncio.sleep(wait)
+            attempt += 1
+
+    # RateLimiter에서 요청 자리를 얻을 때까지 대기 (kclutil.RateLimiter.acquire의 asyncio 버전)
+    # 동시 요청 수 제한에 걸리면 다른 요청의 release()가 future를 완료할 때까지 대기
+    @staticmethod
+    async def _acquire(limiter, func_name):
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        while True:
+            waiter = loop.create_future()
+            wait = limiter.reserve(func_name, waiter)
+            if wait == 0:
+                break
+            if wait is None:
+                try:
+                    await asyncio.wait_for(waiter, ku.remaining_time())
+                except asyncio.TimeoutError:
+                    raise ku.DeadlineExceeded(
+                        f"{func_name}(): deadline exceeded while rate limited"
+                    ) from None
+                continue
+            limiter.check_wait(func_name, wait)
+            await asyncio.sleep(wait)
+        if loop.time() > start:
+            limiter.record_wait(func_name, loop.time() - start)
+
+    # GET은 connection 오류, 502/503/504 응답 시 max_retries만큼 재시도 (kclutil.HttpSession과 같음)
+    # RateLimiter가 등록되어 있으면 502/503/504 응답은 재시도하지 않고 돌려주어 속도 제한이 처리
+    # timeout(초)을 지정하면 connection 연결과 응답 대기 각각에 적용
+    # kclutil.deadline() 블록 안이면 재시도를 포함해 deadline까지 남은 시간 안에 끝나지 않은 요청은 중단
+    # stream(ku.JsonArrayStream을 만드는 함수)을 지정하면 성공 응답의 본문을 socket에서 읽으면서 parse
+    async def _send_observed(
+        self, func_name, cmd, url, headers=None, timeout=None, stream=None, **kwargs
+    ):
+        retries = self._max_retries if cmd.upper() == "GET" else 0
+        ku.check_deadline(func_name)
+
+        observed = bool(ku.request_observers)
+        if observed:
+            ku._notify_request_observers("request_started", func_name, cmd)
+        start = time.perf_counter()
+        attempt = 0
+        while True:
+            try:
+                remaining = ku.check_deadline(func_name)
+                if timeout is not None or remaining is not None:
+                    kwargs["timeout"] = aiohttp.ClientTimeout(
+                        total=remaining,
+                        sock_connect=self._connect_timeout if timeout is None else timeout,
+                        sock_read=self._read_timeout if timeout is None else timeout,
+                    )
+                async with self._session.request(
+                    cmd.upper(), url, headers=headers, **kwargs
+                ) as res:
+                    if stream is not None and 200 <= res.status < 210:
+                        response, size = await self._read_stream(res, stream())
+                    else:
+                        response = AsyncResponse(
+                            res.status, res.headers, await res.read()
+                        )
+                        size = len(response.content)
+                if (
+                    response.status_code not in HTTP_RETRY_STATUS
+                    or attempt >= retries
+                    or ku.rate_limiter is not None
+                ):
+                    break
+            except (aiohttp.ClientError, asyncio.TimeoutError, ku.DeadlineExceeded) as e:
+                if attempt < retries and not isinstance(e, ku.DeadlineExceeded):
+                    await asyncio.sleep(ku.backoff_delay(attempt, self._retry_backoff))
+                    attempt += 1
+                    continue
+                if observed:
+                    ku._notify_request_observers(
+                        "request_finished",
+                        func_name,
+                        cmd,
+                        None,
+                        time.perf_counter() - start,
+                        0,
+                        error=e,
+                    )
+                raise
+            await asyncio.sleep(ku.backoff_delay(attempt, self._retry_backoff))
+            attempt += 1
+
+        if observed:
+            ku._notify_request_observers(
+                "request_finished",
+                func_name,
+                cmd,
+                response.status_code,
+                time.perf_counter() - start,
+                size,
+            )
+        return response
+
+    # 응답 본문을 chunk 단위로 읽으면서 parser(ku.JsonArrayStream)로 배열 항목을 꺼냄
+    # 본문은 보관하지 않지만 꺼낸 항목은 모두 목록으로 모아 AsyncResponse.items에 담음
+    # (AsyncResponse, 읽은 본문 크기) return
+    @staticmethod
+    async def _read_stream(res, parser):
+        items = []
+        size = 0
+        async for chunk in res.content.iter_chunked(ku.STREAM_CHUNK_SIZE):
+            size += len(chunk)
+            items.extend(parser.feed(chunk))
+        items.extend(parser.close())
+        return AsyncResponse(res.status, res.headers, b"", parser, items), size
+
+    # token으로 open api 호출, 401 응답을 받으면 token을 즉시 재발급하고 한 번만 다시 호출
+    async def send_auth(self, func_name, cmd, url, timeout=None, **kwargs):
+        token = await self._get_token()
+        response = await self.send(
+            func_name, cmd, url, {"X-Auth-Token": token}, timeout, **kwargs
+        )
+        if response.status_code != 401:
+            return response
+
+        token = await self.refresh_token(token)
+        return await self.send(
+            func_name, cmd, url, {"X-Auth-Token": token}, timeout, **kwargs
+        )
+
+    # token을 새로 발급
+    async def _create_token(self):
+        url = ku.get_request_url("make_token", zone=self._zone)
+        body = ku.get_request_body("make_token", user_id=self._id, user_pw=self._passwd)
+        response = await self.send("_create_token", "post", url, json=body)
+
+        if response.status_code == 201:
+            res = response.json()
+            self._project_id = res["token"]["project"]["id"]
+
+            self._token_expire = datetime.datetime.now()
+            self._token = response.headers.get("X-Subject-Token")
+            self._schedule_token_refresh()
+        else:
+            raise Exception("Authentication error")
+
+    # 만료 전에 background에서 token을 재발급하도록 timer 예약
+    def _schedule_token_refresh(self):
+        if self._token_timer is not None:
+            self._token_timer.cancel()
+        self._token_timer = asyncio.get_running_loop().call_later(
+            kcldx.TOKEN_REFRESH_AHEAD_HOURS * 3600, self._refresh_token_async
+        )
+
+    # token 재발급을 background task로 시작, 이미 재발급 중이면 아무것도 하지 않음
+    def _refresh_token_async(self):
+        if self._token_lock.locked():
+            return
+        if self._refresh_task is None or self._refresh_task.done():
+            self._refresh_task = asyncio.get_running_loop().create_task(
+                self._refresh_token_background()
+            )
+
+    async def _refresh_token_background(self):
+        try:
+            await self.refresh_token()
+        except Exception as e:
+            # 실패해도 기존 token은 만료 시점까지 사용하고, 만료되면 요청 시점에 다시 발급
+            self.error_log(f"_refresh_token_async() : fail, {e}")
+
+    # token 즉시 재발급 (single-flight)
+    # stale_token을 지정하면 기다리는 동안 다른 요청이 이미 재발급한 경우 새 token을 그대로 return
+    async def refresh_token(self, stale_token=None):
+        async with self._token_lock:
+            if (
+                stale_token is not None
+                and self._token != stale_token
+                and not self._check_token_expire()
+            ):
+                return self._token
+            await self._create_token()
+            return self._token
+
+    # token값을 return, 재발급 시점과 만료 처리는 kcldx.ZoneManager._get_token()과 같음
+    async def _get_token(self):
+        token = self._token
+        age = datetime.datetime.now() - self._token_expire
+        if age < datetime.timedelta(hours=kcldx.TOKEN_REFRESH_AHEAD_HOURS):
+            return token
+        if age < datetime.timedelta(hours=kcldx.TOKEN_EXPIRE_HOURS):
+            self._refresh_token_async()
+            return token
+        return await self.refresh_token(token)
+
+
+###################################################
+#
+# class AsyncNetworkResource
+# kcldx.NetworkResource의 LB 조회 api를 비동기로 제공
+#
+###################################################
+
+
+class AsyncNetworkResource:
+    def __init__(self, zone_mgr):
+        self._zone_mgr = zone_mgr
+        zone, zone_name = zone_mgr.get_zone()
+        self._zone = zone
+        self._zone_name = zone_name
+
+    # LB관련 open api 호출 및 log 저장, (response, 성공 여부)를 return
+    # stream을 지정하면 응답 본문을 읽으면서 parse한 항목이 response.items에 담김
+    async def _request_lb_api(
+        self, func_name, url, res_key, timeout=None, stream=None, **kwargs
+    ):
+        response = await self._zone_mgr.send_auth(
+            func_name, "get", url, timeout, stream=stream
+        )
+        success = ku.check_lb_response(
+            func_name, response, self._zone_mgr, res_key, **kwargs
+        )
+        return response, success
+
+    # LB 목록 조회, 조건을 지정하지 않으면 전체 LB 목록
+    # records=True이면 dict 대신 ku.LBRecord 목록 return
+    # stream=True이면 응답 본문 전체를 보관하지 않고 socket에서 읽으면서 LB 정보로 변환
+    async def list_lb_info(
+        self, lb_name=None, service_ip=None, lb_id=None, records=False, stream=False
+    ):
+        url = ku.get_lb_request_url(
+            "list_lb_info",
+            zone=self._zone,
+            name=lb_name,
+            serviceip=service_ip,
+            loadbalancerid=lb_id,
+        )
+        response, success = await self._request_lb_api(
+            "list_lb_info",
+            url,
+            "listloadbalancersresponse",
+            stream=functools.partial(
+                ku.JsonArrayStream,
+                ("listloadbalancersresponse", "loadbalancer"),
+                ku.lb_info_record if records else ku.parse_lb_info_item,
+            )
+            if stream
+            else None,
+        )
+
+        if success:
+            if stream:
+                return response.items
+            if records:
+                return ku.parse_list_lb_info_records(response.json())
+            return ku.parse_list_lb_info(response.json())
+
+    # LB가 부하분산하는 서버 목록 조회
+    # timeout(초)을 지정하면 응답이 늦는 조회를 중단함
+    # records=True이면 dict 대신 ku.LBServerRecord 목록 return
+    # stream=True이면 응답 본문 전체를 보관하지 않고 socket에서 읽으면서 서버 정보로 변환
+    async def list_lb_server(self, lb_id, timeout=None, records=False, stream=False):
+        url = ku.get_lb_request_url(
+            "list_lb_server", zone=self._zone, loadbalancerid=lb_id
+        )
+        response, success = await self._request_lb_api(
+            "list_lb_server",
+            url,
+            "listloadbalancerwebserversresponse",
+            timeout=timeout,
+            stream=functools.partial(
+                ku.JsonArrayStream,
+                ("listloadbalancerwebserversresponse", "loadbalancerwebserver"),
+                ku.lb_server_record if records else ku.parse_lb_server_item,
+            )
+            if stream
+            else None,
+            lb_id=lb_id,
+        )
+
+        if success:
+            if stream:
+                return response.items
+            if records:
+                return ku.parse_list_lb_server_records(response.json())
+            return ku.parse_list_lb_server(response.json())
+
+    # LB usage 조회
+    # timeout(초)을 지정하면 응답이 늦는 조회를 중단함
+    async def get_lb_usage(self, lb_name, start_date, end_date, timeout=None):
+        url = ku.get_lb_request_url(
+            "get_lb_usage",
+            zone=self._zone,
+            name=lb_name,
+            startdt=start_date,
+            enddt=end_date,
+        )
+        response, success = await self._request_lb_api(
+            "get_lb_usage",
+            url,
+            "usageloadbalancerserviceresponse",
+            timeout=timeout,
+            lb_name=lb_name,
+        )
+
+        if success:
+            return ku.parse_get_lb_usage(response.json())
@@ -20,8 +20,8 @@ import kclinstance as ki
 import datetime
 import requests
 import time
-import logging
 import os
+import threading
 from kclutil import FileSizeError
 import inspect
 import csv
@@ -38,6 +38,10 @@ MULTIPART_PART_SIZE = (
     1024 * 1024 * 200
 )  # 200MB  # object sotrage의 multipart upload 시 part크기
 MAX_VM_CREATE_COUNT = 4  # create_vms에서 동시에 생성할 수 있는 vm의 최대 개수
+OBJECT_STORAGE_READ_TIMEOUT = 300  # object storage 응답 대기 타임아웃 (초), 대용량 file 처리를 고려
+TOKEN_EXPIRE_HOURS = 0.95  # 발급 후 이 시간이 지난 token은 만료된 것으로 보고 새로 발급
+TOKEN_REFRESH_AHEAD_HOURS = 0.85  # 발급 후 이 시간이 지나면 만료 전에 background에서 미리 재발급
+SUBNET_CACHE_TTL = 300  # NetworkResource가 조회한 subnet 목록(index)을 재사용하는 시간 (초), 0이면 매번 조회
 
 ###################################################
 #
@@ -48,7 +52,22 @@ MAX_VM_CREATE_COUNT = 4  # create_vms에서 동시에 생성할 수 있는 vm의
 
 
 class ZoneManager:
-    def __init__(self, id, passwd, zone_name):
+    # pool_size, keep_alive, connect_timeout, read_timeout, max_retries : HTTP connection pool 설정
+    # background_token_refresh : token 만료 전 timer thread에서 미리 재발급할지 여부
+    # lazy_init : True이면 external_id와 subnet 목록을 생성 시점이 아닌 처음 필요할 때 조회
+    def __init__(
+        self,
+        id,
+        passwd,
+        zone_name,
+        pool_size=ku.HTTP_POOL_SIZE,
+        keep_alive=ku.HTTP_KEEP_ALIVE,
+        connect_timeout=ku.HTTP_CONNECT_TIMEOUT,
+        read_timeout=ku.HTTP_READ_TIMEOUT,
+        max_retries=ku.HTTP_MAX_RETRIES,
+        background_token_refresh=True,
+        lazy_init=False,
+    ):
         self._id = id
         self._passwd = passwd
 
@@ -56,42 +75,59 @@ class ZoneManager:
         self._zone_name = zone_name
         self._zone, _ = self.get_zone()
 
+        # ZoneManager에서 호출하는 모든 open API가 공유하는 connection pool
+        self._session = ku.HttpSession(
+            pool_size=pool_size,
+            keep_alive=keep_alive,
+            connect_timeout=connect_timeout,
+            read_timeout=read_timeout,
+            max_retries=max_retries,
+        )
+
         self._token = None
         self._token_expire = datetime.datetime.now() - datetime.timedelta(hours=1)
         self._project_id = ""
+        # token 재발급은 한 번에 하나만 수행 (single-flight), 조회는 lock 없이 수행
+        self._token_lock = threading.Lock()
+        self._background_token_refresh = background_token_refresh
+        self._token_timer = None
+        self._logger = None
         self._create_token()
         self._logger = self._set_logger()
+        self._lazy_init = lazy_init
+        self._external_id = None
+        if not lazy_init:
+            self._load_external_id()
+
+    # external_id를 조회하여 저장, 조회하지 못하면 예외 발생
+    def _load_external_id(self):
         self._external_id = self.get_external_id()
 
         if self._external_id == None:
             raise Exception("Can't get external_id of VPC!")
+        return self._external_id
 
     # INFO 형태로 log 저장
-    def info_log(self, message):
-        self._logger.info(message)
+    # args를 지정하면 message % args는 log file에 기록하는 thread에서 만들어짐
+    # fields는 log record의 속성으로 남음 (예: command, result)
+    def info_log(self, message, *args, **fields):
+        self._logger.info(message, *args, extra=fields or None)
 
     # ERROR 형태로 log 저장
-    def error_log(self, message):
-        self._logger.error(message)
+    def error_log(self, message, *args, **fields):
+        self._logger.error(message, *args, extra=fields or None)
 
     # log 저장 형식 지정
+    # root 로거의 handler로 출력하고, 설정에 따라 kcl_logs_{id}_{zone}.log에도 기록
+    # API 호출 thread는 queue에 넣기만 하고 format과 출력은 별도 thread에서 수행 (ku.get_sdk_logger)
     def _set_logger(self):
-        # 1. 공통 로깅 설정
-        logging.basicConfig(
-            level=logging.INFO,  # 로그 레벨 설정
-            format="%(asctime)s - %(levelname)s : %(message)s",  # 포맷 설정
-            filename=f"kcl_logs_{self._id}_{self._zone_name}.log",  # 파일에 로그 저장
-            filemode="a",  # 추가 모드
-        )
-
-        # 2. 모듈 수준의 로거 생성
-        return logging.getLogger("ktcloud")  # 공통 로거 이름 지정
+        return ku.get_sdk_logger(f"kcl_logs_{self._id}_{self._zone_name}.log")
 
     # token의 expire 여부를 확인, expire되면 True, 아니면 False
     def _check_token_expire(self):
         diff = datetime.datetime.now() - self._token_expire
 
-        if diff >= datetime.timedelta(hours=0.95):
+        if diff >= datetime.timedelta(hours=TOKEN_EXPIRE_HOURS):
             return True
         return False
 
@@ -99,22 +135,79 @@ class ZoneManager:
     def _create_token(self):
         url = ku.get_request_url("make_token", zone=self._zone)
         body = ku.get_request_body("make_token", user_id=self._id, user_pw=self._passwd)
-        response = requests.post(url, json=body)
+        response = ku.send_request("_create_token", self._session, "post", url, json=body)
 
         if response.status_code == 201:
-            self._token = response.headers.get("X-Subject-Token")
-            self._token_expire = datetime.datetime.now()
-
             res = response.json()
             self._project_id = res["token"]["project"]["id"]
+
+            self._token_expire = datetime.datetime.now()
+            self._token = response.headers.get("X-Subject-Token")
+            self._schedule_token_refresh()
         else:
             raise Exception("Authentication error")
 
-    # token값을 return, token이 expire되면 새로 발급
-    def _get_token(self):
-        if self._check_token_expire():
+    # 만료 전에 background에서 token을 재발급하도록 timer 예약
+    def _schedule_token_refresh(self):
+        if not self._background_token_refresh:
+            return
+        if self._token_timer is not None:
+            self._token_timer.cancel()
+        self._token_timer = threading.Timer(
+            TOKEN_REFRESH_AHEAD_HOURS * 3600, self._refresh_token_async
+        )
+        self._token_timer.daemon = True
+        self._token_timer.start()
+
+    # token 재발급을 background thread에서 시작, 이미 재발급 중이면 아무것도 하지 않음
+    def _refresh_token_async(self):
+        if not self._token_lock.acquire(blocking=False):
+            return
+        threading.Thread(
+            target=self._refresh_token_locked, name="kcl-token-refresh", daemon=True
+        ).start()
+
+    # _refresh_token_async()가 획득한 lock을 가진 상태에서 token 재발급, 끝나면 lock 해제
+    def _refresh_token_locked(self):
+        try:
+            self._create_token()
+        except Exception as e:
+            # 실패해도 기존 token은 만료 시점까지 사용하고, 만료되면 요청 시점에 다시 발급
+            if self._logger is not None:
+                self.error_log(f"_refresh_token_async() : fail, {e}")
+        finally:
+            self._token_lock.release()
+
+    # token 즉시 재발급 (single-flight)
+    # stale_token을 지정하면 그 사이 다른 thread가 이미 재발급한 경우 새 token을 그대로 return
+    # 401 응답을 받은 경우 요청에 사용한 token을 stale_token으로 넘겨 호출
+    def refresh_token(self, stale_token=None):
+        with self._token_lock:
+            if (
+                stale_token is not None
+                and self._token != stale_token
+                and not self._check_token_expire()
+            ):
+                return self._token
             self._create_token()
-        return self._token
+            return self._token
+
+    # 발급된 token이 있고 expire되지 않았으면 True, API 호출 없이 확인만 수행
+    def is_token_valid(self):
+        return self._token is not None and not self._check_token_expire()
+
+    # token값을 return
+    # 재발급 시점이 지났으면 background에서 재발급을 시작하고 기존 token을 그대로 return,
+    # 만료되었으면 재발급이 끝날 때까지 대기 (동시 호출은 한 번의 재발급을 함께 기다림)
+    def _get_token(self):
+        token = self._token
+        age = datetime.datetime.now() - self._token_expire
+        if age < datetime.timedelta(hours=TOKEN_REFRESH_AHEAD_HOURS):
+            return token
+        if age < datetime.timedelta(hours=TOKEN_EXPIRE_HOURS):
+            self._refresh_token_async()
+            return token
+        return self.refresh_token(token)
 
     # X-Auth-Token 헤더에 token정보를 포함하여 return
     def get_auth_header(self):
@@ -141,10 +234,26 @@ class ZoneManager:
     def project_id(self):
         return self._project_id
 
+    @property
+    def session(self):
+        return self._session
+
+    # token 재발급 timer를 멈추고 connection pool에 유지 중인 connection을 모두 닫음
+    def close(self):
+        if self._token_timer is not None:
+            self._token_timer.cancel()
+        self._session.close()
+
     @property
     def external_id(self):
+        if self._external_id is None:
+            return self._load_external_id()
         return self._external_id
 
+    @property
+    def lazy_init(self):
+        return self._lazy_init
+
     def compute_resource(self):
         return ComputeResource(self)
 
@@ -270,15 +379,21 @@ class ComputeResource:
                     return item["vm_id"]
 
     # VM들의 정보를 list형태로 return
-    def list_vm_info(self):
+    # stream=True이면 응답 본문을 읽으면서 VM 정보를 하나씩 return하는 generator를 return
+    def list_vm_info(self, stream=False):
         url = ku.get_request_url("list_vm_info", zone=self._zone)
         headers = self._zone_mgr.get_auth_header()
 
         func_name = inspect.currentframe().f_code.co_name
-        response = ku.request_api(func_name, "get", url, headers, self._zone_mgr)
+        response = ku.request_api(
+            func_name, "get", url, headers, self._zone_mgr, stream=stream
+        )
 
         if response.status_code == 200:
+            if stream:
+                return ku.iter_list_vm_info(response)
             return ku.parse_list_vm_info(response.json())
+        response.close()
 
     # cnode에 속한 vm 목록 매핑 조회
     def get_cnode_vm_map(self):
@@ -1121,6 +1236,45 @@ class StorageResource:
         return False
 
 
+# NetworkResource의 subnet 목록과 subnet_id, subnet_network_id별 index
+# 같은 id가 여러 개이면 목록 순서상 처음 항목을 사용 (목록을 순회하던 기존 동작과 동일)
+class _SubnetIndex:
+    __slots__ = ("subnet_list", "created_at", "_by_key")
+
+    def __init__(self, subnet_list):
+        self.subnet_list = subnet_list
+        self.created_at = time.monotonic()
+        self._by_key = {"subnet_id": {}, "subnet_network_id": {}}
+        for item in subnet_list or []:
+            for key, by_id in self._by_key.items():
+                by_id.setdefault(item[key], item)
+
+    def expired(self, ttl):
+        return time.monotonic() - self.created_at >= ttl
+
+    def get(self, key, id_value):
+        by_id = self._by_key.get(key)
+        if by_id is None:
+            return next(
+                (item for item in self.subnet_list or [] if item[key] == id_value), None
+            )
+        return by_id.get(id_value)
+
+
+# _get_subnet_id_map_dict()의 결과, 없는 network_id는 subnet 목록을 다시 조회하여 찾음
+class _SubnetIdMap(dict):
+    def __init__(self, network):
+        super().__init__()
+        self._network = network
+
+    def __missing__(self, network_id):
+        subnet_id = self._network._get_subnet_id(network_id)
+        if subnet_id is None:
+            raise KeyError(network_id)
+        self[network_id] = subnet_id
+        return subnet_id
+
+
 ###################################################
 #
 # class NetworkResource
@@ -1136,8 +1290,53 @@ class NetworkResource:
         self._zone = zone
         self._zone_name = zone_name
         self._project_id = zone_mgr.project_id
-        self._external_id = zone_mgr.external_id
-        self._subnet_list = self.list_subnet_info()
+        # lazy_init이면 external_id와 subnet 목록은 처음 사용할 때 조회
+        self.subnet_cache_ttl = SUBNET_CACHE_TTL
+        self._subnet_lock = threading.Lock()
+        self._subnet_index_cache = None
+        if not zone_mgr.lazy_init:
+            zone_mgr.external_id
+            self._subnet_index()
+
+    @property
+    def _external_id(self):
+        return self._zone_mgr.external_id
+
+    @property
+    def _subnet_list(self):
+        return self._subnet_index().subnet_list
+
+    @_subnet_list.setter
+    def _subnet_list(self, subnet_list):
+        with self._subnet_lock:
+            self._subnet_index_cache = _SubnetIndex(subnet_list)
+
+    # subnet 목록 index return, 조회한 지 subnet_cache_ttl이 지났거나 refresh이면 다시 조회
+    # stale : refresh 요청 시 보고 있던 index, 그 사이 다른 thread가 이미 다시 조회했으면 재사용
+    def _subnet_index(self, refresh=False, stale=None):
+        index = self._subnet_index_cache
+        if (
+            not refresh
+            and index is not None
+            and not index.expired(self.subnet_cache_ttl)
+        ):
+            return index
+
+        with self._subnet_lock:
+            current = self._subnet_index_cache
+            if current is not None and current is not stale:
+                if refresh or not current.expired(self.subnet_cache_ttl):
+                    return current
+            index = _SubnetIndex(self.list_subnet_info())
+            # 조회 실패(None)는 저장하지 않고 다음 호출에서 다시 조회
+            if index.subnet_list is not None:
+                self._subnet_index_cache = index
+            return index
+
+    # subnet 생성, 삭제 후 다음 조회에서 subnet 목록을 새로 가져오도록 index 폐기
+    def _invalidate_subnet_index(self):
+        with self._subnet_lock:
+            self._subnet_index_cache = None
 
     ################################################
     # IP Address functions
@@ -1400,7 +1599,9 @@ class NetworkResource:
     ################################################
 
     # firewall 목록 정보 조회
-    def list_firewall_info(self):
+    # stream=True이면 응답 본문을 읽으면서 firewall 정보를 하나씩 return하는 generator를 return
+    # (본문의 httpStatus가 200이 아니면 모두 읽은 뒤 예외 발생)
+    def list_firewall_info(self, stream=False):
         url = ku.get_request_url("list_firewall_info", zone=self._zone)
         headers = self._zone_mgr.get_auth_header()
 
@@ -1412,8 +1613,11 @@ class NetworkResource:
             headers,
             self._zone_mgr,
             params={"page": 1, "size": 2000},
+            stream=stream,
         )
 
+        if stream:
+            return ku.iter_list_firewall_info(response, self)
         res = response.json()
         if res["httpStatus"] == 200:
             return ku.parse_list_firewall_info(res, self)
@@ -1711,6 +1915,7 @@ class NetworkResource:
                     break
                 if count > NET_JOB_MAX_COUNT:
                     break
+            self._invalidate_subnet_index()
 
         if network_id:
             subnet_list = self._get_subnet_id_of_network_id(network_id)
@@ -1786,10 +1991,14 @@ class NetworkResource:
     #                 if ku.is_in_cidr(privateip, item["cidr"]):
     #                     return item["subnet_id"]
 
+    # key(subnet_id, subnet_network_id)로 subnet 정보 return
+    # index에 없으면 그 사이 생성된 subnet일 수 있으므로 한 번 다시 조회
     def _get_subnet_info(self, key, id_value):
-        for item in self._subnet_list:
-            if item[key] == id_value:
-                return item
+        index = self._subnet_index()
+        subnet = index.get(key, id_value)
+        if subnet is None:
+            subnet = self._subnet_index(refresh=True, stale=index).get(key, id_value)
+        return subnet
 
     # subnet_id에 속한 subnet_network_id return
     def _get_subnet_network_id(self, subnet_id):
@@ -1797,11 +2006,6 @@ class NetworkResource:
 
         if subnet:
             return subnet["subnet_network_id"]
-        else:
-            self._subnet_list = self.list_subnet_info()
-            subnet = self._get_subnet_info("subnet_id", subnet_id)
-            if subnet:
-                return subnet["subnet_network_id"]
 
     # subnet_network_id에 속한 subnet_id return
     def _get_subnet_id(self, subnet_network_id):
@@ -1809,18 +2013,13 @@ class NetworkResource:
 
         if subnet:
             return subnet["subnet_id"]
-        else:
-            self._subnet_list = self.list_subnet_info()
-            subnet = self._get_subnet_info("subnet_network_id", subnet_network_id)
-            if subnet:
-                return subnet["subnet_id"]
 
     # network_id가 key이고, subnet_id가 value인 dict return
+    # 없는 network_id는 subnet 목록을 다시 조회하여 찾음 (없으면 KeyError)
     def _get_subnet_id_map_dict(self):
-        map_dict = {}
+        map_dict = _SubnetIdMap(self)
 
-        self._subnet_list = self.list_subnet_info()
-        for item in self._subnet_list:
+        for item in self._subnet_list or []:
             map_dict[item["subnet_network_id"]] = item["subnet_id"]
 
         map_dict[self._external_id] = None
@@ -1847,6 +2046,7 @@ class NetworkResource:
 
         # 왠만하면 삭제되기 때문에 별도로 job_id 검사하지 않음.
         if job_id:
+            self._invalidate_subnet_index()
             return True
         return False
 
@@ -1859,7 +2059,9 @@ class NetworkResource:
         url = ku.get_request_url("get_net_job_status", job_id=job_id, zone=self._zone)
         headers = self._zone_mgr.get_auth_header()
         time.sleep(1)
-        response = requests.get(url, headers=headers)
+        response = ku.send_auth_request(
+            "_get_net_job_status", self._zone_mgr, "get", url, headers
+        )
 
         return ku.parse_net_job_status(job_type, response.json(), self._zone_mgr)
 
@@ -1873,7 +2075,11 @@ class NetworkResource:
 
     # 전체 LB정보의 목록 제공
     # lb_name, service_ip, lb_id로 특정 LB의 정보만 조회도 가능,
-    def list_lb_info(self, lb_name=None, service_ip=None, lb_id=None):
+    # records=True이면 dict 대신 ku.LBRecord 목록 return (대량 조회 시 메모리 절약)
+    # stream=True이면 응답 본문을 읽으면서 LB 정보를 하나씩 return하는 generator를 return
+    def list_lb_info(
+        self, lb_name=None, service_ip=None, lb_id=None, records=False, stream=False
+    ):
         url = ku.get_lb_request_url(
             "list_lb_info",
             zone=self._zone,
@@ -1884,11 +2090,24 @@ class NetworkResource:
         headers = self._zone_mgr.get_auth_header()
 
         func_name = inspect.currentframe().f_code.co_name
+        if stream:
+            return ku.request_lb_api_stream(
+                func_name,
+                "get",
+                url,
+                headers,
+                self._zone_mgr,
+                "listloadbalancersresponse",
+                "loadbalancer",
+                ku.lb_info_record if records else ku.parse_lb_info_item,
+            )
         response, success = ku.request_lb_api(
             func_name, "get", url, headers, self._zone_mgr, "listloadbalancersresponse"
         )
 
         if success:
+            if records:
+                return ku.parse_list_lb_info_records(response.json())
             return ku.parse_list_lb_info(response.json())
 
     # LB 생성
@@ -1956,7 +2175,8 @@ class NetworkResource:
             return ki.LBInstance(lb_id, self)
 
     # LB usage 조회s
-    def get_lb_usage(self, lb_name, start_date, end_date):
+    # timeout(초)을 지정하면 응답이 늦는 조회를 중단함
+    def get_lb_usage(self, lb_name, start_date, end_date, timeout=None):
         url = ku.get_lb_request_url(
             "get_lb_usage",
             zone=self._zone,
@@ -1974,6 +2194,7 @@ class NetworkResource:
             headers,
             self._zone_mgr,
             "usageloadbalancerserviceresponse",
+            timeout=timeout,
             lb_name=lb_name,
         )
 
@@ -2107,13 +2328,29 @@ class NetworkResource:
             return res["addloadbalancerwebserverresponse"]["serviceid"]
 
     # LB가 부하분산할 서버의 목록 정보 제공
-    def list_lb_server(self, lb_id):
+    # timeout(초)을 지정하면 응답이 늦는 LB 조회를 중단함
+    # records=True이면 dict 대신 ku.LBServerRecord 목록 return
+    # stream=True이면 응답 본문을 읽으면서 서버 정보를 하나씩 return하는 generator를 return
+    def list_lb_server(self, lb_id, timeout=None, records=False, stream=False):
         url = ku.get_lb_request_url(
             "list_lb_server", zone=self._zone, loadbalancerid=lb_id
         )
         headers = self._zone_mgr.get_auth_header()
 
         func_name = inspect.currentframe().f_code.co_name
+        if stream:
+            return ku.request_lb_api_stream(
+                func_name,
+                "get",
+                url,
+                headers,
+                self._zone_mgr,
+                "listloadbalancerwebserversresponse",
+                "loadbalancerwebserver",
+                ku.lb_server_record if records else ku.parse_lb_server_item,
+                timeout=timeout,
+                lb_id=lb_id,
+            )
         response, success = ku.request_lb_api(
             func_name,
             "get",
@@ -2121,10 +2358,13 @@ class NetworkResource:
             headers,
             self._zone_mgr,
             "listloadbalancerwebserversresponse",
+            timeout=timeout,
             lb_id=lb_id,
         )
 
         if success:
+            if records:
+                return ku.parse_list_lb_server_records(response.json())
             return ku.parse_list_lb_server(response.json())
 
     # LB가 부하분산할 서버 대상 삭제
@@ -2170,9 +2410,30 @@ class NetworkResource:
 
 
 class ObjectStorage:
-    def __init__(self, access_key, secret_key):
+    # pool_size, keep_alive, connect_timeout, read_timeout, max_retries : HTTP connection pool 설정
+    def __init__(
+        self,
+        access_key,
+        secret_key,
+        pool_size=ku.HTTP_POOL_SIZE,
+        keep_alive=ku.HTTP_KEEP_ALIVE,
+        connect_timeout=ku.HTTP_CONNECT_TIMEOUT,
+        read_timeout=OBJECT_STORAGE_READ_TIMEOUT,
+        max_retries=ku.HTTP_MAX_RETRIES,
+    ):
         self._access_key = access_key
         self._secret_key = secret_key
+        self._session = ku.HttpSession(
+            pool_size=pool_size,
+            keep_alive=keep_alive,
+            connect_timeout=connect_timeout,
+            read_timeout=read_timeout,
+            max_retries=max_retries,
+        )
+
+    # connection pool에 유지 중인 connection을 모두 닫음
+    def close(self):
+        self._session.close()
 
     # box 목록 정보 제공
     def list_box(self):
@@ -2181,7 +2442,7 @@ class ObjectStorage:
         headers = ku.get_auth_header(
             self._access_key, self._secret_key, "GET", "", path
         )
-        response = requests.get(url, headers=headers)
+        response = self._session.get(url, headers=headers)
 
         if response.status_code == 200:
             return ku.parse_list_filebox(response.text)
@@ -2193,7 +2454,7 @@ class ObjectStorage:
         headers = ku.get_auth_header(
             self._access_key, self._secret_key, "PUT", "", path
         )
-        response = requests.put(url, headers=headers)
+        response = self._session.put(url, headers=headers)
 
         if response.status_code == 200:
             return ki.BoxInstance(box_name, self)
@@ -2205,7 +2466,7 @@ class ObjectStorage:
         headers = ku.get_auth_header(
             self._access_key, self._secret_key, "DELETE", "", path
         )
-        response = requests.delete(url, headers=headers)
+        response = self._session.delete(url, headers=headers)
 
         if response.status_code == 204:
             return True
@@ -2236,7 +2497,7 @@ class ObjectStorage:
                 "application/octet-stream",
                 path,
             )
-            response = requests.put(url, headers=headers, data=file)
+            response = self._session.put(url, headers=headers, data=file)
 
             if response.status_code == 200:
                 return True
@@ -2249,7 +2510,7 @@ class ObjectStorage:
         headers = ku.get_auth_header(
             self._access_key, self._secret_key, "GET", "", path
         )
-        response = requests.get(url, headers=headers)
+        response = self._session.get(url, headers=headers)
 
         if response.status_code == 200:
             return ku.parse_list_box_file(response.text)
@@ -2263,7 +2524,7 @@ class ObjectStorage:
         headers = ku.get_auth_header(
             self._access_key, self._secret_key, "DELETE", "", path
         )
-        response = requests.delete(url, headers=headers)
+        response = self._session.delete(url, headers=headers)
 
         if response.status_code == 204:
             return True
@@ -2278,7 +2539,7 @@ class ObjectStorage:
         headers = ku.get_auth_header(
             self._access_key, self._secret_key, "GET", "", path
         )
-        response = requests.get(url, headers=headers, stream=True)
+        response = self._session.get(url, headers=headers, stream=True)
 
         if response.status_code == 200:
             file_name = os.path.basename(key_name)
@@ -2299,7 +2560,7 @@ class ObjectStorage:
         headers = ku.get_auth_header(
             self._access_key, self._secret_key, "POST", "", path
         )
-        response = requests.post(url, headers=headers)
+        response = self._session.post(url, headers=headers)
 
         if response.status_code == 200:
             return ku.parse_create_multipart_upload(response.text)
@@ -2318,7 +2579,7 @@ class ObjectStorage:
         headers = ku.get_auth_header(
             self._access_key, self._secret_key, "PUT", "application/octet-stream", path
         )
-        response = requests.put(url, headers=headers, data=data)
+        response = self._session.put(url, headers=headers, data=data)
 
         if response.status_code == 200:
             res_headers = response.headers
@@ -2333,7 +2594,7 @@ class ObjectStorage:
         headers = ku.get_auth_header(
             self._access_key, self._secret_key, "GET", "", path
         )
-        response = requests.get(url, headers=headers)
+        response = self._session.get(url, headers=headers)
 
         if response.status_code == 200:
             return ku.parse_list_multipart_upload_info(response.text)
@@ -2352,7 +2613,7 @@ class ObjectStorage:
             self._access_key, self._secret_key, "POST", "application/xml", path
         )
         body = ku.get_body_multipart_upload(parts)
-        response = requests.post(url, headers=headers, data=body)
+        response = self._session.post(url, headers=headers, data=body)
 
         if response.status_code == 200:
             return True
@@ -2427,6 +2688,9 @@ class VPC:
         self.vm_list = []
         self.lb_list = []
         self.ip_list = []
+        self.fw_list = []
+        # (목록 이름, key) -> (index를 만든 목록, key 값 -> 항목 list)
+        self._indexes = {}
         self.compute = zone_mgr.compute_resource()
         self.storage = zone_mgr.storage_resource()
         self.network = zone_mgr.network_resource()
@@ -2436,8 +2700,22 @@ class VPC:
         self._zone_name = zone_name
         self._external_id = zone_mgr.external_id
 
+    # 목록별로 index를 만드는 key (이름, id 등)
+    _INDEX_KEYS = {
+        "flavor_list": ("flavor_name",),
+        "subnet_list": ("subnet_name",),
+        "image_list": ("image_name",),
+        "snapshot_list": ("snapshot_name",),
+        "vm_list": ("vm_name", "vm_id"),
+        "lb_list": ("lb_name", "lb_id"),
+        "ip_list": ("publicip", "publicip_id"),
+        "pf_list": ("name", "publicip", "privateip", "portforward_id"),
+        "sn_list": ("name", "publicip", "privateip", "staticnat_id"),
+    }
+
     # flavor_list, subnet_list, image_list, snapshot_list 등을 list형태로 저장
     # VM생성 시마다 open API query를 하지 않도록 하기 위해 실행함.
+    # 조회한 목록마다 이름, id로 찾을 수 있도록 index 생성
     def _init_query(self, query_type):
         if query_type == "for_vm":
             self.flavor_list = self.compute.list_flavor_info()
@@ -2492,56 +2770,92 @@ class VPC:
             self.lb_list = self.network.list_lb_info()
             self.flavor_list = self.compute.list_flavor_info()
 
+        for list_name, keys in self._INDEX_KEYS.items():
+            for key in keys:
+                self._index(list_name, key)
+
+    # list_name 목록의 key 값 -> 항목 list(목록 순서) index return
+    # 목록이 다시 조회(재할당)되었으면 index를 새로 생성
+    def _index(self, list_name, key):
+        items = getattr(self, list_name)
+        cached = self._indexes.get((list_name, key))
+        if cached is not None and cached[0] is items:
+            return cached[1]
+
+        index = defaultdict(list)
+        for item in items or []:
+            index[item.get(key)].append(item)
+        index.default_factory = None
+        self._indexes[(list_name, key)] = (items, index)
+        return index
+
+    # list_name 목록에서 key 값이 value인 첫 번째 항목 return
+    def _find(self, list_name, key, value):
+        matches = self._index(list_name, key).get(value)
+        if matches:
+            return matches[0]
+
+    # 삭제한 자원을 list_name 목록과 index에서 제거
+    def _remove_resource(self, list_name, key, value):
+        item = self._find(list_name, key, value)
+        if item is None:
+            return
+
+        items = getattr(self, list_name)
+        for i, other in enumerate(items):
+            if other is item:
+                del items[i]
+                break
+
+        for index_key in self._INDEX_KEYS[list_name]:
+            index = self._index(list_name, index_key)
+            matches = index.get(item.get(index_key), [])
+            for i, other in enumerate(matches):
+                if other is item:
+                    del matches[i]
+                    break
+            if not matches:
+                index.pop(item.get(index_key), None)
+
     def _get_vm_id(self, vm_name):
-        return next(
-            (item["vm_id"] for item in self.vm_list if item["vm_name"] == vm_name), None
-        )
+        item = self._find("vm_list", "vm_name", vm_name)
+        if item:
+            return item["vm_id"]
 
     def _get_vm_status(self, vm_id):
-        return next(
-            (item["status"] for item in self.vm_list if item["vm_id"] == vm_id), None
-        )
+        item = self._find("vm_list", "vm_id", vm_id)
+        if item:
+            return item["status"]
 
     def _get_vm_privateip(self, vm_name):
-        return next(
-            (
-                item["subnets"][0]["privateip"]
-                for item in self.vm_list
-                if item["vm_name"] == vm_name
-            ),
-            None,
-        )
+        item = self._find("vm_list", "vm_name", vm_name)
+        if item:
+            return item["subnets"][0]["privateip"]
 
     def _get_lb_id(self, lb_name):
-        return next(
-            (item["lb_id"] for item in self.lb_list if item["lb_name"] == lb_name), None
-        )
+        item = self._find("lb_list", "lb_name", lb_name)
+        if item:
+            return item["lb_id"]
 
     def _get_lb_privateip(self, lb_name):
-        return next(
-            (item["service_ip"] for item in self.lb_list if item["lb_name"] == lb_name),
-            None,
-        )
+        item = self._find("lb_list", "lb_name", lb_name)
+        if item:
+            return item["service_ip"]
 
     def _get_publicip_id(self, publicip):
-        return next(
-            (
-                item["publicip_id"]
-                for item in self.ip_list
-                if item["publicip"] == publicip
-            ),
-            None,
-        )
+        item = self._find("ip_list", "publicip", publicip)
+        if item:
+            return item["publicip_id"]
 
     def _get_flavor_id(self, flavor_name):
-        for item in self.flavor_list:
-            if item["flavor_name"] == flavor_name:
-                return item["flavor_id"]
+        item = self._find("flavor_list", "flavor_name", flavor_name)
+        if item:
+            return item["flavor_id"]
 
     def _get_subnet_id(self, subnet_name):
-        for item in self.subnet_list:
-            if item["subnet_name"] == subnet_name:
-                return item["subnet_id"]
+        item = self._find("subnet_list", "subnet_name", subnet_name)
+        if item:
+            return item["subnet_id"]
 
     def _get_image_id_size(self, os_name):
         # if ku.check_os_name(os_name):
@@ -2555,48 +2869,42 @@ class VPC:
             zone = self._zone_name
             raise Exception(f"'{os_name}' in {zone} does not exist")
 
-        for item in self.image_list:
-            if item["image_name"] == image_name:
-                return item["image_id"], item["min_disk"]
+        item = self._find("image_list", "image_name", image_name)
+        if item:
+            return item["image_id"], item["min_disk"]
 
     def _get_snapshot_id(self, snapshot_name):
-        for item in self.snapshot_list:
-            if item["snapshot_name"] == snapshot_name:
-                return item["snapshot_id"]
+        item = self._find("snapshot_list", "snapshot_name", snapshot_name)
+        if item:
+            return item["snapshot_id"]
 
     def _get_portforward_id(self, pf_name):
-        for item in self.pf_list:
-            if item["name"] == pf_name:
-                return item["portforward_id"]
+        item = self._find("pf_list", "name", pf_name)
+        if item:
+            return item["portforward_id"]
 
     def _get_portforward_publicip(self, pf_name):
-        for item in self.pf_list:
-            if item["name"] == pf_name:
-                return item["publicip"]
+        item = self._find("pf_list", "name", pf_name)
+        if item:
+            return item["publicip"]
 
     def _get_portforward_info(self, ipaddr, option):
-        pf_list = []
-
         if option == "public":
             key = "publicip"
         else:
             key = "privateip"
 
-        for item in self.pf_list:
-            if item[key] == ipaddr:
-                pf_list.append(item)
-
-        return pf_list
+        return list(self._index("pf_list", key).get(ipaddr, []))
 
     def _get_staticnat_id(self, sn_name):
-        for item in self.sn_list:
-            if item["name"] == sn_name:
-                return item["staticnat_id"]
+        item = self._find("sn_list", "name", sn_name)
+        if item:
+            return item["staticnat_id"]
 
     def _get_staticnat_publicip(self, sn_name):
-        for item in self.sn_list:
-            if item["name"] == sn_name:
-                return item["publicip"]
+        item = self._find("sn_list", "name", sn_name)
+        if item:
+            return item["publicip"]
 
     def _get_staticnat_info(self, ipaddr, option):
         if option == "public":
@@ -2604,9 +2912,7 @@ class VPC:
         else:
             key = "privateip"
 
-        for item in self.sn_list:
-            if item[key] == ipaddr:
-                return item
+        return self._find("sn_list", key, ipaddr)
 
     def _read_vm_list(self, csv_file):
         result = True
@@ -2823,86 +3129,83 @@ class VPC:
         result = True
         msg_list = []
 
-        old_lb_list = self.lb_list
+        old_lb_index = self._index("lb_list", "lb_name")
 
         for key_lb in key_lb_list:
             key = key_lb["key"]
             lb = key_lb["params"]
 
-            for old_lb in old_lb_list:
-                if lb["name"] == old_lb["lb_name"]:
-                    lb_update = ku.check_lb_update(lb, old_lb)
-                    if lb_update:
-                        if "healthcheck_url" in lb:
-                            healthcheck_url = lb["healthcheck_url"]
-                        else:
-                            healthcheck_url = None
-
-                        if old_lb["service_type"].lower() == "https":
-                            ret = self.network.update_lb(
-                                old_lb["lb_id"],
-                                lb["option"],
-                                lb["healthcheck_type"],
-                                healthcheck_url,
-                                lb["ciphergroup_name"],
-                                lb["tlsv1"],
-                                lb["tlsv11"],
-                                lb["tlsv12"],
-                            )
-                        else:
-                            ret = self.network.update_lb(
-                                old_lb["lb_id"],
-                                lb["option"],
-                                lb["healthcheck_type"],
-                                healthcheck_url,
-                            )
+            for old_lb in old_lb_index.get(lb["name"], []):
+                lb_update = ku.check_lb_update(lb, old_lb)
+                if lb_update:
+                    if "healthcheck_url" in lb:
+                        healthcheck_url = lb["healthcheck_url"]
+                    else:
+                        healthcheck_url = None
+
+                    if old_lb["service_type"].lower() == "https":
+                        ret = self.network.update_lb(
+                            old_lb["lb_id"],
+                            lb["option"],
+                            lb["healthcheck_type"],
+                            healthcheck_url,
+                            lb["ciphergroup_name"],
+                            lb["tlsv1"],
+                            lb["tlsv11"],
+                            lb["tlsv12"],
+                        )
+                    else:
+                        ret = self.network.update_lb(
+                            old_lb["lb_id"],
+                            lb["option"],
+                            lb["healthcheck_type"],
+                            healthcheck_url,
+                        )
 
-                        if ret:
-                            msg = f"""'{lb["name"]}' 설정을 변경합니다."""
-                            ku.append_msg_list(msg_list, key, msg)
-                        else:
-                            msg = f"""'{lb["name"]}' 설정을 변경을 실패했습니다."""
-                            ku.append_msg_list(msg_list, key, msg)
-                            result = False
-                        time.sleep(1)
+                    if ret:
+                        msg = f"""'{lb["name"]}' 설정을 변경합니다."""
+                        ku.append_msg_list(msg_list, key, msg)
+                    else:
+                        msg = f"""'{lb["name"]}' 설정을 변경을 실패했습니다."""
+                        ku.append_msg_list(msg_list, key, msg)
+                        result = False
+                    time.sleep(1)
 
-                    server_list = None if "server_list" not in lb else lb["server_list"]
-                    # 연결 서버의 유효성 검증 및 정보 조회
+                server_list = None if "server_list" not in lb else lb["server_list"]
+                # 연결 서버의 유효성 검증 및 정보 조회
 
-                    vm_info_list = []
-                    if server_list != None:
-                        vm_info_list = self._get_vm_info(server_list)
-                    old_server_list = self.network.list_lb_server(old_lb["lb_id"])
+                vm_info_list = []
+                if server_list != None:
+                    vm_info_list = self._get_vm_info(server_list)
+                old_server_list = self.network.list_lb_server(old_lb["lb_id"])
 
-                    lb_update = ku.check_lb_server_update(vm_info_list, old_server_list)
+                lb_update = ku.check_lb_server_update(vm_info_list, old_server_list)
 
-                    if lb_update:
-                        result_tmp = True
-                        for old_vm in old_server_list:
-                            result_tmp = self.network.remove_lb_server(
-                                old_vm["service_id"]
-                            )
-                            if result_tmp == False:
-                                result = False
-                                msg = f"""'{lb["name"]}'에서 server_list server({server_list})삭제 실패했습니다."""
-                                ku.append_msg_list(msg_list, key, msg)
-                                return False, msg_list
-
-                        for vm_info in vm_info_list:
-                            result_tmp = self.network.add_lb_server(
-                                old_lb["lb_id"],
-                                vm_info["id"],
-                                vm_info["privateip"],
-                                lb["server_port"],
-                            )
-                            if result_tmp == False:
-                                result = False
-                                msg = f"""'{lb["name"]}'에서 server_list server({server_list})추가 실패했습니다."""
-                                ku.append_msg_list(msg_list, key, msg)
-                                return False, msg_list
+                if lb_update:
+                    result_tmp = True
+                    for old_vm in old_server_list:
+                        result_tmp = self.network.remove_lb_server(old_vm["service_id"])
+                        if result_tmp == False:
+                            result = False
+                            msg = f"""'{lb["name"]}'에서 server_list server({server_list})삭제 실패했습니다."""
+                            ku.append_msg_list(msg_list, key, msg)
+                            return False, msg_list
+
+                    for vm_info in vm_info_list:
+                        result_tmp = self.network.add_lb_server(
+                            old_lb["lb_id"],
+                            vm_info["id"],
+                            vm_info["privateip"],
+                            lb["server_port"],
+                        )
+                        if result_tmp == False:
+                            result = False
+                            msg = f"""'{lb["name"]}'에서 server_list server({server_list})추가 실패했습니다."""
+                            ku.append_msg_list(msg_list, key, msg)
+                            return False, msg_list
 
-                        msg = f"""'{lb["name"]}'에서 server_list server({server_list}) 업데이트 수행했습니다."""
-                        ku.append_msg_list(msg_list, key, msg)
+                    msg = f"""'{lb["name"]}'에서 server_list server({server_list}) 업데이트 수행했습니다."""
+                    ku.append_msg_list(msg_list, key, msg)
 
         return result, msg_list
 
@@ -2937,18 +3240,15 @@ class VPC:
     def _get_vm_info(self, server_list):
         server_info_list = []
         for server in server_list:
-            server_exist = False
-            for vm in self.vm_list:
-                if vm["vm_name"] == server:
-                    server_info = {}
-                    server_info["id"] = vm["vm_id"]
-                    server_info["privateip"] = vm["subnets"][0]["privateip"]
-                    server_info_list.append(server_info)
-                    server_exist = True
-                    break
-            if server_exist == False:
+            vm = self._find("vm_list", "vm_name", server)
+            if vm is None:
                 raise Exception(f"'{server}' does not exist")
 
+            server_info = {}
+            server_info["id"] = vm["vm_id"]
+            server_info["privateip"] = vm["subnets"][0]["privateip"]
+            server_info_list.append(server_info)
+
         return server_info_list
 
     def _create_lb(self, lb, new_ip_list):
@@ -3035,11 +3335,12 @@ class VPC:
     def _set_firewall_from_list(self, key_fw_list, action):
         result = True
         msg_list = []
+        context = ku.ValidationContext()
 
         for key_fw in key_fw_list:
             key = key_fw["key"]
             for i, fw in enumerate(key_fw["params"]):
-                acl_id = ku.search_acl(fw, self.fw_list)
+                acl_id = context.search_acl(fw, self.fw_list)
                 if acl_id != None:
                     msg = f"""'{i+1}'번째 ACL은 기존에 생성되어 있습니다."""
                     ku.append_msg_list(msg_list, key, msg)
@@ -3284,6 +3585,8 @@ class VPC:
                 return False, msg_list
 
         self._init_query("for_validate")
+        # 조회한 목록의 index를 모든 validate 함수에서 공유
+        context = ku.ValidationContext()
 
         if len(key_vm_list) > 0:
             result, msgs = ku.validate_vm_list(
@@ -3295,6 +3598,7 @@ class VPC:
                 self.vm_list,
                 self._zone_name,
                 action,
+                context=context,
             )
 
             msg_list = msg_list + msgs
@@ -3303,7 +3607,12 @@ class VPC:
 
         if len(key_lb_list) > 0:
             result, msgs = ku.validate_lb_list(
-                key_lb_list, self.subnet_list, self.vm_list, self.lb_list, action
+                key_lb_list,
+                self.subnet_list,
+                self.vm_list,
+                self.lb_list,
+                action,
+                context=context,
             )
 
             msg_list = msg_list + msgs
@@ -3319,6 +3628,7 @@ class VPC:
                 self.pf_list,
                 self.sn_list,
                 action,
+                context=context,
             )
 
             msg_list = msg_list + msgs
@@ -3335,6 +3645,7 @@ class VPC:
                 self.sn_list,
                 self.fw_list,
                 action,
+                context=context,
             )
 
             msg_list = msg_list + msgs
@@ -3567,10 +3878,12 @@ class VPC:
                 return False, msg_list
 
         self._init_query("for_delete")
+        # 조회한 목록의 index를 모든 validate 함수에서 공유
+        context = ku.ValidationContext()
 
         if len(key_vm_list) > 0:
             result_tmp, msgs = ku.validate_delete_vm_list(
-                key_vm_list, self.vm_list, action
+                key_vm_list, self.vm_list, action, context=context
             )
             msg_list = msg_list + msgs
             if result_tmp == False:
@@ -3578,7 +3891,7 @@ class VPC:
 
         if len(key_lb_list) > 0:
             result_tmp, msgs = ku.validate_delete_lb_list(
-                key_lb_list, self.lb_list, action
+                key_lb_list, self.lb_list, action, context=context
             )
             msg_list = msg_list + msgs
             if result_tmp == False:
@@ -3592,7 +3905,7 @@ class VPC:
 
         if len(key_ip_list) > 0:
             result_tmp, msgs = ku.validate_delete_ip_list(
-                key_ip_list, self.ip_list, self, action
+                key_ip_list, self.ip_list, self, action, context=context
             )
             msg_list = msg_list + msgs
             if result_tmp == False:
@@ -3610,7 +3923,7 @@ class VPC:
 
         if len(key_fw_list) > 0:
             result_tmp, msgs = ku.validate_delete_firewall_list(
-                key_fw_list, self.fw_list, action
+                key_fw_list, self.fw_list, action, context=context
             )
             msg_list = msg_list + msgs
             if result_tmp == False:
@@ -3639,13 +3952,14 @@ class VPC:
     def _unset_firewall_list(self, key_fw_list, action):
         result = True
         msg_list = []
+        context = ku.ValidationContext()
 
         for key_fw in key_fw_list:
             key = key_fw["key"]
             fw_list = key_fw["params"]
 
             for i, fw in enumerate(fw_list):
-                acl_id = ku.search_acl(fw, self.fw_list)
+                acl_id = context.search_acl(fw, self.fw_list)
 
                 if acl_id == None:
                     msg = f"""{i+1}번째 acl이 검색되지 않습니다."""
@@ -3682,6 +3996,7 @@ class VPC:
             if ip["type"] == "static_nat":
                 sn_id = self._get_staticnat_id(key_ip["nat_name"])
                 res = self.network.unset_staticnat(sn_id)
+                nat_unset = res
                 if res:
                     msg = f"""'{key_ip["nat_name"]}'static nat 설정이 삭제되었습니다."""
                     ku.append_msg_list(msg_list, key, msg)
@@ -3695,10 +4010,14 @@ class VPC:
                     public_ip = self._get_staticnat_publicip(key_ip["nat_name"])
                 else:
                     public_ip = ip["public_ip"]
+                # 해제한 static nat는 public ip를 확인한 뒤 목록에서 제거
+                if nat_unset:
+                    self._remove_resource("sn_list", "staticnat_id", sn_id)
 
                 ip_id = self._get_publicip_id(public_ip)
                 res = self.network.delete_publicip(ip_id)
                 if res:
+                    self._remove_resource("ip_list", "publicip_id", ip_id)
                     msg = f"""'{public_ip}'IP주소가 삭제되었습니다."""
                     ku.append_msg_list(msg_list, key, msg)
                 else:
@@ -3709,6 +4028,7 @@ class VPC:
             elif ip["type"] == "port_forward":
                 pf_id = self._get_portforward_id(key_ip["nat_name"])
                 res = self.network.unset_portforward(pf_id)
+                nat_unset = res
                 if res:
                     msg = (
                         f"""'{key_ip["nat_name"]}'port forward 설정이 삭제되었습니다."""
@@ -3725,12 +4045,15 @@ class VPC:
                     public_ip = self._get_portforward_publicip(key_ip["nat_name"])
                 else:
                     public_ip = ip["public_ip"]
+                if nat_unset:
+                    self._remove_resource("pf_list", "portforward_id", pf_id)
 
                 pf_list = self.network.get_portforward_info_of_publicip(public_ip)
                 if len(pf_list) == 0:
                     ip_id = self._get_publicip_id(public_ip)
                     res = self.network.delete_publicip(ip_id)
                     if res:
+                        self._remove_resource("ip_list", "publicip_id", ip_id)
                         msg = f"""'{public_ip}' IP주소가 삭제되었습니다."""
                         ku.append_msg_list(msg_list, key, msg)
                     else:
@@ -3759,6 +4082,7 @@ class VPC:
             res = self.network.delete_lb(lb_id)
 
             if res:
+                self._remove_resource("lb_list", "lb_id", lb_id)
                 msg = f"""'{lb["name"]}' LB가 삭제되었습니다."""
                 ku.append_msg_list(msg_list, key, msg)
             else:
@@ -3786,6 +4110,7 @@ class VPC:
             res = self.compute.delete_vm(vm_id)
 
             if res:
+                self._remove_resource("vm_list", "vm_id", vm_id)
                 msg = f"""'{vm["name"]}' VM이 삭제되었습니다."""
                 ku.append_msg_list(msg_list, key, msg)
             else:
@@ -4003,7 +4328,7 @@ class VPC:
         result = True
         msg_list = []
 
-        old_vm_list = self.vm_list
+        old_vm_index = self._index("vm_list", "vm_name")
         chunk_size = MAX_VM_CREATE_COUNT
 
         change_vm_list = []
@@ -4011,11 +4336,10 @@ class VPC:
             vm = key_vm["params"]
             key = key_vm["key"]
 
-            for old_vm in old_vm_list:
-                if vm["name"] == old_vm["vm_name"]:
-                    if vm["flavor"] != old_vm["flavor_name"]:
-                        key_vm["old_vm_id"] = old_vm["vm_id"]
-                        change_vm_list.append(key_vm)
+            for old_vm in old_vm_index.get(vm["name"], []):
+                if vm["flavor"] != old_vm["flavor_name"]:
+                    key_vm["old_vm_id"] = old_vm["vm_id"]
+                    change_vm_list.append(key_vm)
 
         chunk_list = []
         for key_vm in change_vm_list:
@@ -4113,10 +4437,12 @@ class VPC:
                 return False, msg_list
 
         self._init_query("for_validate_change")
+        # 조회한 목록의 index를 모든 validate 함수에서 공유
+        context = ku.ValidationContext()
 
         if len(key_vm_list) > 0:
             result, msgs = ku.validate_change_vm_list(
-                key_vm_list, self.flavor_list, self.vm_list
+                key_vm_list, self.flavor_list, self.vm_list, context=context
             )
 
             msg_list = msg_list + msgs
@@ -4125,7 +4451,7 @@ class VPC:
 
         if len(key_lb_list) > 0:
             result, msgs = ku.validate_change_lb_list(
-                key_lb_list, self.lb_list, self.vm_list
+                key_lb_list, self.lb_list, self.vm_list, context=context
             )
 
             msg_list = msg_list + msgs
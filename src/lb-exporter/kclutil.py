@@ -8,23 +8,34 @@
 #
 ###############################################################################################
 
+import sys
 import json
-import yaml
+import queue
+import atexit
+import logging
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 import base64
 import time
 import random
 import string
+import threading
+import contextvars
 import ipaddress
+from contextlib import contextmanager
 from urllib.parse import urlencode
 from datetime import datetime
 import hmac
 import hashlib
-import xmltodict
-import xml.etree.ElementTree as ET
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import re
-from collections import Counter, defaultdict
+from collections import Counter, defaultdict, namedtuple
 import copy
+import codecs
+
+# yaml, xmltodict, xml.etree.ElementTree는 body fallback 변환과 object storage 응답 처리에만
+# 사용하므로 import 시간을 줄이기 위해 해당 함수 안에서 처음 사용할 때 import
 
 VM_ACTIVE_INTERVAL = 20
 VM_SHUTOFF_INTERVAL = 10
@@ -32,6 +43,35 @@ NAS_AVAILABLE_INTERVAL = 10
 VOLUME_AVAILABLE_INTERVAL = 5
 VOLUME_INUSE_INTERVAL = 5
 
+# open API 호출에 사용하는 HTTP connection pool 기본 설정
+HTTP_POOL_SIZE = 10  # host별로 유지하는 connection 개수
+HTTP_KEEP_ALIVE = True  # False이면 요청마다 connection을 닫음
+HTTP_CONNECT_TIMEOUT = 5  # connection 연결 타임아웃 (초)
+HTTP_READ_TIMEOUT = 30  # 응답 대기 타임아웃 (초)
+HTTP_MAX_RETRIES = 2  # connection 오류, 502/503/504 응답 시 재시도 횟수 (GET만 해당, 502/503/504는 속도 제한이 없을 때만)
+HTTP_RETRY_BACKOFF = 0.5  # 재시도 간격 계수 (0.5, 1, 2 ... 초)
+
+# open API 호출 속도 제한 기본 설정 (set_rate_limiter()로 RateLimiter를 등록한 경우에만 적용)
+API_RATE_LIMIT = 0  # endpoint별 초당 요청 수 (0이면 제한 없음)
+API_RATE_BURST = 10  # token bucket 크기 (순간적으로 허용하는 요청 수)
+API_MIN_CONCURRENCY = 1  # AIMD로 줄일 수 있는 최소 동시 요청 수
+API_MAX_CONCURRENCY = 32  # AIMD로 늘릴 수 있는 최대 동시 요청 수
+API_CONCURRENCY_DECREASE = 0.5  # 429/5xx 응답 시 동시 요청 수에 곱하는 값
+API_BACKOFF_BASE = 0.5  # 429/5xx 응답 후 대기 시간 계수 (0.5, 1, 2 ... 초, jitter 적용)
+API_BACKOFF_MAX = 30  # 429/5xx 응답 후 최대 대기 시간 (초)
+API_THROTTLE_RETRIES = 2  # 429 응답 시 재시도 횟수
+API_THROTTLE_STATUS = (429, 500, 502, 503, 504)  # 속도 제한 신호로 보는 응답 상태 코드
+
+# stream 모드 (응답 본문을 읽으면서 목록 항목을 하나씩 parse) 에서 socket으로부터 한 번에 읽는 크기
+STREAM_CHUNK_SIZE = 64 * 1024
+
+# SDK 호출 log (ZoneManager의 kcl_logs_{id}_{zone}.log) 기본 설정, set_sdk_log_options()로 변경
+SDK_LOGGER_NAME = "ktcloud"  # SDK 호출 log의 공통 로거 이름
+SDK_LOG_FORMAT = "%(asctime)s - %(levelname)s : %(message)s"
+SDK_LOG_MAX_BYTES = 10 * 1024 * 1024  # log file 최대 크기, 넘으면 rotate (0이면 rotate 안 함)
+SDK_LOG_BACKUP_COUNT = 3  # rotate된 이전 log file 보관 개수
+SDK_LOG_QUEUE_SIZE = 10000  # 기록 대기 중인 log 최대 개수 (가득 차면 새 log는 버림)
+
 # LB 설정 관련 옵션 사항
 lb_options_list = [
     "roundrobin",
@@ -652,6 +692,10 @@ request_body_dict = {
 # request url 형식
 #################################################################
 
+# open api 기본 주소, set_api_base_url()로 바꾸면 모든 request url에 반영됨 (로컬 시뮬레이터 등)
+DEFAULT_API_BASE_URL = "https://api.ucloudbiz.olleh.com"
+api_base_url = DEFAULT_API_BASE_URL
+
 # make_token_url : zone
 make_token_url = "https://api.ucloudbiz.olleh.com/{zone}/identity/auth/tokens"
 
@@ -1041,13 +1085,26 @@ object_path_dict = {
 
 # openapi command에 따른 url return
 def get_request_url(command, **kwargs):
-    url = request_url_dict[command]
+    url = _apply_api_base_url(request_url_dict[command])
     return url.format(**kwargs)
 
 
+# open api 기본 주소 변경, None이면 기본 주소로 되돌림
+def set_api_base_url(url=None):
+    global api_base_url
+    api_base_url = (url or DEFAULT_API_BASE_URL).rstrip("/")
+
+
+# url 형식의 기본 주소를 현재 api_base_url로 교체
+def _apply_api_base_url(url):
+    if api_base_url != DEFAULT_API_BASE_URL and url.startswith(DEFAULT_API_BASE_URL):
+        return api_base_url + url[len(DEFAULT_API_BASE_URL) :]
+    return url
+
+
 # openapi command에 따른 LB url return
 def get_lb_request_url(command, zone, **kwargs):
-    url = request_url_dict[command]
+    url = _apply_api_base_url(request_url_dict[command])
 
     # value가 None인 항목 삭제
     for key in list(kwargs.keys()):
@@ -1076,8 +1133,83 @@ def get_object_url(path):
     return object_storage_url + path
 
 
+# request body template에서 값 전체가 "{name}" 형태인 placeholder
+class _BodyPlaceholder:
+    __slots__ = ("name",)
+
+    def __init__(self, name):
+        self.name = name
+
+
+_body_placeholder_pattern = re.compile(r"^\{([A-Za-z_][A-Za-z0-9_]*)\}$")
+
+
+# body template (json 문자열)을 placeholder가 표시된 dict로 미리 파싱
+# placeholder가 아닌 위치에 '{', '}'가 있으면 빠른 치환이 불가능하므로 None return
+def _compile_request_body(body_txt):
+    names = []
+
+    def compile_node(node):
+        if isinstance(node, dict):
+            if any("{" in key or "}" in key for key in node):
+                raise ValueError
+            return {key: compile_node(value) for key, value in node.items()}
+        if isinstance(node, list):
+            return [compile_node(item) for item in node]
+        if isinstance(node, str) and ("{" in node or "}" in node):
+            match = _body_placeholder_pattern.match(node)
+            if match is None:
+                raise ValueError
+            names.append(match.group(1))
+            return _BodyPlaceholder(match.group(1))
+        return node
+
+    try:
+        return compile_node(json.loads(body_txt)), tuple(names)
+    except ValueError:
+        return None
+
+
+# import 시점에 한 번만 파싱한 body template
+request_body_template_dict = {
+    command: _compile_request_body(body_txt)
+    for command, body_txt in request_body_dict.items()
+}
+
+
+# yaml의 작은따옴표 문자열 안에 그대로 넣어도 같은 문자열로 읽히는 값인지 확인
+def _is_plain_body_value(value):
+    text = format(value)
+    return "'" not in text and text.isprintable()
+
+
+# 미리 파싱한 template에 값을 채워 새 dict 생성 (template은 수정하지 않음)
+def _fill_request_body(node, kwargs):
+    if isinstance(node, dict):
+        return {key: _fill_request_body(value, kwargs) for key, value in node.items()}
+    if isinstance(node, list):
+        return [_fill_request_body(item, kwargs) for item in node]
+    if isinstance(node, _BodyPlaceholder):
+        return format(kwargs[node.name])
+    return node
+
+
 # openapi command에 따른 html body return
+# 치환 값이 단순 문자열이면 미리 파싱한 template을 사용하고,
+# 그 외의 경우는 기존 yaml 변환 방식으로 처리하여 동일한 결과를 보장함
 def get_request_body(command, **kwargs):
+    template = request_body_template_dict.get(command)
+    if template is not None:
+        body, names = template
+        if all(_is_plain_body_value(kwargs[name]) for name in names if name in kwargs):
+            return _fill_request_body(body, kwargs)
+    return _get_request_body_yaml(command, **kwargs)
+
+
+# yaml 문자열로 변환 후 str.format으로 값을 채우는 방식 (get_request_body의 fallback)
+def _get_request_body_yaml(command, **kwargs):
+    import yaml
+
     body_txt = request_body_dict[command]
     body_json = json.loads(body_txt)
     body_yaml = yaml.dump(
@@ -1179,6 +1311,12 @@ def parse_list_vm_info(res):
     return info_list
 
 
+# list_vm_info 응답 본문을 읽으면서 VM 정보를 하나씩 return (stream 모드)
+def iter_list_vm_info(response):
+    stream = JsonArrayStream(("servers",), parse_get_vm_info)
+    yield from iter_response_items(response, stream)
+
+
 # list_flavor() response 정보 파싱
 """
 [
@@ -1558,21 +1696,39 @@ def parse_list_firewall_info(res, network):
     map_dict = network._get_subnet_id_map_dict()
 
     for item in res["data"]:
-        acl = {}
-        acl["src_nets"] = _parse_acl_network(item["srcInterface"], map_dict)
-        acl["dst_nets"] = _parse_acl_network(item["dstInterface"], map_dict)
-        acl["src_addrs"] = item["srcAddress"]
-        acl["dst_addrs"] = item["dstAddress"]
-        acl["services"] = item["services"]
-        acl["action"] = "allow" if item["action"] == "accept" else "deny"
-        acl["acl_id"] = item["policyId"]
-        acl["comments"] = item["comment"]
-        acl["priority"] = item["priority"]
-        acl_list.append(acl)
+        acl_list.append(_parse_firewall_item(item, map_dict))
 
     return acl_list
 
 
+def _parse_firewall_item(item, map_dict):
+    acl = {}
+    acl["src_nets"] = _parse_acl_network(item["srcInterface"], map_dict)
+    acl["dst_nets"] = _parse_acl_network(item["dstInterface"], map_dict)
+    acl["src_addrs"] = item["srcAddress"]
+    acl["dst_addrs"] = item["dstAddress"]
+    acl["services"] = item["services"]
+    acl["action"] = "allow" if item["action"] == "accept" else "deny"
+    acl["acl_id"] = item["policyId"]
+    acl["comments"] = item["comment"]
+    acl["priority"] = item["priority"]
+    return acl
+
+
+# list_firewall_info 응답 본문을 읽으면서 firewall 정보를 하나씩 return (stream 모드)
+# 본문의 httpStatus가 200이 아니면 모든 항목을 읽은 뒤 예외 발생
+def iter_list_firewall_info(response, network):
+    map_dict = network._get_subnet_id_map_dict()
+    stream = JsonArrayStream(
+        ("data",), lambda item: _parse_firewall_item(item, map_dict)
+    )
+    yield from iter_response_items(response, stream)
+    if stream.fields.get("httpStatus") != 200:
+        raise Exception(
+            f"list_firewall_info() : fail, httpStatus={stream.fields.get('httpStatus')}"
+        )
+
+
 def parse_multi_cidr(cidr_list):
     cidr_str = ""
 
@@ -2010,6 +2166,8 @@ def get_auth_header(access_key, secret_key, method, c_type, path):
 
 
 def parse_list_filebox(res):
+    import xmltodict
+
     res_dict = xmltodict.parse(res)
     info_list = []
 
@@ -2041,6 +2199,8 @@ def parse_list_filebox(res):
 
 
 def parse_list_box_file(res):
+    import xmltodict
+
     res_dict = xmltodict.parse(res)
     info_list = []
 
@@ -2068,12 +2228,16 @@ def parse_list_box_file(res):
 
 # multipart upload 작업 생성을 위한 parsing
 def parse_create_multipart_upload(res):
+    import xmltodict
+
     res_dict = xmltodict.parse(res)
     return res_dict["InitiateMultipartUploadResult"]["UploadId"]
 
 
 # multipart upload 작업 목록 조회
 def parse_list_multipart_upload_info(res):
+    import xmltodict
+
     res_dict = xmltodict.parse(res)
     info_list = []
 
@@ -2088,6 +2252,8 @@ def parse_list_multipart_upload_info(res):
 
 # dict 형식을 xml 형식으로 변환
 def dict_to_custom_xml(data):
+    import xml.etree.ElementTree as ET
+
     # Create the root element
     root_name = list(data.keys())[0]
     root = ET.Element(root_name)
@@ -2158,28 +2324,33 @@ def parse_list_lb_info(res):
     info_list = []
 
     for item in res["listloadbalancersresponse"]["loadbalancer"]:
-        info = {}
-        if item["healthchecktype"] == "tcp":
-            info["healthcheck_url"] = ""
-        else:
-            info["healthcheck_url"] = item["healthcheckurl"]
-
-        info["healthcheck_type"] = item["healthchecktype"]
-        info["service_port"] = item["serviceport"]
-        info["service_ip"] = item["serviceip"]
-        info["service_type"] = item["servicetype"]
-        info["lb_option"] = item["loadbalanceroption"]
-        info["lb_id"] = item["loadbalancerid"]
-        info["established_conn"] = item["establishedconn"]
-        info["lb_name"] = item["name"]
-        info["ciphergroup_name"] = item["ciphergroupname"]
-        info["subnet_id"] = item["networkid"]
-        info["state"] = item["state"]
-        info_list.append(info)
+        info_list.append(parse_lb_info_item(item))
 
     return info_list
 
 
+# listLoadBalancers 응답의 LB 항목 하나를 dict로 변환
+def parse_lb_info_item(item):
+    info = {}
+    if item["healthchecktype"] == "tcp":
+        info["healthcheck_url"] = ""
+    else:
+        info["healthcheck_url"] = item["healthcheckurl"]
+
+    info["healthcheck_type"] = item["healthchecktype"]
+    info["service_port"] = item["serviceport"]
+    info["service_ip"] = item["serviceip"]
+    info["service_type"] = item["servicetype"]
+    info["lb_option"] = item["loadbalanceroption"]
+    info["lb_id"] = item["loadbalancerid"]
+    info["established_conn"] = item["establishedconn"]
+    info["lb_name"] = item["name"]
+    info["ciphergroup_name"] = item["ciphergroupname"]
+    info["subnet_id"] = item["networkid"]
+    info["state"] = item["state"]
+    return info
+
+
 # LB ciphergroup의 validation check
 def check_ciphergroup_validation(ciphergroup):
     if ciphergroup not in ciphergroup_list:
@@ -2276,23 +2447,150 @@ def check_parameter_validation(
 def parse_list_lb_server(res):
     info_list = []
 
-    for item in res["listloadbalancerwebserversresponse"]["loadbalancerwebserver"]:
-        info = {}
-        info["vm_ip"] = item["ipaddress"]
-        info["lb_id"] = item["loadbalancerid"]
-        info["vm_id"] = item["virtualmachineid"]
-        info["vm_port"] = item["publicport"]
-        info["state"] = item["state"]
-        info["service_id"] = item["serviceid"]
-        info["cursrvrconnections"] = item["cursrvrconnections"]
-        info["throughputrate"] = item["throughputrate"]
-        info["avgsvrttfb"] = item["avgsvrttfb"]
-        info["requestsrate"] = item["requestsrate"]
-        info_list.append(info)
+    # 연결된 서버가 없는 LB는 응답에 loadbalancerwebserver 항목이 없음
+    for item in res["listloadbalancerwebserversresponse"].get(
+        "loadbalancerwebserver", []
+    ):
+        info_list.append(parse_lb_server_item(item))
 
     return info_list
 
 
+# listLoadBalancerWebServers 응답의 서버 항목 하나를 dict로 변환
+def parse_lb_server_item(item):
+    info = {}
+    info["vm_ip"] = item["ipaddress"]
+    info["lb_id"] = item["loadbalancerid"]
+    info["vm_id"] = item["virtualmachineid"]
+    info["vm_port"] = item["publicport"]
+    info["state"] = item["state"]
+    info["service_id"] = item["serviceid"]
+    info["cursrvrconnections"] = item["cursrvrconnections"]
+    info["throughputrate"] = item["throughputrate"]
+    info["avgsvrttfb"] = item["avgsvrttfb"]
+    info["requestsrate"] = item["requestsrate"]
+    return info
+
+
+# 값의 종류가 적은 문자열(상태, 타입 등)은 intern하여 항목 간에 같은 객체를 공유
+def _intern(value):
+    return sys.intern(value) if type(value) is str else value
+
+
+# 서버 성능 지표를 float로 변환, None/빈 문자열/잘못된 형식은 0
+def _metric_float(value):
+    try:
+        return float(value) if value is not None and value != "" else 0.0
+    except (ValueError, TypeError):
+        return 0.0
+
+
+# parse_list_lb_info()의 항목 dict 대신 사용하는 메모리를 적게 쓰는 LB 레코드
+# 필드 이름은 dict 결과의 키와 같고, 값은 lb.lb_name처럼 속성으로 조회
+class LBRecord(
+    namedtuple(
+        "LBRecord",
+        [
+            "lb_id",
+            "lb_name",
+            "state",
+            "service_ip",
+            "service_port",
+            "service_type",
+            "lb_option",
+            "healthcheck_type",
+            "healthcheck_url",
+            "established_conn",
+            "ciphergroup_name",
+            "subnet_id",
+        ],
+    )
+):
+    __slots__ = ()
+
+    # dict 결과와 같은 방식의 조회 (lb.get("lb_name"))
+    def get(self, key, default=None):
+        return getattr(self, key) if key in self._fields else default
+
+
+# parse_list_lb_server()의 항목 dict 대신 사용하는 메모리를 적게 쓰는 서버 레코드
+# 성능 지표(cursrvrconnections, throughputrate, avgsvrttfb, requestsrate)는 float로 변환하여 보관
+class LBServerRecord(
+    namedtuple(
+        "LBServerRecord",
+        [
+            "lb_id",
+            "vm_id",
+            "vm_ip",
+            "vm_port",
+            "state",
+            "service_id",
+            "cursrvrconnections",
+            "throughputrate",
+            "avgsvrttfb",
+            "requestsrate",
+        ],
+    )
+):
+    __slots__ = ()
+
+    # dict 결과와 같은 방식의 조회 (server.get("vm_ip"))
+    def get(self, key, default=None):
+        return getattr(self, key) if key in self._fields else default
+
+
+# parse_list_lb_info()와 같은 내용을 LBRecord 목록으로 return
+def parse_list_lb_info_records(res):
+    return [
+        lb_info_record(item)
+        for item in res["listloadbalancersresponse"]["loadbalancer"]
+    ]
+
+
+# listLoadBalancers 응답의 LB 항목 하나를 LBRecord로 변환
+def lb_info_record(item):
+    return LBRecord(
+        item["loadbalancerid"],
+        item["name"],
+        _intern(item["state"]),
+        item["serviceip"],
+        _intern(item["serviceport"]),
+        _intern(item["servicetype"]),
+        _intern(item["loadbalanceroption"]),
+        _intern(item["healthchecktype"]),
+        "" if item["healthchecktype"] == "tcp" else _intern(item["healthcheckurl"]),
+        item["establishedconn"],
+        _intern(item["ciphergroupname"]),
+        _intern(item["networkid"]),
+    )
+
+
+# parse_list_lb_server()와 같은 내용을 LBServerRecord 목록으로 return
+def parse_list_lb_server_records(res):
+    return [
+        lb_server_record(item)
+        for item in res["listloadbalancerwebserversresponse"].get(
+            "loadbalancerwebserver", []
+        )
+    ]
+
+
+# listLoadBalancerWebServers 응답의 서버 항목 하나를 LBServerRecord로 변환
+def lb_server_record(item):
+    return LBServerRecord(
+        _intern(item["loadbalancerid"]),
+        item["virtualmachineid"],
+        item["ipaddress"],
+        _intern(item["publicport"]),
+        _intern(item["state"]),
+        item["serviceid"],
+        _metric_float(item["cursrvrconnections"]),
+        _metric_float(item["throughputrate"]),
+        _metric_float(item["avgsvrttfb"]),
+        _metric_float(item["requestsrate"]),
+    )
+
+
 """
 [
       {
@@ -2373,54 +2671,888 @@ def dict_to_string(data):
     return ", ".join(f"{key}={value}" for key, value in data.items())
 
 
+# log message 인자로 넘기는 kwargs
+# str()로 변환할 때(log 기록 thread에서 format할 때) dict_to_string()을 수행
+class LogFields:
+    __slots__ = ("data",)
+
+    def __init__(self, data):
+        self.data = data
+
+    def __str__(self):
+        return dict_to_string(self.data)
+
+
+sdk_log_max_bytes = SDK_LOG_MAX_BYTES
+sdk_log_backup_count = SDK_LOG_BACKUP_COUNT
+sdk_log_queue_size = SDK_LOG_QUEUE_SIZE
+sdk_log_sample_rates = {}  # level 이름 -> 기록 비율 (0~1), 지정하지 않은 level은 모두 기록
+sdk_log_to_file = False  # True이면 root 로거의 handler와 함께 log file에도 기록
+
+
+# SDK 호출 log 설정 변경, None인 값은 그대로 유지
+# max_bytes, backup_count, queue_size, to_file은 이후 처음 만드는 logger부터, sample_rates는 바로 적용
+def set_sdk_log_options(
+    max_bytes=None, backup_count=None, queue_size=None, sample_rates=None, to_file=None
+):
+    global sdk_log_max_bytes, sdk_log_backup_count, sdk_log_queue_size
+    global sdk_log_sample_rates, sdk_log_to_file
+    if max_bytes is not None:
+        sdk_log_max_bytes = max_bytes
+    if backup_count is not None:
+        sdk_log_backup_count = backup_count
+    if queue_size is not None:
+        sdk_log_queue_size = queue_size
+    if sample_rates is not None:
+        sdk_log_sample_rates = {
+            level.upper(): float(rate) for level, rate in sample_rates.items()
+        }
+    if to_file is not None:
+        sdk_log_to_file = to_file
+
+
+# record를 format하지 않고 그대로 queue에 넣는 QueueHandler
+# 기본 prepare()는 호출 thread에서 message를 만들기 때문에 format은 QueueListener thread의 handler에 맡김
+# level별 기록 비율에 따라 log를 고르고, queue가 가득 차면 기다리지 않고 버린 개수만 셈
+class SdkQueueHandler(QueueHandler):
+    def __init__(self, log_queue):
+        super().__init__(log_queue)
+        self.sampled_out = 0  # 기록 비율에 따라 기록하지 않은 log 개수
+        self.dropped = 0  # queue가 가득 차서 버린 log 개수
+
+    def filter(self, record):
+        rate = sdk_log_sample_rates.get(record.levelname)
+        if rate is not None and rate < 1 and random.random() >= rate:
+            self.sampled_out += 1
+            return False
+        return super().filter(record)
+
+    def prepare(self, record):
+        # 출력되는 로거 이름은 기존과 같이 공통 로거 이름(ktcloud) 사용
+        record.name = SDK_LOGGER_NAME
+        return record
+
+    def enqueue(self, record):
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+
+_sdk_loggers = {}  # log file 이름 -> logger
+_sdk_log_listeners = []
+_sdk_log_lock = threading.Lock()
+
+
+# SDK 호출 log를 기록하는 logger return (log file 이름별로 하나, 처음 호출 시 생성)
+# 기존과 같이 root 로거의 handler(예: 익스포터의 stdout/stderr 출력)로 기록하고,
+# root 로거에 handler가 없거나 sdk_log_to_file이면 log file에도 기록 (크기 제한 rotate)
+# API 호출 thread는 record를 queue에 넣기만 하고, format과 출력은 QueueListener thread에서
+# 수행하므로 호출 thread가 I/O를 기다리지 않음
+def get_sdk_logger(filename):
+    with _sdk_log_lock:
+        logger = _sdk_loggers.get(filename)
+        if logger is not None:
+            return logger
+
+        root_handlers = list(logging.getLogger().handlers)
+        sinks = list(root_handlers)
+        if sdk_log_to_file or not root_handlers:
+            sink = RotatingFileHandler(
+                filename,
+                maxBytes=sdk_log_max_bytes,
+                backupCount=sdk_log_backup_count,
+                encoding="utf-8",
+                delay=True,
+            )
+            sink.setFormatter(logging.Formatter(SDK_LOG_FORMAT))
+            sinks.append(sink)
+        log_queue = queue.Queue(sdk_log_queue_size)
+        listener = QueueListener(log_queue, *sinks, respect_handler_level=True)
+        listener.start()
+        _sdk_log_listeners.append(listener)
+
+        # 공통 로거(ktcloud) 아래에 log file별 로거 생성, 출력은 listener가 하므로 root 로거로는 전달하지 않음
+        # root 로거에 handler가 있으면 기존처럼 root 로거의 level을 따르고,
+        # 없으면 logging.basicConfig(level=INFO)로 file에 기록하던 기존 설정과 같이 INFO
+        logger = logging.getLogger(SDK_LOGGER_NAME).getChild(str(len(_sdk_loggers)))
+        if not root_handlers:
+            logger.setLevel(logging.INFO)
+        logger.propagate = False
+        logger.addHandler(SdkQueueHandler(log_queue))
+        _sdk_loggers[filename] = logger
+        return logger
+
+
+# 프로세스 종료 시 queue에 남은 log를 모두 기록하고 QueueListener thread 종료
+def _stop_sdk_log_listeners():
+    with _sdk_log_lock:
+        listeners = list(_sdk_log_listeners)
+        _sdk_log_listeners.clear()
+    for listener in listeners:
+        try:
+            listener.stop()
+        except queue.Full:
+            pass
+
+
+atexit.register(_stop_sdk_log_listeners)
+
+
+# API 호출 결과 log 저장, 성공이면 INFO, 실패면 ERROR
+# message("{func_name}(){sep}success, key=value, ...")는 log 기록 thread에서 만들어지고,
+# record에는 command, result, fields(kwargs)가 구조화된 값으로 남음
+def log_api_result(zone_mgr, func_name, success, kwargs, sep=" : "):
+    result = "success" if success else "fail"
+    log = zone_mgr.info_log if success else zone_mgr.error_log
+    log(
+        "%s()%s%s, %s",
+        func_name,
+        sep,
+        result,
+        LogFields(kwargs),
+        command=func_name,
+        result=result,
+        fields=kwargs,
+    )
+
+
+# urllib3 재시도 설정
+# RateLimiter가 등록되어 있으면 속도 제한 신호(API_THROTTLE_STATUS)인 응답은 재시도하지 않고
+# 그대로 돌려주어, 속도 제한이 응답을 보고 동시 요청 수와 backoff를 조절하도록 함
+# (urllib3 재시도와 속도 제한의 backoff가 겹쳐 같은 요청을 여러 번 보내지 않음)
+class ThrottleAwareRetry(Retry):
+    def is_retry(self, method, status_code, has_retry_after=False):
+        if rate_limiter is not None and status_code in API_THROTTLE_STATUS:
+            return False
+        return super().is_retry(method, status_code, has_retry_after)
+
+
+# connection pool을 사용하는 HTTP session
+# 같은 host로의 요청은 TCP/TLS connection을 재사용하고, timeout을 지정하지 않은 요청에는
+# session의 기본 timeout (connect, read)을 적용함
+class HttpSession(requests.Session):
+    def __init__(
+        self,
+        pool_size=HTTP_POOL_SIZE,
+        keep_alive=HTTP_KEEP_ALIVE,
+        connect_timeout=HTTP_CONNECT_TIMEOUT,
+        read_timeout=HTTP_READ_TIMEOUT,
+        max_retries=HTTP_MAX_RETRIES,
+        retry_backoff=HTTP_RETRY_BACKOFF,
+    ):
+        super().__init__()
+        self.timeout = (connect_timeout, read_timeout)
+
+        # POST 등 멱등하지 않은 요청은 재시도하지 않음
+        retry = ThrottleAwareRetry(
+            total=max_retries,
+            connect=max_retries,
+            read=max_retries,
+            status=max_retries,
+            backoff_factor=retry_backoff,
+            status_forcelist=(502, 503, 504),
+            allowed_methods=frozenset(["GET", "HEAD", "OPTIONS"]),
+            raise_on_status=False,
+            # 429 응답은 재시도하지 않고 돌려받아 send_request()에서 속도 제한과 함께 처리
+            respect_retry_after_header=False,
+        )
+        adapter = HTTPAdapter(
+            pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retry
+        )
+        self.mount("https://", adapter)
+        self.mount("http://", adapter)
+
+        if not keep_alive:
+            self.headers["Connection"] = "close"
+
+    def request(self, method, url, **kwargs):
+        if kwargs.get("timeout") is None:
+            kwargs["timeout"] = self.timeout
+        return super().request(method, url, **kwargs)
+
+
+# open api 요청 관찰자 (요청 시작/종료 시점에 호출됨)
+# 상속하여 필요한 메서드만 구현하고 add_request_observer()로 등록
+# SDK는 관찰자가 무엇을 기록하는지 알지 못하므로 prometheus_client 등이 없어도 동작함
+class RequestObserver:
+    # 요청 시작, command는 SDK 함수 이름 (예: list_lb_server)
+    def request_started(self, command, method):
+        pass
+
+    # 요청 종료, 응답을 받지 못하면 status_code는 None이고 error에 예외가 전달됨
+    def request_finished(
+        self, command, method, status_code, elapsed, response_size, error=None
+    ):
+        pass
+
+
+# 등록된 요청 관찰자 목록
+request_observers = []
+
+
+# 요청 관찰자 등록
+def add_request_observer(observer):
+    if observer not in request_observers:
+        request_observers.append(observer)
+
+
+# 요청 관찰자 등록 해제
+def remove_request_observer(observer):
+    if observer in request_observers:
+        request_observers.remove(observer)
+
+
+# 관찰자 호출, 관찰자의 오류는 API 호출 결과에 영향을 주지 않도록 무시
+def _notify_request_observers(name, *args, **kwargs):
+    for observer in list(request_observers):
+        try:
+            getattr(observer, name)(*args, **kwargs)
+        except Exception:
+            pass
+
+
+# 요청 deadline (time.monotonic() 기준 시각), deadline() 블록 안에서 보내는 모든 open api 요청에 적용
+# contextvars로 전달되므로 context를 복사해 실행하는 작업 스레드와 asyncio task에도 적용됨
+_request_deadline = contextvars.ContextVar("kcl_request_deadline", default=None)
+
+
+# deadline이 지나 open api 요청을 보내지 않았거나 속도 제한 대기를 포기한 경우
+class DeadlineExceeded(Exception):
+    pass
+
+
+# with 블록 안의 요청 deadline을 지금부터 seconds초 뒤로 설정 (바깥 deadline이 더 이르면 그대로 유지)
+# 블록 안의 요청은 timeout이 남은 시간으로 제한되고, deadline이 지나면 DeadlineExceeded 발생
+# Example:
+#   with ku.deadline(50):
+#       lb_list = nw.list_lb_info()
+@contextmanager
+def deadline(seconds):
+    at = time.monotonic() + seconds
+    current = _request_deadline.get()
+    if current is not None:
+        at = min(at, current)
+    token = _request_deadline.set(at)
+    try:
+        yield at
+    finally:
+        _request_deadline.reset(token)
+
+
+# deadline까지 남은 시간 (초), deadline이 없으면 None (지난 경우 0 이하)
+def remaining_time():
+    at = _request_deadline.get()
+    if at is None:
+        return None
+    return at - time.monotonic()
+
+
+# 요청을 보내기 전 deadline 확인, 남은 시간(초)이나 None을 return하고 이미 지났으면 DeadlineExceeded
+def check_deadline(func_name):
+    remaining = remaining_time()
+    if remaining is not None and remaining <= 0:
+        raise DeadlineExceeded(f"{func_name}(): deadline exceeded")
+    return remaining
+
+
+# requests timeout 값(초 또는 (connect, read))을 deadline까지 남은 시간 이하로 제한
+def limit_timeout(timeout, remaining):
+    if remaining is None:
+        return timeout
+    if timeout is None:
+        return remaining
+    if isinstance(timeout, tuple):
+        return tuple(remaining if t is None else min(t, remaining) for t in timeout)
+    return min(timeout, remaining)
+
+
+# 재시도 대기 시간 (지수 증가, 최대값 제한, equal jitter)
+# attempt는 0부터 시작하며 base, base*2, base*4 ... 중 0.5~1배 사이의 임의 값을 return
+# (full jitter와 달리 최소 절반은 기다리므로 오류 직후 바로 재시도하지 않음)
+def backoff_delay(attempt, base=API_BACKOFF_BASE, cap=API_BACKOFF_MAX):
+    delay = min(cap, base * (2 ** min(attempt, 30)))
+    return delay * random.uniform(0.5, 1.0)
+
+
+# open api 호출 속도 제한
+# - endpoint(SDK 함수 이름)별 token bucket으로 초당 요청 수를 제한
+#   quotas에 지정한 함수는 각자의 bucket을, 나머지는 "default" bucket을 공유
+# - AIMD로 bucket별 동시 요청 수를 조절 : 성공하면 늘리고(처음 제한에 걸리기 전까지는 빠르게),
+#   429/5xx 응답을 받으면 줄인 뒤 jitter를 적용한 지수 backoff 동안 새 요청을 보내지 않음
+# - 스레드와 asyncio 양쪽에서 사용
+#   동시 요청 수 제한에 걸리면 스레드는 Condition에서, coroutine은 future에서 release()를 기다림
+class RateLimiter:
+
+    # rate, burst : endpoint별 기본 초당 요청 수(0이면 제한 없음)와 bucket 크기
+    # quotas : {SDK 함수 이름: 초당 요청 수} 형식의 endpoint별 quota
+    # adaptive : False이면 동시 요청 수는 제한하지 않고 초당 요청 수 제한과 backoff만 적용
+    # initial_concurrency : AIMD 시작 동시 요청 수 (None이면 min_concurrency)
+    def __init__(
+        self,
+        rate=API_RATE_LIMIT,
+        burst=API_RATE_BURST,
+        quotas=None,
+        adaptive=True,
+        min_concurrency=API_MIN_CONCURRENCY,
+        max_concurrency=API_MAX_CONCURRENCY,
+        initial_concurrency=None,
+        decrease=API_CONCURRENCY_DECREASE,
+        backoff_base=API_BACKOFF_BASE,
+        backoff_max=API_BACKOFF_MAX,
+        throttle_retries=API_THROTTLE_RETRIES,
+    ):
+        self.rate = rate
+        self.burst = burst
+        self.quotas = dict(quotas or {})
+        self.adaptive = adaptive
+        self.min_concurrency = max(1, min_concurrency)
+        self.max_concurrency = max(self.min_concurrency, max_concurrency)
+        self.initial_concurrency = (
+            self.min_concurrency if initial_concurrency is None else initial_concurrency
+        )
+        self.decrease = decrease
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.throttle_retries = throttle_retries
+        self._lock = threading.Lock()
+        # release()로 동시 요청 자리가 나면 acquire()에서 대기 중인 스레드를 깨움
+        self._released = threading.Condition(self._lock)
+        self._buckets = {}
+
+    # 요청 command가 사용하는 bucket 이름
+    def bucket_name(self, command):
+        return command if command in self.quotas else "default"
+
+    def _bucket(self, name, now):
+        bucket = self._buckets.get(name)
+        if bucket is None:
+            rate = self.quotas.get(name, self.rate)
+            bucket = {
+                "rate": rate,
+                "tokens": float(self.burst if rate > 0 else 0),
+                "updated": now,
+                "limit": float(
+                    min(max(self.initial_concurrency, self.min_concurrency), self.max_concurrency)
+                ),
+                "slow_start": True,  # 처음 제한에 걸리기 전까지 동시 요청 수를 빠르게 늘림
+                "in_flight": 0,
+                "blocked_until": 0.0,
+                "failures": 0,  # 연속된 429/5xx 응답 횟수 (backoff 계산)
+                "recovering": 0,  # 마지막 제한 시점에 이미 보낸 요청 중 응답을 받지 않은 수
+                "throttle_events": {},  # 상태 코드별 429/5xx 응답 횟수
+                "wait_seconds": 0.0,  # 속도 제한으로 대기한 누적 시간
+                "requests": 0,
+                "waiters": [],  # 동시 요청 수 제한으로 release()를 기다리는 coroutine의 future
+            }
+            self._buckets[name] = bucket
+        return bucket
+
+    # 요청 하나를 보낼 수 있으면 자리를 차지하고 0을, 아니면 기다릴 시간(초)을 return
+    # 동시 요청 수 제한에 걸리면 None을 return 하고, waiter(asyncio future)를 넘겼으면
+    # 다음 release() 때 완료되도록 등록
+    def reserve(self, command, waiter=None):
+        with self._lock:
+            return self._reserve(command, time.monotonic(), waiter)
+
+    def _reserve(self, command, now, waiter=None):
+        bucket = self._bucket(self.bucket_name(command), now)
+        if now < bucket["blocked_until"]:
+            return bucket["blocked_until"] - now
+        if self.adaptive and bucket["in_flight"] >= int(bucket["limit"]):
+            if waiter is not None:
+                bucket["waiters"].append(waiter)
+            return None
+        if bucket["rate"] > 0:
+            bucket["tokens"] = min(
+                self.burst,
+                bucket["tokens"] + (now - bucket["updated"]) * bucket["rate"],
+            )
+            bucket["updated"] = now
+            if bucket["tokens"] < 1:
+                return (1 - bucket["tokens"]) / bucket["rate"]
+            bucket["tokens"] -= 1
+        bucket["in_flight"] += 1
+        bucket["requests"] += 1
+        return 0
+
+    # 속도 제한으로 대기한 시간을 누적 (metric용)
+    def record_wait(self, command, seconds):
+        with self._lock:
+            self._bucket(self.bucket_name(command), time.monotonic())[
+                "wait_seconds"
+            ] += seconds
+
+    # 스레드에서 요청 자리를 얻을 때까지 대기
+    # 요청 deadline 전에 자리를 얻을 수 없으면 DeadlineExceeded
+    def acquire(self, command):
+        start = time.monotonic()
+        with self._released:
+            while True:
+                now = time.monotonic()
+                wait = self._reserve(command, now)
+                if wait == 0:
+                    break
+                if wait is None:
+                    # 동시 요청 수 제한은 다른 요청의 release()까지 대기 (deadline까지만)
+                    remaining = remaining_time()
+                    if remaining is not None and remaining <= 0:
+                        raise DeadlineExceeded(
+                            f"{command}(): deadline exceeded while rate limited"
+                        )
+                    self._released.wait(remaining)
+                    continue
+                self.check_wait(command, wait)
+                self._released.wait(wait)
+            if now > start:
+                self._bucket(self.bucket_name(command), now)["wait_seconds"] += (
+                    now - start
+                )
+
+    # 대기 후에는 요청 deadline이 지나는 경우 DeadlineExceeded
+    def check_wait(self, command, wait):
+        remaining = remaining_time()
+        if remaining is not None and wait >= remaining:
+            raise DeadlineExceeded(f"{command}(): deadline exceeded while rate limited")
+
+    # 동시 요청 자리가 났으므로 대기 중인 스레드와 coroutine을 깨움 (lock을 잡은 상태에서 호출)
+    def _notify_released(self, bucket):
+        self._released.notify_all()
+        for waiter in bucket["waiters"]:
+            if not waiter.done():
+                waiter.get_loop().call_soon_threadsafe(_wake_waiter, waiter)
+        bucket["waiters"].clear()
+
+    # 요청 종료, 응답 상태 코드에 따라 동시 요청 수와 backoff 조정
+    # status_code가 None이면 (connection 오류 등) 조정 없이 자리만 반환
+    # retry_after는 429 응답의 Retry-After 헤더 값 (초)
+    def release(self, command, status_code, retry_after=None):
+        now = time.monotonic()
+        with self._lock:
+            bucket = self._bucket(self.bucket_name(command), now)
+            bucket["in_flight"] -= 1
+            self._notify_released(bucket)
+            # 마지막 제한 전에 보낸 요청의 응답은 줄이기 전의 동시 요청 수에 대한 결과
+            recovering = bucket["recovering"] > 0
+            if recovering:
+                bucket["recovering"] -= 1
+            if status_code is None:
+                return
+            if status_code not in API_THROTTLE_STATUS:
+                # additive increase - 동시 요청 수만큼 성공하면 1 증가 (slow start는 성공마다 1 증가)
+                bucket["failures"] = 0
+                if not self.adaptive or recovering:
+                    return
+                step = 1 if bucket["slow_start"] else 1 / bucket["limit"]
+                bucket["limit"] = min(self.max_concurrency, bucket["limit"] + step)
+                return
+
+            events = bucket["throttle_events"]
+            events[status_code] = events.get(status_code, 0) + 1
+            bucket["slow_start"] = False
+            # 한 번의 제한에 동시 요청 수를 연달아 줄이거나 backoff를 늘리지 않도록
+            # 제한 전에 보낸 요청들의 429/5xx 응답은 횟수만 기록
+            if recovering:
+                return
+            # multiplicative decrease
+            # 동시 요청 수를 조절하면 첫 제한은 줄이는 것으로 충분하고, 연속으로 제한되면 backoff
+            delay = 0.0
+            if self.adaptive:
+                bucket["limit"] = max(
+                    self.min_concurrency, bucket["limit"] * self.decrease
+                )
+            if bucket["failures"] or not self.adaptive:
+                delay = backoff_delay(
+                    bucket["failures"], self.backoff_base, self.backoff_max
+                )
+            if retry_after is not None:
+                delay = max(delay, min(retry_after, self.backoff_max))
+            bucket["failures"] += 1
+            bucket["blocked_until"] = now + delay
+            bucket["recovering"] = bucket["in_flight"]
+
+    # bucket별 현재 상태 (metric 노출용, adaptive가 아니면 concurrency_limit은 None)
+    def stats(self):
+        with self._lock:
+            return {
+                name: {
+                    "rate": bucket["rate"],
+                    "concurrency_limit": bucket["limit"] if self.adaptive else None,
+                    "in_flight": bucket["in_flight"],
+                    "throttle_events": dict(bucket["throttle_events"]),
+                    "wait_seconds": bucket["wait_seconds"],
+                    "requests": bucket["requests"],
+                    "blocked": time.monotonic() < bucket["blocked_until"],
+                }
+                for name, bucket in self._buckets.items()
+            }
+
+
+# release()를 기다리던 coroutine의 future 완료 (future의 event loop에서 실행)
+def _wake_waiter(waiter):
+    if not waiter.done():
+        waiter.set_result(None)
+
+
+# 모든 open api 호출에 적용할 RateLimiter (None이면 속도 제한 없음)
+rate_limiter = None
+
+
+# 속도 제한 등록, None을 넘기면 해제
+def set_rate_limiter(limiter):
+    global rate_limiter
+    rate_limiter = limiter
+
+
+# 429 응답의 Retry-After 헤더 값 (초), 없거나 숫자가 아니면 None
+def get_retry_after(headers):
+    value = headers.get("Retry-After") if headers else None
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+# HTTP 요청 전송, 등록된 요청 관찰자에게 소요 시간/상태 코드/응답 크기를 전달
+# session은 HttpSession 또는 requests 모듈
+# RateLimiter가 등록되어 있으면 속도 제한에 맞춰 대기
+# 429 응답은 Retry-After(또는 backoff)만큼 기다린 뒤 API_THROTTLE_RETRIES만큼 재시도
+# deadline() 블록 안이면 timeout을 남은 시간으로 제한하고, 이미 지났으면 보내지 않고 DeadlineExceeded
+def send_request(func_name, session, cmd, url, **kwargs):
+    limiter = rate_limiter
+    retries = API_THROTTLE_RETRIES if limiter is None else limiter.throttle_retries
+    # timeout을 지정하지 않으면 session 기본값 (requests 모듈이면 HTTP_CONNECT_TIMEOUT, HTTP_READ_TIMEOUT)
+    timeout = kwargs.pop("timeout", None)
+    if timeout is None:
+        timeout = getattr(
+            session, "timeout", (HTTP_CONNECT_TIMEOUT, HTTP_READ_TIMEOUT)
+        )
+    attempt = 0
+    while True:
+        kwargs["timeout"] = limit_timeout(timeout, check_deadline(func_name))
+        if limiter is None:
+            response = _send_observed_request(func_name, session, cmd, url, **kwargs)
+        else:
+            limiter.acquire(func_name)
+            response = None
+            try:
+                response = _send_observed_request(
+                    func_name, session, cmd, url, **kwargs
+                )
+            finally:
+                limiter.release(
+                    func_name,
+                    None if response is None else response.status_code,
+                    None if response is None else get_retry_after(response.headers),
+                )
+        if response.status_code != 429 or attempt >= retries:
+            return response
+        if limiter is None:
+            # 속도 제한이 없으면 Retry-After (없으면 backoff) 만큼 대기 후 재시도
+            wait = min(
+                get_retry_after(response.headers) or backoff_delay(attempt),
+                API_BACKOFF_MAX,
+            )
+            remaining = remaining_time()
+            if remaining is not None and wait >= remaining:
+                return response
+            time.sleep(wait)
+        # 재시도하는 응답은 닫아서 connection을 pool에 돌려줌 (stream=True이면 본문을 읽지 않은 상태)
+        response.close()
+        attempt += 1
+
+
+def _send_observed_request(func_name, session, cmd, url, **kwargs):
+    if not request_observers:
+        return session.request(cmd.upper(), url, **kwargs)
+
+    _notify_request_observers("request_started", func_name, cmd)
+    start = time.perf_counter()
+    try:
+        response = session.request(cmd.upper(), url, **kwargs)
+    except Exception as e:
+        _notify_request_observers(
+            "request_finished",
+            func_name,
+            cmd,
+            None,
+            time.perf_counter() - start,
+            0,
+            error=e,
+        )
+        raise
+
+    size = len(response.content) if not kwargs.get("stream") else 0
+    _notify_request_observers(
+        "request_finished",
+        func_name,
+        cmd,
+        response.status_code,
+        time.perf_counter() - start,
+        size,
+    )
+    return response
+
+
+# zone_mgr에 session이 있으면 session을, 없으면 requests 모듈을 return
+def get_http_session(zone_mgr):
+    session = getattr(zone_mgr, "session", None)
+    if session is None:
+        return requests
+    return session
+
+
+# zone_mgr의 token으로 open api 호출
+# 401 응답을 받으면 token을 즉시 재발급(single-flight)하고 한 번만 다시 호출
+def send_auth_request(func_name, zone_mgr, cmd, url, headers, **kwargs):
+    session = get_http_session(zone_mgr)
+    response = send_request(func_name, session, cmd, url, headers=headers, **kwargs)
+
+    refresh_token = getattr(zone_mgr, "refresh_token", None)
+    token = headers.get("X-Auth-Token") if headers else None
+    if response.status_code != 401 or refresh_token is None or token is None:
+        return response
+
+    response.close()
+    headers = dict(headers)
+    headers["X-Auth-Token"] = refresh_token(token)
+    return send_request(func_name, session, cmd, url, headers=headers, **kwargs)
+
+
+_json_whitespace = re.compile(r"[ \t\n\r]*")
+
+
+# JSON 응답 본문을 chunk 단위로 받아 path 위치 배열의 항목을 하나씩 꺼내는 incremental parser
+# 본문 전체나 전체 dict tree를 만들지 않고 아직 완성되지 않은 항목 크기의 buffer만 유지
+# path : 배열까지의 key (예: ("listloadbalancerwebserversresponse", "loadbalancerwebserver"))
+# parse_item을 지정하면 항목마다 변환한 값을 return
+# 배열과 같은 object의 다른 값(count, success 등)은 fields에 보관 (배열 뒤의 값은 close() 이후 확인)
+class JsonArrayStream:
+    def __init__(self, path, parse_item=None):
+        self._path = path
+        self._parse_item = parse_item
+        self._text_decoder = codecs.getincrementaldecoder("utf-8")()
+        self._decoder = json.JSONDecoder()
+        self._buffer = ""
+        self._pos = 0
+        self._depth = 0  # 현재 읽고 있는 object의 path 위치
+        self._state = "object"  # object, key, colon, value, items, done
+        self._key = None
+        self.fields = {}
+
+    # 본문 chunk(bytes)를 추가하고 새로 완성된 항목 목록 return
+    def feed(self, chunk):
+        self._buffer = self._buffer[self._pos :] + self._text_decoder.decode(chunk)
+        self._pos = 0
+        return self._parse(final=False)
+
+    # 본문 끝, 남은 항목 목록 return, path의 object를 끝까지 읽지 못했으면 ValueError 발생
+    def close(self):
+        self._buffer = self._buffer[self._pos :] + self._text_decoder.decode(
+            b"", final=True
+        )
+        self._pos = 0
+        items = self._parse(final=True)
+        if self._state != "done":
+            raise ValueError(f"incomplete JSON response, path={self._path}")
+        return items
+
+    # fields를 원래 응답과 같은 구조로 return (배열은 제외), 예: {"listloadbalancersresponse": {"count": 0}}
+    def document(self):
+        doc = self.fields
+        for key in reversed(self._path[:-1]):
+            doc = {key: doc}
+        return doc
+
+    # buffer의 pos 위치에서 JSON 값 하나를 읽어 (값, 끝 위치) return
+    # 값이 buffer 끝에서 끝나거나 뒤에 숫자 문자가 이어지면 숫자가 chunk 경계에서 잘린 것일 수 있으므로
+    # 본문 끝이 아닌 한 None (다음 chunk를 받은 뒤 다시 읽음)
+    def _decode(self, pos, final):
+        try:
+            value, end = self._decoder.raw_decode(self._buffer, pos)
+        except json.JSONDecodeError:
+            if final:
+                raise
+            return None
+        if not final and (
+            end == len(self._buffer) or self._buffer[end] in "0123456789+-.eE"
+        ):
+            return None
+        return value, end
+
+    def _parse(self, final):
+        items = []
+        buf = self._buffer
+        last = len(self._path) - 1
+        while self._state != "done":
+            pos = _json_whitespace.match(buf, self._pos).end()
+            self._pos = pos
+            if pos >= len(buf):
+                break
+            char = buf[pos]
+            state = self._state
+
+            if state == "object":
+                if char != "{":
+                    raise ValueError(f"JSON object expected, path={self._path}")
+                self._pos = pos + 1
+                self._state = "key"
+            elif state == "key":
+                if char == ",":
+                    self._pos = pos + 1
+                elif char == "}":
+                    # 배열을 포함한 object의 끝 (path가 없는 응답이면 해당 object의 끝)
+                    self._pos = pos + 1
+                    self._state = "done"
+                else:
+                    decoded = self._decode(pos, final)
+                    if decoded is None:
+                        break
+                    self._key, self._pos = decoded
+                    self._state = "colon"
+            elif state == "colon":
+                if char != ":":
+                    raise ValueError(f"':' expected, path={self._path}")
+                self._pos = pos + 1
+                self._state = "value"
+            elif state == "value":
+                if self._key == self._path[self._depth] and self._depth < last:
+                    if char != "{":
+                        raise ValueError(f"JSON object expected, path={self._path}")
+                    self._depth += 1
+                    self._pos = pos + 1
+                    self._state = "key"
+                elif self._key == self._path[self._depth]:
+                    if char != "[":
+                        raise ValueError(f"JSON array expected, path={self._path}")
+                    self._pos = pos + 1
+                    self._state = "items"
+                else:
+                    # path가 아닌 값은 건너뜀 (배열과 같은 object의 값은 fields에 보관)
+                    decoded = self._decode(pos, final)
+                    if decoded is None:
+                        break
+                    value, self._pos = decoded
+                    if self._depth == last:
+                        self.fields[self._key] = value
+                    self._state = "key"
+            else:
+                if char == ",":
+                    self._pos = pos + 1
+                elif char == "]":
+                    self._pos = pos + 1
+                    self._state = "key"
+                else:
+                    decoded = self._decode(pos, final)
+                    if decoded is None:
+                        break
+                    item, self._pos = decoded
+                    if self._parse_item is not None:
+                        item = self._parse_item(item)
+                    items.append(item)
+        return items
+
+
+# 응답 본문을 STREAM_CHUNK_SIZE씩 읽으면서 stream(JsonArrayStream)이 꺼낸 항목을 하나씩 return
+# 다 읽거나 중단하면 response를 닫아 connection을 pool에 돌려줌
+def iter_response_items(response, stream):
+    try:
+        for chunk in response.iter_content(STREAM_CHUNK_SIZE):
+            yield from stream.feed(chunk)
+        yield from stream.close()
+    finally:
+        response.close()
+
+
 # open api 호출 및 log 저장
+# stream=True이면 본문을 읽지 않은 응답을 return (iter_response_items()로 읽음)
 def request_api(
-    func_name, cmd, url, headers, zone_mgr, params=None, body=None, **kwargs
+    func_name,
+    cmd,
+    url,
+    headers,
+    zone_mgr,
+    params=None,
+    body=None,
+    stream=False,
+    **kwargs,
 ):
     kwargs = kwargs.copy()
-    if cmd == "post":
-        response = requests.post(url, headers=headers, params=params, json=body)
-    elif cmd == "get":
-        response = requests.get(url, headers=headers, params=params, json=body)
-    elif cmd == "delete":
-        response = requests.delete(url, headers=headers, params=params, json=body)
+    response = send_auth_request(
+        func_name, zone_mgr, cmd, url, headers, params=params, json=body, stream=stream
+    )
 
     code = response.status_code
     kwargs["code"] = code
     if code >= 200 and code < 210:
         # 성공 log
-        log_str = dict_to_string(kwargs)
-        message = f"{func_name}() : success, {log_str}"
-        zone_mgr.info_log(message)
+        log_api_result(zone_mgr, func_name, True, kwargs)
     else:
         # 실패 log
         res = response.text
-        if len(res) == 0:
-            log_str = dict_to_string(kwargs)
-            message = f"{func_name}() : fail, {log_str}"
-            zone_mgr.error_log(message)
-        else:
-            res = response.json()
-            kwargs["res"] = res
-            log_str = dict_to_string(kwargs)
-            message = f"{func_name}() : fail, {log_str}"
-            zone_mgr.error_log(message)
+        if len(res) != 0:
+            kwargs["res"] = response.json()
+        log_api_result(zone_mgr, func_name, False, kwargs)
 
     return response
 
 
 # LB관련 open api 호출 및 log 저장
+# timeout을 지정하면 해당 시간(초) 안에 응답이 없을 경우 requests 예외 발생
 def request_lb_api(
-    func_name, cmd, url, headers, zone_mgr, res_key, body=None, **kwargs
+    func_name, cmd, url, headers, zone_mgr, res_key, body=None, timeout=None, **kwargs
 ):
-    kwargs = kwargs.copy()
-    if cmd == "post":
-        response = requests.post(url, headers=headers, json=body)
-    elif cmd == "get":
-        response = requests.get(url, headers=headers, json=body)
-    elif cmd == "delete":
-        response = requests.delete(url, headers=headers, json=body)
+    response = send_auth_request(
+        func_name, zone_mgr, cmd, url, headers, json=body, timeout=timeout
+    )
+    return response, check_lb_response(func_name, response, zone_mgr, res_key, **kwargs)
+
+
+# LB관련 open api를 호출하고 응답 본문을 읽으면서 item_key 배열의 항목을 parse_item으로 변환하여
+# 하나씩 return하는 generator를 return (stream 모드)
+# 응답 상태 코드가 실패이면 check_lb_response()와 같이 log를 남기고 None return,
+# 본문의 success가 False이면 본문을 모두 읽은 뒤 실패 log를 남기고 예외 발생
+def request_lb_api_stream(
+    func_name,
+    cmd,
+    url,
+    headers,
+    zone_mgr,
+    res_key,
+    item_key,
+    parse_item,
+    timeout=None,
+    **kwargs,
+):
+    response = send_auth_request(
+        func_name, zone_mgr, cmd, url, headers, timeout=timeout, stream=True
+    )
+    if not (200 <= response.status_code < 210):
+        check_lb_response(func_name, response, zone_mgr, res_key, **kwargs)
+        response.close()
+        return None
+    return _iter_lb_items(
+        func_name, response, zone_mgr, res_key, item_key, parse_item, kwargs
+    )
 
+
+def _iter_lb_items(func_name, response, zone_mgr, res_key, item_key, parse_item, kwargs):
+    stream = JsonArrayStream((res_key, item_key), parse_item)
+    yield from iter_response_items(response, stream)
+
+    kwargs = dict(kwargs, code=response.status_code)
+    if stream.fields.get("success", True) == True:
+        log_api_result(zone_mgr, func_name, True, kwargs, sep=": ")
+    else:
+        kwargs["res"] = stream.document()
+        log_api_result(zone_mgr, func_name, False, kwargs, sep=": ")
+        raise Exception(f"{func_name}(): fail, success=False")
+
+
+# LB관련 open api 응답의 성공 여부 확인 및 log 저장
+# response는 status_code, text, json()을 가진 응답 객체 (kclasync의 비동기 응답도 사용)
+def check_lb_response(func_name, response, zone_mgr, res_key, **kwargs):
+    kwargs = kwargs.copy()
     code = response.status_code
     success = False
     kwargs["code"] = code
@@ -2430,61 +3562,37 @@ def request_lb_api(
         if "success" in info:
             if info["success"] == True:
                 # 성공
-                log_str = dict_to_string(kwargs)
-                message = f"{func_name}(): success, {log_str}"
-                zone_mgr.info_log(message)
                 success = True
             else:
                 # 실패
                 kwargs["res"] = res
-                log_str = dict_to_string(kwargs)
-                message = f"{func_name}(): fail, {log_str}"
-                zone_mgr.error_log(message)
         else:
             # 성공
-            log_str = dict_to_string(kwargs)
-            message = f"{func_name}(): success, {log_str}"
-            zone_mgr.info_log(message)
             success = True
+        log_api_result(zone_mgr, func_name, success, kwargs, sep=": ")
     else:
         # 실패 log
         res = response.text
-        if len(res) == 0:
-            log_str = dict_to_string(kwargs)
-            message = f"{func_name}() : fail, {log_str}"
-            zone_mgr.error_log(message)
-        else:
-            res = response.json()
-            kwargs["res"] = res
-            log_str = dict_to_string(kwargs)
-            message = f"{func_name}() : fail, {log_str}"
-            zone_mgr.error_log(message)
+        if len(res) != 0:
+            kwargs["res"] = response.json()
+        log_api_result(zone_mgr, func_name, False, kwargs)
 
-    return response, success
+    return success
 
 
 # job_id를 기반으로 비동기 처리 API request
 def request_net_api(func_name, cmd, url, headers, zone_mgr, body=None, **kwargs):
     kwargs = kwargs.copy()
-    if cmd == "post":
-        response = requests.post(url, headers=headers, json=body)
-    elif cmd == "get":
-        response = requests.get(url, headers=headers, json=body)
-    elif cmd == "delete":
-        response = requests.delete(url, headers=headers, json=body)
+    response = send_auth_request(func_name, zone_mgr, cmd, url, headers, json=body)
 
     res = response.json()
 
     if res["httpStatus"] == 202 or res["httpStatus"] == 201:
-        log_str = dict_to_string(kwargs)
-        message = f"{func_name}(): success, {log_str}"
-        zone_mgr.info_log(message)
+        log_api_result(zone_mgr, func_name, True, kwargs, sep=": ")
         return res["jobId"]
     else:
         kwargs["res"] = res
-        log_str = dict_to_string(kwargs)
-        message = f"{func_name}(): fail, {log_str}"
-        zone_mgr.error_log(message)
+        log_api_result(zone_mgr, func_name, False, kwargs, sep=": ")
         return None
 
 
@@ -2758,9 +3866,175 @@ def find_duplicates_server_list(lb_list):
     return find_duplicates_str(server_list)
 
 
-def validate_change_vm_list(key_vm_list, flavor_list, old_vm_list):
+# validate_* 함수에서 기존 자원 목록(VM, LB, IP, subnet, firewall 등)을 조회하기 위한 index
+# 목록과 key별로 처음 조회할 때 한 번만 index를 만들고 이후 조회는 O(1)
+# 결과는 check_exist_in_dict_list, get_value_in_dict_list 등 목록을 순회하는 함수와 동일하며,
+# index로 찾을 수 없는 경우(key가 없는 항목, hash 불가능한 값)는 해당 함수를 그대로 사용
+class ValidationContext:
+    def __init__(self):
+        # (id(목록), key) -> (목록, key 값 -> 항목 list, 모든 항목에 key가 있는지 여부)
+        self._indexes = {}
+        self._fixed_ips = {}
+        self._acl_indexes = {}
+
+    def _index(self, data_list, key):
+        cached = self._indexes.get((id(data_list), key))
+        if cached is not None:
+            return cached[1], cached[2]
+
+        index = defaultdict(list)
+        complete = True
+        try:
+            for item in data_list:
+                if key not in item:
+                    complete = False
+                index[item.get(key)].append(item)
+            index.default_factory = None
+        except TypeError:
+            index = None
+        # 목록을 함께 보관하여 id가 다른 목록에 재사용되지 않도록 함
+        self._indexes[(id(data_list), key)] = (data_list, index, complete)
+        return index, complete
+
+    # key 값이 value인 항목 list (목록 순서), index로 찾을 수 없으면 None
+    # strict : item[key]로 비교하는 함수용, key가 없는 항목이 있으면 None
+    def _matches(self, key, value, data_list, strict=True):
+        index, complete = self._index(data_list, key)
+        if index is None or (strict and not complete):
+            return None
+        try:
+            return index.get(value, [])
+        except TypeError:
+            return None
+
+    def exists(self, target_key, target_value, data_list):
+        matches = self._matches(target_key, target_value, data_list, strict=False)
+        if matches is None:
+            return check_exist_in_dict_list(target_key, target_value, data_list)
+        return len(matches) > 0
+
+    # strict가 False이면 key가 없는 항목은 값이 None인 것으로 비교 (d.get)
+    def items(self, cmp_key, cmp_value, data_list, strict=True):
+        matches = self._matches(cmp_key, cmp_value, data_list, strict)
+        if matches is None:
+            if strict:
+                return [item for item in data_list if item[cmp_key] == cmp_value]
+            return [item for item in data_list if item.get(cmp_key) == cmp_value]
+        return matches
+
+    def get_value(self, cmp_key, cmp_value, ret_key, data_list):
+        matches = self._matches(cmp_key, cmp_value, data_list)
+        if matches is None:
+            return get_value_in_dict_list(cmp_key, cmp_value, ret_key, data_list)
+        if matches:
+            return matches[0][ret_key]
+        return None
+
+    def get_list(self, cmp_key, cmp_value, ret_key, data_list):
+        matches = self._matches(cmp_key, cmp_value, data_list)
+        if matches is None:
+            return get_list_in_dict_list(cmp_key, cmp_value, ret_key, data_list)
+        return [item[ret_key] for item in matches]
+
+    def get_value_two_key(
+        self, cmp_key1, cmp_value1, cmp_key2, cmp_value2, ret_key, data_list
+    ):
+        matches = self._matches(cmp_key1, cmp_value1, data_list)
+        if matches is None:
+            return get_value_in_dict_list_two_key(
+                cmp_key1, cmp_value1, cmp_key2, cmp_value2, ret_key, data_list
+            )
+        return get_value_in_dict_list_two_key(
+            cmp_key1, cmp_value1, cmp_key2, cmp_value2, ret_key, matches
+        )
+
+    def get_public_ip_type(self, public_ip, ip_list):
+        return self.get_value("publicip", public_ip, "type", ip_list)
+
+    def validate_fixed_ip(self, ip_addr, old_vm_list):
+        cached = self._fixed_ips.get(id(old_vm_list))
+        if cached is None:
+            try:
+                ips = {vm["subnets"][0]["privateip"] for vm in old_vm_list}
+            except (KeyError, IndexError, TypeError):
+                ips = None
+            cached = (old_vm_list, ips)
+            self._fixed_ips[id(old_vm_list)] = cached
+
+        ips = cached[1]
+        try:
+            if ips is not None:
+                return ip_addr not in ips
+        except TypeError:
+            pass
+        return validate_fixed_ip(ip_addr, old_vm_list)
+
+    # search_acl()과 같은 결과, 기존 ACL 중 net2net은 (src, dst) network 이름과
+    # src_cidr의 첫 번째 주소, static_nat, port_forward는 dst_cidr의 첫 번째 주소와
+    # 맞는 ACL만 후보로 검사
+    def search_acl(self, acl, fw_list):
+        try:
+            if acl["type"] == "net2net":
+                key = (
+                    "net2net",
+                    get_net_name(acl["src_net"]),
+                    get_net_name(acl["dst_net"]),
+                    acl["src_cidr"].split(",")[0].strip(),
+                )
+            elif acl["type"] == "static_nat" or acl["type"] == "port_forward":
+                key = ("dst", acl["dst_cidr"].split(",")[0].strip())
+            else:
+                return search_acl(acl, fw_list)
+            hash(key)
+        except Exception:
+            return search_acl(acl, fw_list)
+
+        buckets, always = self._acl_index(fw_list)
+        positions = buckets.get(key, [])
+        if always:
+            positions = sorted(set(positions).union(always))
+        return search_acl(acl, [fw_list[i] for i in positions])
+
+    # 기존 ACL 목록의 위치 index, 이름을 읽을 수 없는 ACL은 항상 후보(always)에 포함
+    def _acl_index(self, fw_list):
+        cached = self._acl_indexes.get(id(fw_list))
+        if cached is not None:
+            return cached[1], cached[2]
+
+        buckets = defaultdict(list)
+        always = []
+        for i, fw in enumerate(fw_list):
+            try:
+                nets = ("net2net", fw["src_nets"][0]["name"], fw["dst_nets"][0]["name"])
+                keys = []
+                # check_cidr_match()에서 'all'은 '0.0.0.0/0'과 같음
+                for addr in fw["src_addrs"]:
+                    keys.append(nets + (addr["name"],))
+                    if addr["name"] == "all":
+                        keys.append(nets + ("0.0.0.0/0",))
+                for addr in fw["dst_addrs"]:
+                    keys.append(("dst", addr["name"]))
+                    if addr["name"] == "all":
+                        keys.append(("dst", "0.0.0.0/0"))
+                for key in keys:
+                    hash(key)
+            except Exception:
+                always.append(i)
+                continue
+            for key in keys:
+                if not buckets[key] or buckets[key][-1] != i:
+                    buckets[key].append(i)
+
+        buckets.default_factory = None
+        self._acl_indexes[id(fw_list)] = (fw_list, buckets, always)
+        return buckets, always
+
+
+def validate_change_vm_list(key_vm_list, flavor_list, old_vm_list, context=None):
     result = True
     msg_list = []
+    if context is None:
+        context = ValidationContext()
 
     if len(key_vm_list) == 0:
         msg = "내용이 비어 있습니다."
@@ -2782,12 +4056,12 @@ def validate_change_vm_list(key_vm_list, flavor_list, old_vm_list):
             append_msg_list(msg_list, key, msg)
             return False, msg_list
 
-        if not check_exist_in_dict_list("vm_name", vm["name"], old_vm_list):
+        if not context.exists("vm_name", vm["name"], old_vm_list):
             msg = f"""'{vm["name"]}'은 기존에 생성된 VM이 아닙니다."""
             append_msg_list(msg_list, key, msg)
             result = False
 
-        if not check_exist_in_dict_list("flavor_name", vm["flavor"], flavor_list):
+        if not context.exists("flavor_name", vm["flavor"], flavor_list):
             result = False
             msg = (
                 f"""'{vm["name"]}'에서 '{vm["flavor"]}'논 존재하지 않는 flavor입니다."""
@@ -2809,9 +4083,11 @@ def validate_change_vm_list(key_vm_list, flavor_list, old_vm_list):
     return result, msg_list
 
 
-def validate_change_lb_list(key_lb_list, old_lb_list, vm_list):
+def validate_change_lb_list(key_lb_list, old_lb_list, vm_list, context=None):
     result = True
     msg_list = []
+    if context is None:
+        context = ValidationContext()
 
     if len(key_lb_list) == 0:
         msg = "내용이 비어 있습니다."
@@ -2833,7 +4109,7 @@ def validate_change_lb_list(key_lb_list, old_lb_list, vm_list):
             append_msg_list(msg_list, key, msg)
             return False, msg_list
 
-        if not check_exist_in_dict_list("lb_name", lb["name"], old_lb_list):
+        if not context.exists("lb_name", lb["name"], old_lb_list):
             msg = f"""'{lb["name"]}'은 기존에 생성된 LB가 아닙니다."""
             append_msg_list(msg_list, key, msg)
             result = False
@@ -2852,7 +4128,7 @@ def validate_change_lb_list(key_lb_list, old_lb_list, vm_list):
             for vm_name in vm_name_list:
                 if vm_name.startswith("@res"):
                     continue
-                if not check_exist_in_dict_list("vm_name", vm_name, vm_list):
+                if not context.exists("vm_name", vm_name, vm_list):
                     result = False
                     msg = f"""'{lb["name"]}'에서 '{lb["server_list"]}'에 존재하지 않는 vm name이 있습니다."""
                     append_msg_list(msg_list, key, msg)
@@ -2908,9 +4184,12 @@ def validate_vm_list(
     old_vm_list,
     zone_name,
     action,
+    context=None,
 ):
     result = True
     msg_list = []
+    if context is None:
+        context = ValidationContext()
 
     if len(key_vm_list) == 0:
         msg = "내용이 비어 있습니다."
@@ -2937,7 +4216,7 @@ def validate_vm_list(
             append_msg_list(msg_list, key, msg)
             return False, msg_list
 
-        if check_exist_in_dict_list("vm_name", vm["name"], old_vm_list):
+        if context.exists("vm_name", vm["name"], old_vm_list):
             msg = f"""'{vm["name"]}'은 기존 생성된 VM 이름과 중복됩니다."""
             append_msg_list(msg_list, key, msg)
             key_vm["state"] = "created"
@@ -2954,14 +4233,14 @@ def validate_vm_list(
             msg = f"""'{vm["name"]}'에서 '{vm["key"]}'은 잘못된 key name입니다. 영문자, 숫자, '-'로 구성되며, 첫글자는 영문자여야 합니다."""
             append_msg_list(msg_list, key, msg)
 
-        if not check_exist_in_dict_list("flavor_name", vm["flavor"], flavor_list):
+        if not context.exists("flavor_name", vm["flavor"], flavor_list):
             result = False
             msg = (
                 f"""'{vm["name"]}'에서 '{vm["flavor"]}'논 존재하지 않는 flavor입니다."""
             )
             append_msg_list(msg_list, key, msg)
 
-        if not check_exist_in_dict_list("subnet_name", vm["subnet"], subnet_list):
+        if not context.exists("subnet_name", vm["subnet"], subnet_list):
             result = False
             msg = f"""'{vm["name"]}'에서 '{vm["subnet"]}'논 존재하지 않는 Subnet 입니다."""
             append_msg_list(msg_list, key, msg)
@@ -2970,7 +4249,7 @@ def validate_vm_list(
         if image_name == None:
             image_name = vm["image"]
 
-        if not check_exist_in_dict_list("image_name", image_name, image_list):
+        if not context.exists("image_name", image_name, image_list):
             result = False
             msg = (
                 f"""'{vm["name"]}'에서 '{vm["image"]}'논 존재하지 않는 Image 입니다."""
@@ -2986,7 +4265,9 @@ def validate_vm_list(
 
         if "fixed_ip" in vm:
             ip_addr = vm["fixed_ip"]
-            dicts = [d for d in subnet_list if d.get("subnet_name") == vm["subnet"]]
+            dicts = context.items(
+                "subnet_name", vm["subnet"], subnet_list, strict=False
+            )
             start_ip = dicts[0]["startip"]
             end_ip = dicts[0]["endip"]
 
@@ -2997,7 +4278,7 @@ def validate_vm_list(
                 append_msg_list(msg_list, key, msg)
 
             # 기존 VM ip주소와 중복 확인
-            if not validate_fixed_ip(ip_addr, old_vm_list):
+            if not context.validate_fixed_ip(ip_addr, old_vm_list):
                 result = False
                 msg = f"""'{vm["name"]}'에서 '{vm["fixed_ip"]}' fixed_ip가 기존 VM IP와 중복됩니다."""
                 append_msg_list(msg_list, key, msg)
@@ -3044,14 +4325,14 @@ def validate_vm_list(
                     append_msg_list(msg_list, key, msg)
 
                 if disk["source_type"] == "snapshot":
-                    if not check_exist_in_dict_list(
+                    if not context.exists(
                         "snapshot_name", disk["snapshot_name"], snapshot_list
                     ):
                         result = False
                         msg = f"""'{vm["name"]}'에서 '{disk["snapshot_name"]}'논 존재하지 않는 snapshot name 입니다."""
                         append_msg_list(msg_list, key, msg)
                     else:
-                        vol_size = get_value_in_dict_list(
+                        vol_size = context.get_value(
                             "snapshot_name",
                             disk["snapshot_name"],
                             "size",
@@ -3096,9 +4377,13 @@ def validate_vm_list(
 """
 
 
-def validate_lb_list(key_lb_list, subnet_list, vm_list, old_lb_list, action):
+def validate_lb_list(
+    key_lb_list, subnet_list, vm_list, old_lb_list, action, context=None
+):
     result = True
     msg_list = []
+    if context is None:
+        context = ValidationContext()
 
     if len(key_lb_list) == 0:
         msg = "내용이 비어 있습니다."
@@ -3132,7 +4417,7 @@ def validate_lb_list(key_lb_list, subnet_list, vm_list, old_lb_list, action):
             append_msg_list(msg_list, key, msg)
             return False, msg_list
 
-        if check_exist_in_dict_list("lb_name", lb["name"], old_lb_list):
+        if context.exists("lb_name", lb["name"], old_lb_list):
             msg = f"""'{lb["name"]}'은 기존 생성된 LB 이름과 중복됩니다."""
             append_msg_list(msg_list, key, msg)
             key_lb["state"] = "created"
@@ -3151,7 +4436,7 @@ def validate_lb_list(key_lb_list, subnet_list, vm_list, old_lb_list, action):
             msg = f"""'{lb["name"]}'에서 server_port '{service_port}'는 잘못된 값입니다."""
             append_msg_list(msg_list, key, msg)
 
-        if not check_exist_in_dict_list("subnet_name", lb["subnet"], subnet_list):
+        if not context.exists("subnet_name", lb["subnet"], subnet_list):
             result = False
             msg = f"""'{lb["name"]}'에서 '{lb["subnet"]}'논 존재하지 않는 Subnet 입니다."""
             append_msg_list(msg_list, key, msg)
@@ -3168,21 +4453,20 @@ def validate_lb_list(key_lb_list, subnet_list, vm_list, old_lb_list, action):
                     msg = f"""'{lb["name"]}'에서 '{lb["service_ip"]}'논 잘못된 IP주소 입니다."""
                     append_msg_list(msg_list, key, msg)
 
-                if not check_exist_in_dict_list(
-                    "service_ip", lb["service_ip"], old_lb_list
-                ):
+                if not context.exists("service_ip", lb["service_ip"], old_lb_list):
                     result = False
                     msg = f"""'{lb["name"]}'에서 '{lb["service_ip"]}'는 기존 LB에서 사용하고 있지 않는 IP입니다."""
                     append_msg_list(msg_list, key, msg)
                 else:
                     # serivce_ip, service_port의 기존 LB 중복 확인
-                    for old_lb in old_lb_list:
-                        if lb["service_ip"] == old_lb["service_ip"]:
-                            old_port = str_to_int(old_lb["service_port"])
-                            if lb["service_port"] == old_port:
-                                msg = f"""'{lb["name"]}'에서 '{lb["service_ip"]}' service_ip, '{lb["service_port"]}' service_port 는 기존 LB와 중복됩니다."""
-                                append_msg_list(msg_list, key, msg)
-                                result = False
+                    for old_lb in context.items(
+                        "service_ip", lb["service_ip"], old_lb_list
+                    ):
+                        old_port = str_to_int(old_lb["service_port"])
+                        if lb["service_port"] == old_port:
+                            msg = f"""'{lb["name"]}'에서 '{lb["service_ip"]}' service_ip, '{lb["service_port"]}' service_port 는 기존 LB와 중복됩니다."""
+                            append_msg_list(msg_list, key, msg)
+                            result = False
 
         if "server_list" in lb:
             if not "server_port" in lb:
@@ -3198,7 +4482,7 @@ def validate_lb_list(key_lb_list, subnet_list, vm_list, old_lb_list, action):
             for vm_name in vm_name_list:
                 if vm_name.startswith("@res"):
                     continue
-                if not check_exist_in_dict_list("vm_name", vm_name, vm_list):
+                if not context.exists("vm_name", vm_name, vm_list):
                     result = False
                     msg = f"""'{lb["name"]}'에서 '{lb["server_list"]}'에 존재하지 않는 vm name이 있습니다."""
                     append_msg_list(msg_list, key, msg)
@@ -3369,10 +4653,12 @@ def validate_duplicate_two_keys(dict_list, key1, key2):
 
 
 def validate_firewall_list(
-    key_fw_list, subnet_list, pf_list, sn_list, old_fw_list, action
+    key_fw_list, subnet_list, pf_list, sn_list, old_fw_list, action, context=None
 ):
     result = True
     msg_list = []
+    if context is None:
+        context = ValidationContext()
 
     if len(key_fw_list) == 0:
         msg = "내용이 비어 있습니다."
@@ -3414,9 +4700,7 @@ def validate_firewall_list(
                     append_msg_list(msg_list, key, msg)
                     result = False
 
-                if not check_exist_in_dict_list(
-                    "subnet_name", fw["src_net"], subnet_list
-                ):
+                if not context.exists("subnet_name", fw["src_net"], subnet_list):
                     msg = f"""{index} 번째 설정에서 '{fw["src_net"]}'논 존재하지 않는 Subnet 입니다."""
                     append_msg_list(msg_list, key, msg)
                     result = False
@@ -3428,9 +4712,7 @@ def validate_firewall_list(
                     result = False
 
                 if (
-                    not check_exist_in_dict_list(
-                        "subnet_name", fw["dst_net"], subnet_list
-                    )
+                    not context.exists("subnet_name", fw["dst_net"], subnet_list)
                     and fw["dst_net"] != "external"
                 ):
                     msg = f"""{index} 번째 설정에서 '{fw["dst_net"]}'논 존재하지 않는 Subnet 입니다. 인터넷 연동시 'external'을 기재하세요."""
@@ -3486,7 +4768,7 @@ def validate_firewall_list(
                     append_msg_list(msg_list, key, msg)
                     result = False
 
-                if not check_exist_in_dict_list("name", fw["dst_cidr"], pf_list):
+                if not context.exists("name", fw["dst_cidr"], pf_list):
                     if fw["dst_cidr"].startswith("@res"):
                         continue
                     else:
@@ -3509,7 +4791,7 @@ def validate_firewall_list(
                     append_msg_list(msg_list, key, msg)
                     result = False
 
-                if not check_exist_in_dict_list("name", fw["dst_cidr"], sn_list):
+                if not context.exists("name", fw["dst_cidr"], sn_list):
                     if fw["dst_cidr"].startswith("@res"):
                         continue
                     else:
@@ -3544,7 +4826,7 @@ def validate_firewall_list(
 
         # acl 중복 확인
         for i, fw in enumerate(fw_list):
-            acl_id = search_acl(fw, old_fw_list)
+            acl_id = context.search_acl(fw, old_fw_list)
             if acl_id != None:
                 msg = f"""{i+1}번재 acl은 기존에 생성된 ACL 입니다."""
                 append_msg_list(msg_list, key, msg)
@@ -3576,9 +4858,13 @@ def get_public_ip_type(public_ip, ip_list):
 """
 
 
-def validate_ip_list(key_nat_list, vm_list, lb_list, ip_list, pf_list, sn_list, action):
+def validate_ip_list(
+    key_nat_list, vm_list, lb_list, ip_list, pf_list, sn_list, action, context=None
+):
     result = True
     msg_list = []
+    if context is None:
+        context = ValidationContext()
 
     if len(key_nat_list) == 0:
         msg = "내용이 비어 있습니다."
@@ -3632,17 +4918,17 @@ def validate_ip_list(key_nat_list, vm_list, lb_list, ip_list, pf_list, sn_list,
                     msg = f"""'{nat["public_ip"]}'은 표현식 오류입니다. (예, new_001, new_123)"""
                     append_msg_list(msg_list, key, msg)
             else:
-                if check_exist_in_dict_list("publicip", nat["public_ip"], ip_list):
+                if context.exists("publicip", nat["public_ip"], ip_list):
                     # IP주소가 이미 생성되어 있음.
                     key_nat["state"] = "created"
-                    ip_type = get_public_ip_type(nat["public_ip"], ip_list)
+                    ip_type = context.get_public_ip_type(nat["public_ip"], ip_list)
                     if ip_type == "STATICNAT":
                         msg = f"""'{nat["public_ip"]}'은 기존에 STAIC NAT로 구성되어 있습니다."""
                         append_msg_list(msg_list, key, msg)
                         result = False
                     elif ip_type == "PORTFORWARDING":
                         # public port가 중복되지 않아야 한다.
-                        public_port_list = get_list_in_dict_list(
+                        public_port_list = context.get_list(
                             "publicip", nat["public_ip"], "public_port", pf_list
                         )
                         for public_port in public_port_list:
@@ -3663,7 +4949,7 @@ def validate_ip_list(key_nat_list, vm_list, lb_list, ip_list, pf_list, sn_list,
                 msg = f"""'{nat["target"]}'은 잘못 설정되었습니다. 'vm'만 가능합니다."""
                 append_msg_list(msg_list, key, msg)
 
-            if not check_exist_in_dict_list("vm_name", nat["target_name"], vm_list):
+            if not context.exists("vm_name", nat["target_name"], vm_list):
                 if nat["target_name"].startswith("@res"):
                     continue
                 else:
@@ -3672,21 +4958,19 @@ def validate_ip_list(key_nat_list, vm_list, lb_list, ip_list, pf_list, sn_list,
                     append_msg_list(msg_list, key, msg)
             else:
                 # vm이 sn이 아니어야 한다. pf인 경우, private_port가 중복되지 않아야 한다.
-                subnets = get_value_in_dict_list(
+                subnets = context.get_value(
                     "vm_name", nat["target_name"], "subnets", vm_list
                 )
                 private_ip = subnets[0]["privateip"]
-                ret_sn = get_value_in_dict_list(
-                    "privateip", private_ip, "name", sn_list
-                )
-                private_port_list = get_list_in_dict_list(
+                ret_sn = context.get_value("privateip", private_ip, "name", sn_list)
+                private_port_list = context.get_list(
                     "privateip", private_ip, "private_port", pf_list
                 )
 
                 if ret_sn != None:
                     msg = f"""'{nat["target_name"]}'은 이미 static nat가 설정되어 있습니다."""
                     append_msg_list(msg_list, key, msg)
-                    public_ip = get_value_in_dict_list(
+                    public_ip = context.get_value(
                         "privateip", private_ip, "publicip", sn_list
                     )
                     key_nat["state"] = "created"
@@ -3696,7 +4980,7 @@ def validate_ip_list(key_nat_list, vm_list, lb_list, ip_list, pf_list, sn_list,
                 for private_port in private_port_list:
                     private_port = str_to_int(private_port)
                     if private_port == nat["private_port"]:
-                        public_ip = get_value_in_dict_list_two_key(
+                        public_ip = context.get_value_two_key(
                             "privateip",
                             private_ip,
                             "private_port",
@@ -3748,9 +5032,9 @@ def validate_ip_list(key_nat_list, vm_list, lb_list, ip_list, pf_list, sn_list,
                     msg = f"""'{nat["public_ip"]}'은 표현식 오류입니다. (예, new_001, new_123)"""
                     append_msg_list(msg_list, key, msg)
             else:
-                if check_exist_in_dict_list("publicip", nat["public_ip"], ip_list):
+                if context.exists("publicip", nat["public_ip"], ip_list):
                     key_nat["state"] = "created"
-                    ip_type = get_public_ip_type(nat["public_ip"], ip_list)
+                    ip_type = context.get_public_ip_type(nat["public_ip"], ip_list)
                     if ip_type == "STATICNAT":
                         msg = f"""'{nat["public_ip"]}'은 기존에 STAIC NAT로 구성되어 있습니다."""
                         append_msg_list(msg_list, key, msg)
@@ -3767,7 +5051,7 @@ def validate_ip_list(key_nat_list, vm_list, lb_list, ip_list, pf_list, sn_list,
                     append_msg_list(msg_list, key, msg)
 
             if nat["target"] == "vm":
-                if not check_exist_in_dict_list("vm_name", nat["target_name"], vm_list):
+                if not context.exists("vm_name", nat["target_name"], vm_list):
                     if nat["target_name"].startswith("@res"):
                         continue
                     else:
@@ -3776,23 +5060,19 @@ def validate_ip_list(key_nat_list, vm_list, lb_list, ip_list, pf_list, sn_list,
                         append_msg_list(msg_list, key, msg)
                 else:
                     # vm이 pf, sn 모두 없어야 한다.
-                    subnets = get_value_in_dict_list(
+                    subnets = context.get_value(
                         "vm_name", nat["target_name"], "subnets", vm_list
                     )
                     private_ip = subnets[0]["privateip"]
-                    ret_pf = get_value_in_dict_list(
-                        "privateip", private_ip, "name", pf_list
-                    )
-                    ret_sn = get_value_in_dict_list(
-                        "privateip", private_ip, "name", sn_list
-                    )
+                    ret_pf = context.get_value("privateip", private_ip, "name", pf_list)
+                    ret_sn = context.get_value("privateip", private_ip, "name", sn_list)
 
                     if ret_pf != None:
                         result = False
                         msg = f"""'{nat["target_name"]}'은 이미 port forward로 설정되어 있습니다."""
                         append_msg_list(msg_list, key, msg)
                     elif ret_sn != None:
-                        public_ip = get_value_in_dict_list(
+                        public_ip = context.get_value(
                             "privateip", private_ip, "publicip", sn_list
                         )
                         if public_ip == nat["public_ip"]:
@@ -3807,7 +5087,7 @@ def validate_ip_list(key_nat_list, vm_list, lb_list, ip_list, pf_list, sn_list,
                             append_msg_list(msg_list, key, msg)
 
             elif nat["target"] == "lb":
-                if not check_exist_in_dict_list("lb_name", nat["target_name"], lb_list):
+                if not context.exists("lb_name", nat["target_name"], lb_list):
                     if nat["target_name"].startswith("@res"):
                         continue
                     else:
@@ -3816,15 +5096,13 @@ def validate_ip_list(key_nat_list, vm_list, lb_list, ip_list, pf_list, sn_list,
                         append_msg_list(msg_list, key, msg)
                 else:
                     # lb는 sn 없어야 한다.
-                    private_ip = get_value_in_dict_list(
+                    private_ip = context.get_value(
                         "lb_name", nat["target_name"], "service_ip", lb_list
                     )
-                    ret_sn = get_value_in_dict_list(
-                        "privateip", private_ip, "name", sn_list
-                    )
+                    ret_sn = context.get_value("privateip", private_ip, "name", sn_list)
 
                     if ret_sn != None:
-                        public_ip = get_value_in_dict_list(
+                        public_ip = context.get_value(
                             "privateip", private_ip, "publicip", sn_list
                         )
                         if public_ip == nat["public_ip"]:
@@ -3844,19 +5122,18 @@ def validate_ip_list(key_nat_list, vm_list, lb_list, ip_list, pf_list, sn_list,
                 append_msg_list(msg_list, key, msg)
 
     # 중복 확인 static_nat
+    public_ip_counts = None
     for key_nat in key_nat_list:
         nat = key_nat["params"]
         key = key_nat["key"]
-        public_ip_count = 0
-        target_name_count = 0
 
         if nat["type"] == "static_nat":
-            for key_nat2 in key_nat_list:
-                nat2 = key_nat2["params"]
-                if nat["public_ip"] == nat2["public_ip"]:
-                    public_ip_count += 1
-                if nat["target_name"] == nat2["target_name"]:
-                    target_name_count += 1
+            # 전체 설정의 public_ip, target_name 개수는 한 번만 계산
+            if public_ip_counts is None:
+                public_ip_counts = Counter(nat2["public_ip"] for nat2 in nat_list)
+                target_name_counts = Counter(nat2["target_name"] for nat2 in nat_list)
+            public_ip_count = public_ip_counts[nat["public_ip"]]
+            target_name_count = target_name_counts[nat["target_name"]]
 
             if public_ip_count > 1:
                 msg = f"""'{nat["public_ip"]}'가 중복으로 작성되었습니다."""
@@ -4198,9 +5475,11 @@ def update_res_name(keys_list, json_form, res_key_type):
 
 
 # vm_list 삭제를 위한 유효성 검사
-def validate_delete_vm_list(key_vm_list, old_vm_list, action):
+def validate_delete_vm_list(key_vm_list, old_vm_list, action, context=None):
     result = True
     msg_list = []
+    if context is None:
+        context = ValidationContext()
 
     if len(key_vm_list) == 0:
         msg = "vm_list 내용이 비어 있습니다."
@@ -4216,7 +5495,7 @@ def validate_delete_vm_list(key_vm_list, old_vm_list, action):
             append_msg_list(msg_list, key, msg)
             return False, msg_list
 
-        if not check_exist_in_dict_list("vm_name", vm["name"], old_vm_list):
+        if not context.exists("vm_name", vm["name"], old_vm_list):
             msg = f"""'{vm["name"]}'은 존재하지 않는 VM 이름입니다."""
             append_msg_list(msg_list, key, msg)
             key_vm["state"] = "none"
@@ -4231,9 +5510,11 @@ def validate_delete_vm_list(key_vm_list, old_vm_list, action):
 
 
 # lb_list 삭제를 위한 유효성 검사
-def validate_delete_lb_list(key_lb_list, old_lb_list, action):
+def validate_delete_lb_list(key_lb_list, old_lb_list, action, context=None):
     result = True
     msg_list = []
+    if context is None:
+        context = ValidationContext()
 
     if len(key_lb_list) == 0:
         msg = "lb_list 내용이 비어 있습니다."
@@ -4249,7 +5530,7 @@ def validate_delete_lb_list(key_lb_list, old_lb_list, action):
             append_msg_list(msg_list, key, msg)
             return False, msg_list
 
-        if not check_exist_in_dict_list("lb_name", lb["name"], old_lb_list):
+        if not context.exists("lb_name", lb["name"], old_lb_list):
             msg = f"""'{lb["name"]}'은 존재하지 않는 LB 이름입니다."""
             append_msg_list(msg_list, key, msg)
             key_lb["state"] = "none"
@@ -4264,9 +5545,11 @@ def validate_delete_lb_list(key_lb_list, old_lb_list, action):
 
 
 # ip_list 삭제를 위한 유효성 검사
-def validate_delete_ip_list(key_ip_list, old_ip_list, vpc, action):
+def validate_delete_ip_list(key_ip_list, old_ip_list, vpc, action, context=None):
     result = True
     msg_list = []
+    if context is None:
+        context = ValidationContext()
 
     if len(key_ip_list) == 0:
         msg = "ip_list 내용이 비어 있습니다."
@@ -4313,9 +5596,7 @@ def validate_delete_ip_list(key_ip_list, old_ip_list, vpc, action):
                     if action == "all":
                         result = False
             else:
-                if not check_exist_in_dict_list(
-                    "publicip", ip["public_ip"], old_ip_list
-                ):
+                if not context.exists("publicip", ip["public_ip"], old_ip_list):
                     msg = f"""'{ip["public_ip"]}'은 존재하지 않는 공인IP 입니다."""
                     append_msg_list(msg_list, key, msg)
                     if action == "all":
@@ -4349,9 +5630,7 @@ def validate_delete_ip_list(key_ip_list, old_ip_list, vpc, action):
                     if action == "all":
                         result = False
             else:
-                if not check_exist_in_dict_list(
-                    "publicip", ip["public_ip"], old_ip_list
-                ):
+                if not context.exists("publicip", ip["public_ip"], old_ip_list):
                     msg = f"""'{ip["public_ip"]}'은 존재하지 않는 공인IP 입니다."""
                     append_msg_list(msg_list, key, msg)
                     if action == "all":
@@ -4486,9 +5765,11 @@ def search_acl(acl, fw_list):
 
 
 # fw_list 삭제를 위한 유효성 검사
-def validate_delete_firewall_list(key_fw_list, old_fw_list, action):
+def validate_delete_firewall_list(key_fw_list, old_fw_list, action, context=None):
     result = True
     msg_list = []
+    if context is None:
+        context = ValidationContext()
 
     if len(key_fw_list) == 0:
         msg = "fw_list 내용이 비어 있습니다."
@@ -4505,7 +5786,7 @@ def validate_delete_firewall_list(key_fw_list, old_fw_list, action):
                 append_msg_list(msg_list, key, msg)
                 return False, msg_list
 
-            acl_id = search_acl(fw, old_fw_list)
+            acl_id = context.search_acl(fw, old_fw_list)
             if acl_id == None:
                 msg = f"""{i+1}번재 acl은 Firewall에 존재하지 않습니다."""
                 append_msg_list(msg_list, key, msg)
@@ -5,32 +5,1958 @@
 
 
 import os
+import re
+import zlib
+import fcntl
+import socket
+import gzip
+import datetime
+import json
 import time
 import logging
 import threading
+import asyncio
+import contextvars
+import cProfile
+import pstats
+import io
+from collections import deque
+from contextlib import contextmanager, nullcontext
+from urllib.parse import urlsplit, parse_qs
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from concurrent.futures import ThreadPoolExecutor, wait as wait_futures
 import kcldx as kcl
 
 # New feature: Version endpoint
 VERSION = "1.5.0"
 from dotenv import load_dotenv
-from prometheus_client import start_http_server, Gauge, Counter, Info
-from prometheus_client.core import CollectorRegistry
+from prometheus_client import (
+    Gauge,
+    Counter,
+    Histogram,
+    Summary,
+    Info,
+    generate_latest,
+    CONTENT_TYPE_LATEST,
+)
+from prometheus_client.core import (
+    CollectorRegistry,
+    CounterMetricFamily,
+    GaugeMetricFamily,
+)
+from prometheus_client.samples import Sample
+
+# .env 파일에서 환경 변수 로드
+load_dotenv()
+
+# 환경 변수에서 KT Cloud 접속 정보 및 설정값 읽기
+CLOUD_ID = os.getenv("CLOUD_ID")  # KT Cloud 계정 ID
+CLOUD_PASSWORD = os.getenv("CLOUD_PASSWORD")  # KT Cloud 계정 비밀번호
+CLOUD_ZONE = os.getenv("CLOUD_ZONE")  # KT Cloud 존 정보 (예: DX-M1)
+CLOUD_ACCOUNT = os.getenv("CLOUD_ACCOUNT") or CLOUD_ID  # account 레이블 값 (기본: CLOUD_ID)
+# 여러 계정/존을 하나의 프로세스에서 수집할 때의 수집 대상 목록 (JSON 배열)
+# 예: [{"account": "main", "id_env": "MAIN_ID", "password_env": "MAIN_PASSWORD", "zone": "DX-M1"}]
+# 비어 있으면 CLOUD_ID, CLOUD_PASSWORD, CLOUD_ZONE 단일 대상으로 수집
+KTCLOUD_TARGETS = os.getenv("KTCLOUD_TARGETS", "")
+# KT Cloud open api 주소 (로컬 시뮬레이터 등으로 바꿀 때 지정, 비어 있으면 기본 주소)
+KTCLOUD_API_BASE_URL = os.getenv("KTCLOUD_API_BASE_URL", "")
+# true이면 KT Cloud 연결(token 발급)을 HTTP 서버 시작 뒤 첫 수집에서 수행하고,
+# 익스포터가 사용하지 않는 external_id, subnet 목록은 조회하지 않음 (기본값 false: 기존처럼 시작 시 모두 조회)
+KTCLOUD_LAZY_INIT = os.getenv("KTCLOUD_LAZY_INIT", "false").lower() == "true"
+# true이면 수집 루프와 HTTP 서버를 하나의 asyncio event loop에서 실행 (aiohttp 필요)
+# LB별 조회는 스레드 대신 coroutine으로 동시에 진행하며, 동시 요청 수는 LB_FETCH_CONCURRENCY로 제한
+# (connection 수인 HTTP_POOL_SIZE는 LB_FETCH_CONCURRENCY 이상으로 맞춰짐)
+KTCLOUD_ASYNC = os.getenv("KTCLOUD_ASYNC", "false").lower() == "true"
+# true이면 LB 목록, LB별 서버 목록 응답을 본문 전체를 버퍼링하지 않고 socket에서 읽으면서 레코드로 변환
+# (파싱 중 응답 본문과 dict tree를 따로 만들지 않음, 변환한 레코드는 LB 인벤토리와 stale 캐시에
+#  사용하므로 모두 유지하며 최대 메모리는 여전히 응답 크기에 비례)
+KTCLOUD_STREAM_JSON = os.getenv("KTCLOUD_STREAM_JSON", "false").lower() == "true"
+EXPORTER_PORT = int(os.getenv("EXPORTER_PORT", "9105"))  # Prometheus 메트릭 노출 포트
+SCRAPE_INTERVAL = 60  # 메트릭 수집 주기 (초)
+# KT Cloud API 호출 속도 제한 (모든 API 호출에 적용, endpoint는 SDK 함수 이름)
+# 초당 요청 수 (0이면 제한 없음)와 순간적으로 허용하는 요청 수
+API_RATE_LIMIT = float(os.getenv("API_RATE_LIMIT", "0"))
+API_RATE_BURST = int(os.getenv("API_RATE_BURST", "10"))
+# endpoint별 초당 요청 수 (JSON 객체, 예: {"list_lb_server": 20, "get_lb_usage": 5})
+# 지정한 endpoint는 동시 요청 수와 backoff도 따로 관리하고, 나머지는 하나로 묶어 관리
+API_RATE_QUOTAS = os.getenv("API_RATE_QUOTAS", "")
+# true이면 429/5xx 응답에 따라 동시 요청 수를 자동 조절 (AIMD, 최대 API_MAX_CONCURRENCY)
+# 429/5xx 응답 후에는 jitter를 적용한 지수 backoff 동안 새 요청을 보내지 않음
+# 기본값 false (동시 조회 개수, connection pool 크기가 기존 기본값 그대로 유지됨)
+API_ADAPTIVE_CONCURRENCY = (
+    os.getenv("API_ADAPTIVE_CONCURRENCY", "false").lower() == "true"
+)
+API_MAX_CONCURRENCY = int(os.getenv("API_MAX_CONCURRENCY", "32"))
+# LB별 서버 정보 동시 조회 개수 (1이면 순차 조회, 기본값 8)
+# 동시 요청 수 자동 조절을 켜면 기본값은 API_MAX_CONCURRENCY (실제 요청 수는 속도 제한이 조절)
+LB_FETCH_CONCURRENCY = int(os.getenv("LB_FETCH_CONCURRENCY", "0")) or (
+    API_MAX_CONCURRENCY if API_ADAPTIVE_CONCURRENCY else 8
+)
+# LB별 서버 정보 조회 API의 요청 타임아웃 (초)
+LB_FETCH_TIMEOUT = float(os.getenv("LB_FETCH_TIMEOUT", "10"))
+# LB별 서버 정보 조회가 실패하면 마지막으로 성공한 데이터를 이 시간(초)까지 stale로 표시해 계속 노출
+# (0이면 기존처럼 조회 실패한 LB의 서버 메트릭을 바로 제거)
+SERVER_CACHE_TTL = float(os.getenv("SERVER_CACHE_TTL", str(SCRAPE_INTERVAL * 5)))
+# KT Cloud API connection pool 설정 (pool 크기는 최소 동시 조회 개수 이상으로 유지)
+HTTP_POOL_SIZE = max(int(os.getenv("HTTP_POOL_SIZE", "10")), LB_FETCH_CONCURRENCY)
+HTTP_KEEP_ALIVE = os.getenv("HTTP_KEEP_ALIVE", "true").lower() == "true"
+HTTP_CONNECT_TIMEOUT = float(os.getenv("HTTP_CONNECT_TIMEOUT", "5"))
+HTTP_READ_TIMEOUT = float(os.getenv("HTTP_READ_TIMEOUT", "30"))
+HTTP_MAX_RETRIES = int(os.getenv("HTTP_MAX_RETRIES", "2"))
+# SDK API 호출 log 설정, log는 별도 thread에서 익스포터 log(stdout/stderr)로 출력
+# SDK_LOG_FILE이 true이면 kcl_logs_{id}_{zone}.log file에도 기록
+SDK_LOG_FILE = os.getenv("SDK_LOG_FILE", "false").lower() == "true"
+# log file 최대 크기 (byte, 넘으면 rotate)와 보관할 이전 log file 개수
+SDK_LOG_MAX_BYTES = int(os.getenv("SDK_LOG_MAX_BYTES", str(10 * 1024 * 1024)))
+SDK_LOG_BACKUP_COUNT = int(os.getenv("SDK_LOG_BACKUP_COUNT", "3"))
+# level별 기록 비율 (JSON 객체, 예: {"INFO": 0.1}), 지정하지 않은 level은 모두 기록
+SDK_LOG_SAMPLE_RATES = os.getenv("SDK_LOG_SAMPLE_RATES", "")
+# 데이터 종류별 수집 주기 (초)
+# LB 목록, 서버 상태/성능은 0 이하이면 SCRAPE_INTERVAL 사용, 사용량은 0이면 수집하지 않음
+TOPOLOGY_INTERVAL = float(os.getenv("TOPOLOGY_INTERVAL", "0")) or SCRAPE_INTERVAL
+SERVER_INTERVAL = float(os.getenv("SERVER_INTERVAL", "0")) or SCRAPE_INTERVAL
+USAGE_INTERVAL = float(os.getenv("USAGE_INTERVAL", "0"))
+# 수집 주기 하나의 전체 시간 예산 (초, 0이면 SCRAPE_INTERVAL의 90%)
+# API 요청마다 timeout을 남은 예산 이하로 제한하고, 예산이 끝나면 남은 LB별 조회를 취소한 뒤
+# 완료된 데이터로 게시 (취소된 LB는 SERVER_CACHE_TTL 동안 직전 데이터를 stale로 노출)
+CYCLE_BUDGET = float(os.getenv("CYCLE_BUDGET", "0")) or SCRAPE_INTERVAL * 0.9
+# /metrics gzip 응답의 압축 레벨 (1~9)
+METRICS_GZIP_LEVEL = int(os.getenv("METRICS_GZIP_LEVEL", "6"))
+# 수집 주기가 이 시간(초) 이상 끝나지 않으면 /healthz 실패 (수집 루프 정지로 판단)
+LIVENESS_STALL_SECONDS = float(
+    os.getenv("LIVENESS_STALL_SECONDS", str(SCRAPE_INTERVAL * 5))
+)
+# 마지막 성공 수집이 이 시간(초)보다 오래되면 /readyz 실패 (0이면 검사하지 않음)
+READINESS_MAX_AGE = float(os.getenv("READINESS_MAX_AGE", "0"))
+# 레플리카 간 수집 조정 방식
+# - none: 레플리카마다 각자 전체 수집 (기본값)
+# - lease: 리스를 가진 레플리카 하나만 수집하고, 나머지는 공유 스냅샷 파일을 그대로 제공
+# - shard: LB를 lb_id 해시로 나누어 레플리카마다 자기 몫만 수집
+COORDINATION_MODE = os.getenv("COORDINATION_MODE", "none").lower()
+REPLICA_ID = os.getenv("REPLICA_ID") or socket.gethostname()  # 리스 보유자 이름
+# lease 모드: 리스 파일과 공유 스냅샷 파일 (모든 레플리카가 같은 볼륨을 마운트)
+COORDINATION_LEASE_FILE = os.getenv(
+    "COORDINATION_LEASE_FILE", "/var/run/lb-exporter/leader.lease"
+)
+COORDINATION_SNAPSHOT_FILE = os.getenv(
+    "COORDINATION_SNAPSHOT_FILE", "/var/run/lb-exporter/metrics.prom"
+)
+# 리스 유효 시간 (초), 이 시간의 1/3마다 갱신/획득 시도
+COORDINATION_LEASE_TTL = float(
+    os.getenv("COORDINATION_LEASE_TTL", str(SCRAPE_INTERVAL * 3))
+)
+# shard 모드: 레플리카 번호(0부터, 미설정 시 hostname 끝 번호)와 전체 레플리카 수
+REPLICA_INDEX = os.getenv("REPLICA_INDEX", "")
+REPLICA_COUNT = int(os.getenv("REPLICA_COUNT", "1"))
+# 수집 루프에서 예상치 못한 오류가 발생했을 때 재시도 대기 시간 (초, 연속 실패마다 두 배, jitter 적용)
+ERROR_RETRY_BASE = float(os.getenv("ERROR_RETRY_BASE", "10"))
+ERROR_RETRY_MAX = float(os.getenv("ERROR_RETRY_MAX", str(SCRAPE_INTERVAL * 5)))
+# 최근 수집 주기 추적(span tree)을 보관할 개수 (0이면 추적하지 않음)
+TRACE_BUFFER_SIZE = int(os.getenv("TRACE_BUFFER_SIZE", "5"))
+# 수집 주기 하나에 기록할 LB/API 요청 단위 세부 span의 최대 개수 (초과분은 개수만 기록)
+TRACE_MAX_SPANS = int(os.getenv("TRACE_MAX_SPANS", "2000"))
+# /debug/traces, /debug/profile 엔드포인트 사용 여부 (인증 없이 메트릭 포트로 노출되므로 기본값 false)
+DEBUG_ENDPOINTS = os.getenv("DEBUG_ENDPOINTS", "false").lower() == "true"
+
+# 로깅 설정 - 시간, 로거명, 레벨, 메시지 형태로 출력
+logging.basicConfig(
+    level=logging.INFO, format="%(asctime)s  %(name)s-%(levelname)s - %(message)s"
+)
+logger = logging.getLogger(__name__)
+
+if KTCLOUD_API_BASE_URL:
+    kcl.ku.set_api_base_url(KTCLOUD_API_BASE_URL)
+kcl.ku.set_sdk_log_options(
+    max_bytes=SDK_LOG_MAX_BYTES,
+    backup_count=SDK_LOG_BACKUP_COUNT,
+    sample_rates=json.loads(SDK_LOG_SAMPLE_RATES) if SDK_LOG_SAMPLE_RATES else {},
+    to_file=SDK_LOG_FILE,
+)
+
+
+# 서버 메트릭에 공통으로 사용하는 레이블
+SERVER_LABELS = ["lb_id", "lb_name", "server_ip", "server_port", "account", "zone"]
+
+
+def materialize(items):
+    """SDK 조회 결과를 목록으로 변환 (stream 모드의 generator는 응답을 끝까지 읽음, 조회 실패 None은 유지)"""
+    return None if items is None else list(items)
+
+
+def safe_float(value):
+    """안전한 float 변환 함수
+    None, 빈 문자열, 잘못된 형식의 값을 0으로 처리"""
+    try:
+        return float(value) if value is not None and value != "" else 0
+    except (ValueError, TypeError):
+        return 0
+
+
+def accepts_gzip(accept_encoding):
+    """
+    Accept-Encoding 헤더로 gzip 응답 가능 여부 판단
+    coding별 q 값을 읽어 gzip(또는 x-gzip)의 q 값이 0보다 크면 True
+    gzip이 없으면 '*'의 q 값을 사용하고, q 값을 읽을 수 없으면 0으로 처리
+    """
+    qvalues = {}
+    for item in accept_encoding.split(","):
+        coding, _, params = item.partition(";")
+        coding = coding.strip().lower()
+        if not coding:
+            continue
+        qvalue = 1.0
+        for param in params.split(";"):
+            name, _, value = param.partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    qvalue = float(value.strip())
+                except ValueError:
+                    qvalue = 0.0
+        qvalues[coding] = qvalue
+
+    gzip_qvalues = [qvalues[c] for c in ("gzip", "x-gzip") if c in qvalues]
+    if gzip_qvalues:
+        return max(gzip_qvalues) > 0
+    return qvalues.get("*", 0) > 0
+
+
+def load_targets(targets_json=None):
+    """
+    수집 대상 (계정, 존) 목록 생성
+    KTCLOUD_TARGETS가 없으면 CLOUD_ID, CLOUD_PASSWORD, CLOUD_ZONE 단일 대상을 사용합니다.
+    id, password 대신 id_env, password_env로 값을 담은 환경 변수 이름을 지정할 수 있습니다.
+    Args:
+        targets_json (str): 수집 대상 JSON 배열 (None이면 KTCLOUD_TARGETS)
+    Returns:
+        list: [{"account", "id", "password", "zone"}]
+    """
+    targets_json = KTCLOUD_TARGETS if targets_json is None else targets_json
+    if not targets_json:
+        if not all([CLOUD_ID, CLOUD_PASSWORD, CLOUD_ZONE]):
+            raise ValueError("환경 변수 누락: CLOUD_ID, CLOUD_PASSWORD, CLOUD_ZONE")
+        return [
+            {
+                "account": CLOUD_ACCOUNT,
+                "id": CLOUD_ID,
+                "password": CLOUD_PASSWORD,
+                "zone": CLOUD_ZONE,
+            }
+        ]
+
+    targets = []
+    for i, entry in enumerate(json.loads(targets_json)):
+        target = {
+            "id": entry.get("id") or os.getenv(entry.get("id_env", "")),
+            "password": entry.get("password")
+            or os.getenv(entry.get("password_env", "")),
+            "zone": entry.get("zone"),
+        }
+        missing = [key for key, value in target.items() if not value]
+        if missing:
+            raise ValueError(f"KTCLOUD_TARGETS[{i}] 값 누락: {', '.join(missing)}")
+        target["account"] = entry.get("account") or target["id"]
+        targets.append(target)
+
+    keys = [(target["account"], target["zone"]) for target in targets]
+    if not targets or len(set(keys)) != len(keys):
+        raise ValueError("KTCLOUD_TARGETS는 중복 없는 (account, zone) 목록이어야 합니다.")
+    return targets
+
+
+def replica_shard():
+    """
+    shard 모드에서 현재 레플리카가 맡을 (번호, 전체 레플리카 수) return
+    REPLICA_INDEX가 없으면 StatefulSet hostname(예: lb-exporter-1)의 끝 번호를 사용합니다.
+    """
+    index = REPLICA_INDEX
+    if not index:
+        match = re.search(r"-(\d+)$", socket.gethostname())
+        if not match:
+            raise ValueError("shard 모드에는 REPLICA_INDEX가 필요합니다.")
+        index = match.group(1)
+    index = int(index)
+    if REPLICA_COUNT < 1 or not 0 <= index < REPLICA_COUNT:
+        raise ValueError(
+            f"잘못된 shard 설정: REPLICA_INDEX={index}, REPLICA_COUNT={REPLICA_COUNT}"
+        )
+    return index, REPLICA_COUNT
+
+
+def build_rate_limiter():
+    """
+    API_* 설정으로 KT Cloud API 속도 제한(kclutil.RateLimiter) 생성
+    초당 요청 수 제한과 동시 요청 수 자동 조절을 모두 사용하지 않으면 None을 return 합니다.
+    """
+    quotas = {
+        endpoint: float(rate)
+        for endpoint, rate in (json.loads(API_RATE_QUOTAS) if API_RATE_QUOTAS else {}).items()
+    }
+    if not (API_ADAPTIVE_CONCURRENCY or API_RATE_LIMIT > 0 or quotas):
+        return None
+    return kcl.ku.RateLimiter(
+        rate=API_RATE_LIMIT,
+        burst=API_RATE_BURST,
+        quotas=quotas,
+        adaptive=API_ADAPTIVE_CONCURRENCY,
+        # LB_FETCH_CONCURRENCY를 더 크게 지정했으면 그만큼 늘릴 수 있도록 함
+        max_concurrency=max(API_MAX_CONCURRENCY, LB_FETCH_CONCURRENCY),
+        # 기존 기본 동시 조회 개수(8)에서 시작해 429/5xx 응답을 받을 때까지 빠르게 늘림
+        initial_concurrency=min(8, API_MAX_CONCURRENCY),
+    )
+
+
+class FileLease:
+    """
+    파일 기반 리더 리스 (Kubernetes Lease 대용, 로컬 테스트 및 공유 볼륨 환경용)
+    리스 파일에 {holder, expires}를 기록하고, flock으로 읽기-쓰기를 원자적으로 수행합니다.
+    보유자가 만료 전에 갱신하지 않으면 다른 레플리카가 리스를 가져갑니다.
+    """
+
+    def __init__(self, path, holder, ttl):
+        self.path = path
+        self.holder = holder  # 이 레플리카의 이름
+        self.ttl = ttl  # 리스 유효 시간 (초)
+        self.leader = None  # 마지막으로 확인한 리스 보유자
+
+    def _update(self, decide):
+        # 리스 파일을 잠근 상태에서 현재 기록을 읽고, decide가 돌려준 기록으로 교체
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(self.path, "a+") as f:
+            fcntl.flock(f, fcntl.LOCK_EX)
+            try:
+                f.seek(0)
+                try:
+                    record = json.loads(f.read() or "{}")
+                except ValueError:
+                    record = {}
+                new_record = decide(record)
+                if new_record is not None:
+                    f.seek(0)
+                    f.truncate()
+                    json.dump(new_record, f)
+                    f.flush()
+                    record = new_record
+                return record
+            finally:
+                fcntl.flock(f, fcntl.LOCK_UN)
+
+    def try_acquire(self, now=None):
+        """
+        리스 획득 또는 갱신 시도
+        Returns:
+            bool: 이 레플리카가 리스를 보유하고 있으면 True
+        """
+        now = time.time() if now is None else now
+
+        def decide(record):
+            holder = record.get("holder")
+            if holder and holder != self.holder and record.get("expires", 0) > now:
+                return None  # 다른 레플리카의 리스가 아직 유효함
+            return {"holder": self.holder, "expires": now + self.ttl}
+
+        self.leader = self._update(decide).get("holder")
+        return self.leader == self.holder
+
+    def release(self):
+        """보유 중인 리스를 즉시 만료시켜 다른 레플리카가 바로 가져갈 수 있도록 함"""
+
+        def decide(record):
+            if record.get("holder") != self.holder:
+                return None
+            return {"holder": self.holder, "expires": 0}
+
+        self._update(decide)
+        self.leader = None
+
+
+# 현재 스레드(컨텍스트)에서 진행 중인 span, 수집 주기 밖에서는 None
+_current_span = contextvars.ContextVar("lb_exporter_current_span", default=None)
+# 프로파일링 중인 수집 주기의 CycleProfiler, 스레드 풀 작업에도 전달됨
+_current_profiler = contextvars.ContextVar("lb_exporter_current_profiler", default=None)
+
+
+class Span:
+    """수집 주기 추적의 구간 하나 (이름, 속성, 시작/종료 시간, 하위 구간)"""
+
+    __slots__ = ("name", "attrs", "start", "end", "children", "root", "dropped")
+
+    def __init__(self, name, attrs=None, root=None):
+        self.name = name
+        self.attrs = attrs or {}
+        self.start = time.perf_counter()
+        self.end = None
+        self.children = []
+        self.root = root or self  # 최상위 span (수집 주기)
+        self.dropped = 0  # 최상위 span에만 사용, TRACE_MAX_SPANS 초과로 버린 span 개수
+
+    def to_dict(self, origin=None):
+        """JSON 응답용 dict - 시간은 수집 주기 시작 기준 ms, self_ms는 하위 구간을 뺀 자체 시간"""
+        origin = self.start if origin is None else origin
+        end = self.end if self.end is not None else time.perf_counter()
+        duration = (end - self.start) * 1000
+        children = [child.to_dict(origin) for child in list(self.children)]
+        return {
+            "name": self.name,
+            "start_ms": round((self.start - origin) * 1000, 3),
+            "duration_ms": round(duration, 3),
+            "self_ms": round(
+                max(0.0, duration - sum(c["duration_ms"] for c in children)), 3
+            ),
+            "attrs": self.attrs,
+            "children": children,
+        }
+
+
+def start_span(name, detail=False, **attrs):
+    """
+    현재 span 아래에 하위 span 시작
+    수집 주기 밖이면 기록하지 않고, LB/요청 단위의 세부 span(detail=True)은
+    수집 주기당 TRACE_MAX_SPANS개까지만 기록합니다.
+    Returns:
+        tuple: finish_span()에 넘길 (span, contextvar token), 기록하지 않으면 None
+    """
+    parent = _current_span.get()
+    if parent is None:
+        return None
+    root = parent.root
+    if detail:
+        if root.attrs["detail_spans"] >= TRACE_MAX_SPANS:
+            root.dropped += 1
+            return None
+        root.attrs["detail_spans"] += 1
+
+    span = Span(name, attrs, root)
+    parent.children.append(span)
+    return span, _current_span.set(span)
+
+
+def finish_span(handle):
+    """start_span()으로 시작한 span 종료 (같은 스레드에서 호출)"""
+    if handle is None:
+        return
+    span, token = handle
+    span.end = time.perf_counter()
+    _current_span.reset(token)
+
+
+@contextmanager
+def trace_span(name, detail=False, **attrs):
+    """with 블록을 현재 span의 하위 span으로 기록"""
+    handle = start_span(name, detail, **attrs)
+    try:
+        yield handle[0] if handle else None
+    except Exception as e:
+        if handle:
+            handle[0].attrs["error"] = str(e)
+        raise
+    finally:
+        finish_span(handle)
+
+
+def context_map(executor, func, items):
+    """
+    executor.map과 같지만 현재 span과 프로파일러를 작업 스레드로 전달
+    작업마다 호출한 스레드의 컨텍스트 복사본에서 실행합니다.
+    """
+    items = list(items)
+    contexts = [contextvars.copy_context() for _ in items]
+    return executor.map(
+        lambda context, item: context.run(_profiled_call, func, item), contexts, items
+    )
+
+
+def context_submit(executor, func, item):
+    """executor.submit과 같지만 context_map()처럼 호출한 스레드의 컨텍스트 복사본에서 실행"""
+    return executor.submit(contextvars.copy_context().run, _profiled_call, func, item)
+
+
+def _profiled_call(func, item):
+    # 프로파일링 중인 수집 주기이면 작업 스레드에서도 프로파일 수집
+    profiler = _current_profiler.get()
+    if profiler is None:
+        return func(item)
+    return profiler.call(func, item)
+
+
+class CycleTracer:
+    """최근 TRACE_BUFFER_SIZE개 수집 주기의 span tree를 보관하는 ring buffer"""
+
+    def __init__(self, size=TRACE_BUFFER_SIZE):
+        self.traces = deque(maxlen=size) if size > 0 else None
+
+    @contextmanager
+    def cycle(self, name, **attrs):
+        """수집 주기 하나를 최상위 span으로 기록하고, 끝나면 ring buffer에 추가"""
+        if self.traces is None:
+            yield None
+            return
+        root = Span(name, dict(attrs, started_at=time.time(), detail_spans=0))
+        token = _current_span.set(root)
+        try:
+            yield root
+        except Exception as e:
+            root.attrs["error"] = str(e)
+            raise
+        finally:
+            root.end = time.perf_counter()
+            root.attrs["dropped_detail_spans"] = root.dropped
+            _current_span.reset(token)
+            self.traces.append(root)
+
+    def recent(self, limit=None):
+        """최근 수집 주기 추적 목록 (오래된 순서)"""
+        traces = list(self.traces or [])
+        if limit:
+            traces = traces[-limit:]
+        return [trace.to_dict() for trace in traces]
+
+
+class TraceRequestObserver(kcl.ku.RequestObserver):
+    """SDK의 open api 요청을 현재 span 아래의 "api <command>" span으로 기록 (token 발급 포함)"""
+
+    def __init__(self):
+        # 요청 시작/종료는 같은 스레드 또는 같은 asyncio task에서 호출되므로
+        # 컨텍스트별 span stack으로 짝을 맞춤 (스레드 풀 작업과 task는 각자 컨텍스트 복사본을 가짐)
+        self._spans = contextvars.ContextVar("lb_exporter_api_spans", default=())
+
+    def request_started(self, command, method):
+        handle = start_span(f"api {command}", detail=True, method=method)
+        self._spans.set(self._spans.get() + (handle,))
+
+    def request_finished(
+        self, command, method, status_code, elapsed, response_size, error=None
+    ):
+        stack = self._spans.get()
+        if not stack:
+            return
+        handle = stack[-1]
+        self._spans.set(stack[:-1])
+        if handle is not None:
+            handle[0].attrs["status"] = "error" if status_code is None else status_code
+            handle[0].attrs["bytes"] = response_size
+        finish_span(handle)
+
+
+class CycleProfiler:
+    """
+    수집 주기 하나의 프로파일 (요청 시 다음 수집 주기에만 적용)
+    - cprofile: 수집 스레드와 스레드 풀 작업의 cProfile 결과를 합쳐 누적 시간 순으로 출력
+    - pyinstrument: 설치된 경우에만 사용 가능, 수집 스레드만 샘플링
+    """
+
+    KINDS = ("cprofile", "pyinstrument")
+
+    def __init__(self, kind="cprofile", limit=60):
+        if kind not in self.KINDS:
+            raise ValueError(f"지원하지 않는 profiler: {kind}")
+        if kind == "pyinstrument":
+            import pyinstrument  # noqa: F401 - 설치 여부 확인
+
+        self.kind = kind
+        self.limit = limit  # 출력할 함수 개수
+        self.requested_at = time.time()
+        self._profiles = []  # 수집 스레드와 작업 스레드의 cProfile 결과
+        self._text = ""  # pyinstrument 결과
+        self._lock = threading.Lock()
+
+    def call(self, func, *args):
+        """cprofile이면 작업 스레드별 cProfile로 func 실행"""
+        if self.kind != "cprofile":
+            return func(*args)
+        profile = cProfile.Profile()
+        try:
+            profile.enable()
+        except ValueError:
+            # 다른 프로파일러가 이미 활성화된 경우 (Python 3.12 이상) 프로파일 없이 실행
+            return func(*args)
+        try:
+            return func(*args)
+        finally:
+            profile.disable()
+            with self._lock:
+                self._profiles.append(profile)
+
+    @contextmanager
+    def profiling(self):
+        """with 블록(수집 주기) 동안 프로파일 수집, 작업 스레드에는 contextvar로 전달"""
+        token = _current_profiler.set(self)
+        pyinstrument_profiler = None
+        if self.kind == "pyinstrument":
+            import pyinstrument
+
+            pyinstrument_profiler = pyinstrument.Profiler()
+            pyinstrument_profiler.start()
+        try:
+            if self.kind == "cprofile":
+                with self._main_profile():
+                    yield self
+            else:
+                yield self
+        finally:
+            _current_profiler.reset(token)
+            if pyinstrument_profiler is not None:
+                pyinstrument_profiler.stop()
+                self._text = pyinstrument_profiler.output_text()
+
+    @contextmanager
+    def _main_profile(self):
+        profile = cProfile.Profile()
+        profile.enable()
+        try:
+            yield
+        finally:
+            profile.disable()
+            with self._lock:
+                self._profiles.append(profile)
+
+    def report(self):
+        """프로파일 결과 텍스트"""
+        if self.kind == "pyinstrument":
+            return self._text
+        with self._lock:
+            profiles = list(self._profiles)
+        if not profiles:
+            return ""
+        out = io.StringIO()
+        stats = pstats.Stats(profiles[0], stream=out)
+        for profile in profiles[1:]:
+            stats.add(profile)
+        stats.sort_stats("cumulative").print_stats(self.limit)
+        return out.getvalue()
+
+
+class LBInventory:
+    """
+    lb_id를 키로 직전 수집 주기의 LB 목록(list_lb_info 결과)을 보관하는 인벤토리 (수집 대상별 하나)
+    - 이전 주기와 비교하여 추가/삭제/변경된 LB를 계산
+    - LB/서버별 레이블을 캐시하여 변경되지 않은 LB는 레이블을 다시 만들지 않음
+    """
+
+    # 변경 감지에 사용하는 LB 구성 값 (상태값 state, established_conn은 구성 변경이 아니므로 제외)
+    CONFIG_KEYS = (
+        "lb_id",
+        "lb_name",
+        "service_ip",
+        "service_port",
+        "service_type",
+        "lb_option",
+        "healthcheck_type",
+        "healthcheck_url",
+        "ciphergroup_name",
+        "subnet_id",
+    )
+
+    def __init__(self, account="", zone_name=""):
+        self.account = account  # 모든 레이블에 붙는 계정 이름
+        self.zone_name = zone_name  # 모든 레이블에 붙는 존 이름
+        self.lbs = {}  # lb_id -> LB 정보
+        self._lb_labels = {}  # lb_id -> (lb_info 레이블, lb_server_count 레이블)
+        self._server_labels = {}  # lb_id -> {(vm_ip, vm_port): 서버 레이블}
+        # 누적 변경 횟수 (added, removed, changed)
+        self.churn = {"added": 0, "removed": 0, "changed": 0}
+
+    @classmethod
+    def config_of(cls, lb):
+        """변경 감지에 사용하는 LB 구성 값 (CONFIG_KEYS 순서의 값)"""
+        return tuple(lb.get(key) for key in cls.CONFIG_KEYS)
+
+    def update(self, lb_list):
+        """
+        새 LB 목록을 반영하고 이전 주기 대비 변경 사항 계산
+        변경/삭제된 LB의 레이블 캐시는 폐기하여 다음 스냅샷 생성 시 다시 만들어지도록 합니다.
+        Args:
+            lb_list (list): list_lb_info() 결과
+        Returns:
+            dict: {"added": [lb_id], "removed": [lb_id], "changed": [lb_id]}
+        """
+        current = {lb.lb_id: lb for lb in lb_list}
+        added = [lb_id for lb_id in current if lb_id not in self.lbs]
+        removed = [lb_id for lb_id in self.lbs if lb_id not in current]
+        changed = [
+            lb_id
+            for lb_id, lb in current.items()
+            if lb_id in self.lbs
+            and self.config_of(lb) != self.config_of(self.lbs[lb_id])
+        ]
+
+        for lb_id in removed + changed:
+            self._lb_labels.pop(lb_id, None)
+            self._server_labels.pop(lb_id, None)
+
+        self.lbs = current
+        delta = {"added": added, "removed": removed, "changed": changed}
+        for change, lb_ids in delta.items():
+            self.churn[change] += len(lb_ids)
+        return delta
+
+    def target_labels(self):
+        """수집 대상 단위 메트릭의 레이블"""
+        return {"account": self.account, "zone": self.zone_name}
+
+    def lb_labels(self, lb):
+        """
+        LB의 (lb_info 레이블, lb_server_count 레이블) return
+        레이블 순서는 LBSnapshotCollector.FAMILIES 정의와 동일
+        """
+        labels = self._lb_labels.get(lb.lb_id)
+        if labels is None:
+            lb_id = str(lb.lb_id)
+            info_labels = {
+                "lb_id": lb_id,
+                "lb_name": lb.lb_name,
+                "service_ip": lb.service_ip,
+                "service_port": str(lb.service_port),
+                "service_type": lb.service_type,
+                "lb_option": lb.lb_option,  # 로드밸런싱 알고리즘
+                "healthcheck_type": lb.healthcheck_type,  # 헬스체크 방식
+                "account": self.account,
+                "zone": self.zone_name,
+            }
+            count_labels = {
+                "lb_id": lb_id,
+                "lb_name": lb.lb_name,
+                "account": self.account,
+                "zone": self.zone_name,
+            }
+            labels = (info_labels, count_labels)
+            self._lb_labels[lb.lb_id] = labels
+        return labels
+
+    def server_labels_of(self, lb, servers):
+        """
+        LB에 연결된 서버별 레이블 목록 return (servers와 같은 순서)
+        이번 주기에 보이지 않은 서버의 레이블은 캐시에서 제거됨
+        """
+        cached = self._server_labels.get(lb.lb_id, {})
+        fresh = {}
+        labels_list = []
+        lb_id = str(lb.lb_id)
+        for server in servers:
+            key = (server.vm_ip, server.vm_port)
+            labels = cached.get(key) or fresh.get(key)
+            if labels is None:
+                labels = {
+                    "lb_id": lb_id,
+                    "lb_name": lb.lb_name,
+                    "server_ip": server.vm_ip,
+                    "server_port": str(server.vm_port),
+                    "account": self.account,
+                    "zone": self.zone_name,
+                }
+            fresh[key] = labels
+            labels_list.append(labels)
+        self._server_labels[lb.lb_id] = fresh
+        return labels_list
+
+
+class LBSnapshotCollector:
+    """
+    LB 메트릭을 불변 스냅샷으로 노출하는 Prometheus Collector
+    수집 데이터로 메트릭 패밀리 전체를 미리 만들어 두고, 참조 교체 한 번으로 게시합니다.
+    - 스크랩은 항상 한 수집 주기의 완전한 시리즈 집합을 읽음
+    - 게시 이후 스냅샷은 수정하지 않음 (새 스냅샷으로만 교체)
+    """
+
+    # 스냅샷에 포함되는 메트릭 정의 (이름, 설명, 레이블)
+    FAMILIES = (
+        # 1. 전체 LB 개수
+        ("ktcloud_lb_total_count", "Total number of load balancers", ["account", "zone"]),
+        # 2. LB 기본 정보 (상태, IP, 포트 등)
+        (
+            "ktcloud_lb_info",
+            "Load balancer information (value: 1=UP, 0=DOWN)",
+            [
+                "lb_id",
+                "lb_name",
+                "service_ip",
+                "service_port",
+                "service_type",
+                "lb_option",
+                "healthcheck_type",
+                "account",
+                "zone",
+            ],
+        ),
+        # 3. LB별 연결된 서버 개수
+        (
+            "ktcloud_lb_server_count",
+            "Number of servers connected to load balancer",
+            ["lb_id", "lb_name", "account", "zone"],
+        ),
+        # 4. LB 내 개별 서버 상태
+        (
+            "ktcloud_lb_server_state",
+            "Server state in load balancer (1=UP, 0=DOWN)",
+            SERVER_LABELS,
+        ),
+        # 5. 서버별 현재 연결 수
+        (
+            "ktcloud_server_current_connections",
+            "Current number of connections to the server",
+            SERVER_LABELS,
+        ),
+        # 6. 서버별 처리량 (KB/s)
+        (
+            "ktcloud_server_throughput_rate_kbps",
+            "Server throughput rate in KB/s",
+            SERVER_LABELS,
+        ),
+        # 7. 서버별 평균 응답 시간 (TTFB-Time To First Byte)
+        (
+            "ktcloud_server_avg_ttfb_ms",
+            "Average server Time To First Byte in milliseconds",
+            SERVER_LABELS,
+        ),
+        # 8. 서버별 초당 요청 처리량
+        (
+            "ktcloud_server_requests_rate_per_sec",
+            "Server requests rate per second",
+            SERVER_LABELS,
+        ),
+        # 9. 서비스 타입별 LB 개수 (HTTP, HTTPS, TCP 등)
+        (
+            "ktcloud_lb_service_type_count",
+            "Count of load balancers by service type",
+            ["service_type", "account", "zone"],
+        ),
+        # 10. LB별 최근 사용량 - 인바운드 (USAGE_INTERVAL 주기로 수집)
+        (
+            "ktcloud_lb_usage_inbound",
+            "Inbound traffic of load balancer on the latest usage date",
+            ["lb_id", "lb_name", "account", "zone"],
+        ),
+        # 11. LB별 최근 사용량 - 아웃바운드
+        (
+            "ktcloud_lb_usage_outbound",
+            "Outbound traffic of load balancer on the latest usage date",
+            ["lb_id", "lb_name", "account", "zone"],
+        ),
+        # 12. 수집 대상(계정, 존)별 마지막 수집 성공 여부
+        (
+            "ktcloud_lb_target_up",
+            "Whether the last collection of the account/zone target succeeded (1=UP, 0=DOWN)",
+            ["account", "zone"],
+        ),
+        # 13. LB별 서버 정보가 마지막으로 조회에 성공한 뒤 지난 시간 (수집 시작 시간 기준)
+        (
+            "ktcloud_lb_data_age_seconds",
+            "Seconds since the server data of the load balancer was last fetched successfully",
+            ["lb_id", "lb_name", "account", "zone"],
+        ),
+        # 14. LB별 서버 정보가 직전 조회 실패로 캐시된 데이터인지 여부
+        (
+            "ktcloud_lb_data_stale",
+            "Whether the last server fetch failed and cached data is published (1=stale)",
+            ["lb_id", "lb_name", "account", "zone"],
+        ),
+    )
+
+    def __init__(self):
+        # 현재 게시된 스냅샷 (메트릭 패밀리 tuple)
+        self._snapshot = self.build_snapshot([])
+
+    @classmethod
+    def new_families(cls):
+        """FAMILIES 정의에 따라 비어 있는 메트릭 패밀리 dict 생성"""
+        return {
+            name: GaugeMetricFamily(name, documentation, labels=labels)
+            for name, documentation, labels in cls.FAMILIES
+        }
+
+    @classmethod
+    def build_snapshot(cls, collections):
+        """
+        수집된 데이터로 새 스냅샷 생성 (락 없이 수집 스레드에서 실행)
+        레이블은 인벤토리에 캐시된 dict를 재사용하고 샘플만 새로 만듭니다.
+        Args:
+            collections (list): 수집 대상별 (LBInventory, collect_data_to_temp() 결과) 목록
+        Returns:
+            tuple: 메트릭 패밀리 목록
+        """
+        families = cls.new_families()
+        lb_total_count = families["ktcloud_lb_total_count"].samples
+        lb_info = families["ktcloud_lb_info"].samples
+        lb_server_count = families["ktcloud_lb_server_count"].samples
+        lb_server_state = families["ktcloud_lb_server_state"].samples
+        server_connections = families["ktcloud_server_current_connections"].samples
+        server_throughput_rate = families[
+            "ktcloud_server_throughput_rate_kbps"
+        ].samples
+        server_avg_ttfb = families["ktcloud_server_avg_ttfb_ms"].samples
+        server_requests_rate = families["ktcloud_server_requests_rate_per_sec"].samples
+        service_type_count = families["ktcloud_lb_service_type_count"].samples
+        usage_inbound = families["ktcloud_lb_usage_inbound"].samples
+        usage_outbound = families["ktcloud_lb_usage_outbound"].samples
+        target_up = families["ktcloud_lb_target_up"].samples
+        data_age = families["ktcloud_lb_data_age_seconds"].samples
+        data_stale = families["ktcloud_lb_data_stale"].samples
+
+        for inventory, temp_data in collections:
+            target_labels = inventory.target_labels()
+            lb_usage = temp_data.get("lb_usage", {})
+            lb_data_age = temp_data.get("lb_data_age", {})
+            lb_stale = temp_data.get("lb_stale", ())
+
+            # 수집 대상별 전체 LB 개수와 수집 성공 여부 설정
+            lb_total_count.append(
+                Sample(
+                    "ktcloud_lb_total_count", target_labels, len(temp_data["lb_list"])
+                )
+            )
+            target_up.append(
+                Sample(
+                    "ktcloud_lb_target_up",
+                    target_labels,
+                    1 if temp_data.get("up", True) else 0,
+                )
+            )
+
+            # ===LB별 상세 정보 생성
+            for lb in temp_data["lb_list"]:
+                try:
+                    info_labels, count_labels = inventory.lb_labels(lb)
+
+                    # LB 상태 변환 ('UP' -> 1, 'DOWN' -> 0)
+                    state = 1 if lb.state == "UP" else 0
+                    lb_info.append(Sample("ktcloud_lb_info", info_labels, state))
+
+                    # 해당 LB의 서버 정보 처리
+                    servers = temp_data["lb_servers"].get(lb.lb_id, [])
+                    lb_server_count.append(
+                        Sample("ktcloud_lb_server_count", count_labels, len(servers))
+                    )
+
+                    # 서버 정보의 나이와 stale 여부 (한 번도 조회에 성공하지 못한 LB는 나이 생략)
+                    age = lb_data_age.get(lb.lb_id)
+                    if age is not None:
+                        data_age.append(
+                            Sample("ktcloud_lb_data_age_seconds", count_labels, age)
+                        )
+                    data_stale.append(
+                        Sample(
+                            "ktcloud_lb_data_stale",
+                            count_labels,
+                            1 if lb.lb_id in lb_stale else 0,
+                        )
+                    )
+
+                    # 해당 LB의 최근 사용량 (수집한 경우에만)
+                    usage = lb_usage.get(lb.lb_id)
+                    if usage:
+                        usage_inbound.append(
+                            Sample(
+                                "ktcloud_lb_usage_inbound",
+                                count_labels,
+                                safe_float(usage.get("inbound", 0)),
+                            )
+                        )
+                        usage_outbound.append(
+                            Sample(
+                                "ktcloud_lb_usage_outbound",
+                                count_labels,
+                                safe_float(usage.get("outbound", 0)),
+                            )
+                        )
+
+                    # 서버별 상세 정보 처리
+                    server_labels = inventory.server_labels_of(lb, servers)
+                    for server, labels in zip(servers, server_labels):
+                        try:
+                            # 서버 상태 변환 ('UP' -> 1, 'DOWN' -> 0)
+                            server_state = 1 if server.state == "UP" else 0
+
+                            # 성능 지표 (LBServerRecord에서 float로 변환되어 있음)
+                            connections = server.cursrvrconnections  # 현재 연결 수
+                            throughput = server.throughputrate  # 처리량 (KB/s)
+                            ttfb = server.avgsvrttfb  # 평균 TTFB (ms)
+                            requests = server.requestsrate  # 초당 요청 수
+
+                            lb_server_state.append(
+                                Sample("ktcloud_lb_server_state", labels, server_state)
+                            )
+                            server_connections.append(
+                                Sample(
+                                    "ktcloud_server_current_connections",
+                                    labels,
+                                    connections,
+                                )
+                            )
+                            server_throughput_rate.append(
+                                Sample(
+                                    "ktcloud_server_throughput_rate_kbps",
+                                    labels,
+                                    throughput,
+                                )
+                            )
+                            server_avg_ttfb.append(
+                                Sample("ktcloud_server_avg_ttfb_ms", labels, ttfb)
+                            )
+                            server_requests_rate.append(
+                                Sample(
+                                    "ktcloud_server_requests_rate_per_sec",
+                                    labels,
+                                    requests,
+                                )
+                            )
+
+                        except Exception as e:
+                            logger.error(
+                                f"서버 {server.vm_ip} 메트릭 설정 실패: {e}"
+                            )
+
+                except Exception as e:
+                    logger.error(
+                        f"LB {lb.lb_name} 메트릭 설정 실패: {e}"
+                    )
+
+            # 서비스 타입별 카운트 메트릭 설정
+            for service_type, count in temp_data["service_type_counts"].items():
+                service_type_count.append(
+                    Sample(
+                        "ktcloud_lb_service_type_count",
+                        {"service_type": service_type, **target_labels},
+                        count,
+                    )
+                )
+
+        return tuple(families.values())
+
+    @property
+    def snapshot(self):
+        return self._snapshot
+
+    def publish(self, snapshot):
+        """새 스냅샷 게시 - 참조 교체 한 번으로 이전 스냅샷을 대체"""
+        self._snapshot = snapshot
+
+    def describe(self):
+        return list(self.new_families().values())
+
+    def collect(self):
+        # 스크랩 도중 스냅샷이 교체되어도 시작 시점의 스냅샷을 끝까지 사용
+        return iter(self._snapshot)
+
+
+class ExpositionCache:
+    """
+    /metrics 응답 캐시
+    수집 주기마다 한 번만 레지스트리를 텍스트 형식으로 렌더링하고 gzip 압축본도 함께 만들어 둡니다.
+    HTTP 요청은 렌더링 없이 캐시된 바이트를 그대로 응답합니다.
+    """
+
+    def __init__(self, registry):
+        self.registry = registry
+        # (본문, gzip 본문, ETag) - 참조 교체 한 번으로 갱신
+        self._payload = None
+
+    def render(self, collection_time):
+        """
+        레지스트리를 렌더링하여 캐시 갱신
+        Args:
+            collection_time (float): 렌더링한 데이터의 수집 시간 (ETag 생성에 사용)
+        Returns:
+            float: 렌더링 소요 시간 (초)
+        """
+        render_start = time.time()
+        self.load(generate_latest(self.registry), collection_time)
+        return time.time() - render_start
+
+    def load(self, body, collection_time):
+        """이미 렌더링된 본문(예: 리더가 기록한 공유 스냅샷)으로 캐시 갱신"""
+        gzip_body = gzip.compress(body, compresslevel=METRICS_GZIP_LEVEL)
+        etag = f'"{collection_time:.3f}"'
+        self._payload = (body, gzip_body, etag)
+
+    def write(self, path, collection_time):
+        """
+        캐시된 본문을 공유 스냅샷 파일로 기록 (임시 파일 기록 후 교체하여 원자적으로 반영)
+        파일 수정 시간을 수집 시간으로 맞춰 다른 레플리카가 같은 ETag를 만들도록 합니다.
+        """
+        body = self.payload()[0]
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(body)
+        os.utime(tmp_path, (collection_time, collection_time))
+        os.replace(tmp_path, path)
+
+    def payload(self):
+        """캐시된 (본문, gzip 본문, ETag) return, 첫 렌더링 전이면 즉시 렌더링"""
+        if self._payload is None:
+            self.render(0)
+        return self._payload
+
+
+class ExporterResponder:
+    """
+    익스포터 HTTP 응답 생성 - /metrics는 ExpositionCache의 캐시된 응답으로 처리
+    스레드 HTTP 서버(ExporterRequestHandler)와 asyncio 모드의 aiohttp 서버가 같은 응답을 만들도록
+    요청 경로별 처리를 서버 구현과 분리해 둡니다.
+    """
+
+    def __init__(self, exporter):
+        self.exporter = exporter
+
+    def respond(self, method, path, query, headers):
+        """
+        요청 하나의 응답 생성
+        Args:
+            method (str): GET, POST
+            path (str): 요청 경로
+            query (dict): parse_qs() 형식의 query string
+            headers: 대소문자 구분 없이 get()으로 조회할 수 있는 요청 헤더
+        Returns:
+            tuple: (상태 코드, 본문 bytes, Content-Type 또는 None, 추가 응답 헤더 dict)
+        """
+        exporter = self.exporter
+        if method == "GET":
+            if path in ("/metrics", "/"):
+                return self.metrics(headers)
+            if path == "/healthz":
+                return self.health(*exporter.liveness())
+            if path == "/readyz":
+                return self.health(*exporter.readiness())
+            if DEBUG_ENDPOINTS and path == "/debug/traces":
+                return self.traces(query)
+            if DEBUG_ENDPOINTS and path == "/debug/profile":
+                return self.profile()
+        elif method == "POST":
+            if DEBUG_ENDPOINTS and path == "/debug/profile":
+                return self.request_profile(query)
+        return self.not_found()
+
+    def not_found(self):
+        return 404, b"Not Found\n", "text/plain; charset=utf-8", {}
+
+    def json(self, code, data):
+        body = json.dumps(data, default=str).encode("utf-8")
+        return code, body, "application/json", {}
+
+    def traces(self, query):
+        # 최근 수집 주기의 span tree (?limit=N 으로 최근 N개만)
+        try:
+            limit = int(query.get("limit", ["0"])[-1])
+        except ValueError:
+            limit = 0
+        return self.json(200, self.exporter.tracer.recent(limit))
+
+    def profile(self):
+        # 마지막 프로파일 결과, 예약된 프로파일이 아직 실행되지 않았으면 pending 표시
+        exporter = self.exporter
+        if exporter.last_profile is None:
+            return self.json(
+                404, {"error": "no profile", "pending": exporter.pending_profiler is not None}
+            )
+        return (
+            200,
+            exporter.last_profile["report"].encode("utf-8"),
+            "text/plain; charset=utf-8",
+            {
+                "X-Profiler": exporter.last_profile["profiler"],
+                "X-Profile-Cycle-Started-At": f"{exporter.last_profile['cycle_started_at']:.3f}",
+            },
+        )
+
+    def request_profile(self, query):
+        # 다음 수집 주기 하나의 프로파일 예약 (?profiler=cprofile|pyinstrument&limit=N)
+        try:
+            profiler = CycleProfiler(
+                query.get("profiler", ["cprofile"])[-1],
+                int(query.get("limit", ["60"])[-1]),
+            )
+        except (ValueError, ImportError) as e:
+            return self.json(400, {"error": str(e)})
+        self.exporter.pending_profiler = profiler
+        return self.json(202, {"scheduled": profiler.kind, "result": "/debug/profile"})
+
+    def metrics(self, headers):
+        body, gzip_body, etag = self.exporter.exposition_cache.payload()
+        use_gzip = accepts_gzip(headers.get("Accept-Encoding", ""))
+        if use_gzip:
+            # 압축 여부에 따라 표현이 달라지므로 ETag도 구분
+            body = gzip_body
+            etag = etag[:-1] + '-gzip"'
+
+        # 같은 수집 주기의 데이터를 이미 가지고 있으면 본문 없이 응답
+        if headers.get("If-None-Match") == etag:
+            return 304, b"", None, {"ETag": etag}
+
+        response_headers = {"ETag": etag, "Vary": "Accept-Encoding"}
+        if use_gzip:
+            response_headers["Content-Encoding"] = "gzip"
+        return 200, body, CONTENT_TYPE_LATEST, response_headers
+
+    def health(self, ok, status):
+        # 레지스트리를 거치지 않고 수집 루프 상태만 JSON으로 응답
+        body = json.dumps(status).encode("utf-8")
+        return 200 if ok else 503, body, "application/json", {}
+
+
+class ExporterRequestHandler(BaseHTTPRequestHandler):
+    """스레드 HTTP 서버의 요청 처리 - 응답은 ExporterResponder가 생성"""
+
+    protocol_version = "HTTP/1.1"
+    # 헤더와 본문을 따로 보내므로 Nagle 알고리즘을 끄지 않으면 keep-alive 요청마다 지연 발생
+    disable_nagle_algorithm = True
+
+    def do_GET(self):
+        self.dispatch("GET")
+
+    def do_POST(self):
+        self.dispatch("POST")
+
+    def dispatch(self, method):
+        parts = urlsplit(self.path)
+        self.send_body(
+            *self.server.responder.respond(
+                method, parts.path, parse_qs(parts.query), self.headers
+            )
+        )
+
+    def send_body(self, code, body, content_type, headers=None):
+        self.send_response(code)
+        if content_type:
+            self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        for key, value in (headers or {}).items():
+            self.send_header(key, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        # 스크랩/프로브 요청마다 로그가 쌓이지 않도록 debug 레벨로 기록
+        logger.debug("HTTP %s - %s", self.address_string(), format % args)
+
+
+class APIMetricsObserver(kcl.ku.RequestObserver):
+    """
+    KT Cloud API 요청 관찰자 - SDK의 모든 open api 호출을 command별 메트릭으로 기록
+    - 응답 시간 histogram, 진행 중인 요청 수, HTTP 상태 코드별 호출 수, 응답 크기 summary
+    command는 SDK 함수 이름 (list_lb_info, list_lb_server, _create_token 등)
+    """
+
+    # 응답 시간 histogram 구간 (초)
+    LATENCY_BUCKETS = (0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30)
+
+    def __init__(self, registry):
+        self.latency = Histogram(
+            "ktcloud_api_request_duration_seconds",
+            "KT Cloud API request latency by SDK command",  # API 응답 시간
+            ["command", "method"],
+            buckets=self.LATENCY_BUCKETS,
+            registry=registry,
+        )
+        self.in_flight = Gauge(
+            "ktcloud_api_requests_in_flight",
+            "KT Cloud API requests currently in flight",  # 진행 중인 API 요청 수
+            ["command"],
+            registry=registry,
+        )
+        self.requests = Counter(
+            "ktcloud_api_requests",
+            "KT Cloud API requests by SDK command and HTTP status (status=error: no response)",  # API 호출 수
+            ["command", "method", "status"],
+            registry=registry,
+        )
+        self.response_size = Summary(
+            "ktcloud_api_response_size_bytes",
+            "KT Cloud API response body size",  # API 응답 크기
+            ["command"],
+            registry=registry,
+        )
+
+    def request_started(self, command, method):
+        self.in_flight.labels(command=command).inc()
+
+    def request_finished(
+        self, command, method, status_code, elapsed, response_size, error=None
+    ):
+        self.in_flight.labels(command=command).dec()
+        self.latency.labels(command=command, method=method).observe(elapsed)
+        status = "error" if status_code is None else str(status_code)
+        self.requests.labels(command=command, method=method, status=status).inc()
+        if status_code is not None:
+            self.response_size.labels(command=command).observe(response_size)
+
+
+class RateLimiterCollector:
+    """
+    KT Cloud API 속도 제한 상태를 스크랩 시점에 읽어 노출하는 Prometheus Collector
+    endpoint는 속도 제한 단위 (API_RATE_QUOTAS에 지정한 SDK 함수 이름 또는 default)
+    """
+
+    def __init__(self, limiter):
+        self.limiter = limiter
+
+    def collect(self):
+        concurrency = GaugeMetricFamily(
+            "ktcloud_api_rate_limit_concurrency",
+            "Current concurrent request limit chosen by AIMD",  # 현재 동시 요청 수 제한
+            labels=["endpoint"],
+        )
+        rate = GaugeMetricFamily(
+            "ktcloud_api_rate_limit_rate",
+            "Configured request rate limit in requests per second (0 = unlimited)",  # 초당 요청 수 제한
+            labels=["endpoint"],
+        )
+        in_flight = GaugeMetricFamily(
+            "ktcloud_api_rate_limit_in_flight",
+            "Requests currently holding a rate limiter slot",  # 진행 중인 요청 수
+            labels=["endpoint"],
+        )
+        backoff = GaugeMetricFamily(
+            "ktcloud_api_rate_limit_backoff",
+            "Whether the endpoint is backing off after a 429/5xx response",  # backoff 중 여부
+            labels=["endpoint"],
+        )
+        throttles = CounterMetricFamily(
+            "ktcloud_api_throttle_events",
+            "KT Cloud API responses treated as throttling (429/5xx)",  # 속도 제한 응답 횟수
+            labels=["endpoint", "status"],
+        )
+        waits = CounterMetricFamily(
+            "ktcloud_api_rate_limit_wait_seconds",
+            "Time spent waiting for the rate limiter",  # 속도 제한으로 대기한 시간
+            labels=["endpoint"],
+        )
+        for endpoint, stats in sorted(self.limiter.stats().items()):
+            if stats["concurrency_limit"] is not None:
+                concurrency.add_metric([endpoint], int(stats["concurrency_limit"]))
+            rate.add_metric([endpoint], stats["rate"])
+            in_flight.add_metric([endpoint], stats["in_flight"])
+            backoff.add_metric([endpoint], 1 if stats["blocked"] else 0)
+            for status, count in sorted(stats["throttle_events"].items()):
+                throttles.add_metric([endpoint, str(status)], count)
+            waits.add_metric([endpoint], stats["wait_seconds"])
+        return [concurrency, rate, in_flight, backoff, throttles, waits]
+
+
+class CollectionTarget:
+    """
+    수집 대상 하나 (계정, 존)의 연결과 수집 상태
+    - 대상별로 ZoneManager(토큰, connection pool)와 LB 인벤토리를 따로 유지
+    - 데이터 종류별 수집 주기와 최근 수집 결과도 대상별로 관리
+    """
+
+    def __init__(self, account, id, password, zone):
+        self.account = account  # account 레이블 값
+        self.zone_name = zone  # KT Cloud 존 이름 (zone 레이블 값)
+        self._id = id
+        self._password = password
+
+        # 직전 수집 주기의 LB 목록과 레이블 캐시
+        self.inventory = LBInventory(account, zone)
+
+        # 데이터 종류별 수집 주기와 다음 수집 예정 시간
+        self.schedule_intervals = {
+            "topology": TOPOLOGY_INTERVAL,
+            "servers": SERVER_INTERVAL,
+            "usage": USAGE_INTERVAL,
+        }
+        self.next_due = {name: 0 for name in self.schedule_intervals}
+        # 종류별 최근 수집 결과 (수집하지 않은 종류는 이 값을 스냅샷에 사용)
+        # lb_server_times는 LB별 서버 정보 조회 성공 시간, lb_server_failed는 직전 조회가 실패한 LB
+        self.collected = {
+            "lb_list": [],
+            "lb_servers": {},
+            "lb_usage": {},
+            "lb_server_times": {},
+            "lb_server_failed": set(),
+        }
+
+        # 수집 주기 예산(CYCLE_BUDGET) 초과로 취소한 LB별 조회 수 (build_temp_data()에서 넘기고 초기화)
+        self.budget_dropped = {"servers": 0, "usage": 0}
+
+        self.zone_mgr = None  # KT Cloud Zone Manager
+        self.network = None  # Network Resource Manager
+        # LB별 조회용 스레드 풀 (수집 주기마다 재사용, 스레드는 처음 조회할 때 생성됨)
+        self.fetch_executor = (
+            ThreadPoolExecutor(
+                max_workers=LB_FETCH_CONCURRENCY,
+                thread_name_prefix=f"lb-fetch-{account}",
+            )
+            if LB_FETCH_CONCURRENCY > 1
+            else None
+        )
+        # shard 모드에서 이 레플리카가 맡는 (번호, 전체 레플리카 수), None이면 전체 LB 수집
+        self.shard = None
+
+    @property
+    def name(self):
+        """로그에 표시할 수집 대상 이름"""
+        return f"{self.account}/{self.zone_name}"
+
+    def connect(self):
+        """
+        KT Cloud 연결 초기화
+        - Zone Manager 생성 (인증 및 존 관리)
+        - Network Resource Manager 생성 (LB 관련 API 호출)
+        """
+        # 대상의 모든 API 호출은 ZoneManager의 connection pool을 공유함
+        self.zone_mgr = kcl.ZoneManager(
+            self._id,
+            self._password,
+            self.zone_name,
+            pool_size=HTTP_POOL_SIZE,
+            keep_alive=HTTP_KEEP_ALIVE,
+            connect_timeout=HTTP_CONNECT_TIMEOUT,
+            read_timeout=HTTP_READ_TIMEOUT,
+            max_retries=HTTP_MAX_RETRIES,
+            lazy_init=KTCLOUD_LAZY_INIT,
+        )
+        self.network = self.zone_mgr.network_resource()
+        logger.info(f"[{self.name}] KT Cloud 연결 성공")
+
+    async def connect_async(self):
+        """KT Cloud 연결 초기화 (asyncio 모드) - aiohttp 기반 Zone Manager, Network Resource 생성"""
+        import kclasync
+
+        zone_mgr = kclasync.AsyncZoneManager(
+            self._id,
+            self._password,
+            self.zone_name,
+            pool_size=HTTP_POOL_SIZE,
+            keep_alive=HTTP_KEEP_ALIVE,
+            connect_timeout=HTTP_CONNECT_TIMEOUT,
+            read_timeout=HTTP_READ_TIMEOUT,
+            max_retries=HTTP_MAX_RETRIES,
+        )
+        try:
+            await zone_mgr.connect()
+        except BaseException:
+            await zone_mgr.close()
+            raise
+        self.zone_mgr = zone_mgr
+        self.network = zone_mgr.network_resource()
+        logger.info(f"[{self.name}] KT Cloud 연결 성공 (asyncio)")
+
+    def owns(self, lb):
+        """shard 모드에서 이 레플리카가 수집할 LB인지 확인 (레플리카 간 같은 결과가 나오는 해시 사용)"""
+        if self.shard is None:
+            return True
+        index, count = self.shard
+        key = f"{self.account}/{self.zone_name}/{lb.lb_id}".encode("utf-8")
+        return zlib.crc32(key) % count == index
+
+    def next_due_time(self):
+        """가장 먼저 돌아오는 데이터 종류의 다음 수집 예정 시간"""
+        return min(
+            self.next_due[name]
+            for name, interval in self.schedule_intervals.items()
+            if interval > 0
+        )
+
+    def schedule_retry(self, now, names):
+        """실패한 데이터 종류를 서버 정보 주기(더 짧은 쪽)에 맞춰 다시 수집하도록 예약"""
+        retry = min(
+            self.schedule_intervals["topology"], self.schedule_intervals["servers"]
+        )
+        for name in names:
+            self.next_due[name] = now + retry
+
+    def collect(self):
+        """
+        수집 대상 하나의 데이터 수집 (대상별 스레드에서 동시에 호출됨)
+        예외가 발생해도 다른 대상의 수집에 영향을 주지 않도록 직전 수집 결과로 대체합니다.
+        Returns:
+            dict: collect_data_to_temp() 결과 (실패 시 up=False)
+        """
+        now = time.time()
+        due = self.due_data_classes(now)
+        try:
+            with trace_span(
+                "target", account=self.account, zone=self.zone_name, due=due
+            ):
+                # 지연 초기화 또는 lease 모드에서는 처음 수집할 때 연결
+                if self.zone_mgr is None:
+                    with trace_span("connect"):
+                        self.connect()
+                return self.collect_data_to_temp(due)
+        except Exception as e:
+            logger.error(f"[{self.name}] 데이터 수집 실패: {e}")
+            self.schedule_retry(now, due)
+            return self.build_temp_data(now, up=False)
+
+    async def collect_async(self):
+        """collect()의 asyncio 버전 (대상별 task에서 동시에 호출됨)"""
+        now = time.time()
+        due = self.due_data_classes(now)
+        try:
+            with trace_span(
+                "target", account=self.account, zone=self.zone_name, due=due
+            ):
+                if self.zone_mgr is None:
+                    with trace_span("connect"):
+                        await self.connect_async()
+                return await self.collect_data_to_temp_async(due)
+        except Exception as e:
+            logger.error(f"[{self.name}] 데이터 수집 실패: {e}")
+            self.schedule_retry(now, due)
+            return self.build_temp_data(now, up=False)
+
+    def due_data_classes(self, now=None):
+        """
+        수집 주기가 돌아온 데이터 종류 목록
+        Returns:
+            list: topology, servers, usage 중 이번에 수집할 종류 (정의 순서 유지)
+        """
+        now = time.time() if now is None else now
+        return [
+            name
+            for name, interval in self.schedule_intervals.items()
+            if interval > 0 and now >= self.next_due[name]
+        ]
+
+    def collect_data_to_temp(self, due=None):
+        """
+        1단계: 데이터를 임시 저장소에 수집 (메트릭 업데이트 없음)
+        KT Cloud API를 호출하여 LB 정보를 수집하지만,
+        Prometheus 메트릭은 업데이트하지 않고 임시 저장소에만 보관합니다.
+        이렇게 하면 데이터 수집 중에 Prometheus가 스크랩해도 일관된 데이터를 읽을 수 있습니다.
+        데이터 종류별로 수집 주기가 다르며, 이번에 수집하지 않은 종류는 직전 수집 결과를 합쳐서 반환합니다.
+        - topology: LB 목록 (list_lb_info)
+        - servers: LB별 서버 상태/성능 (list_lb_server)
+        - usage: LB별 사용량 (get_lb_usage)
+        Args:
+            due (list): 이번에 수집할 데이터 종류 (None이면 주기가 돌아온 종류)
+        Returns:
+            dict: 수집된 데이터를 담은 딕셔너리
+            - lb_list: LB 목록
+            - lb_servers: LB별 서버 정보
+            - lb_usage: LB별 최근 사용량
+            - service_type_counts: 서비스 타입별 개수
+            - lb_changes: 이전 수집 대비 추가/삭제/변경된 LB ID
+            - up: 수집 성공 여부 (LB 목록 조회 실패 시 False)
+            - collection_time: 수집 시간
+        """
+        now = time.time()
+        if due is None:
+            due = self.due_data_classes(now)
+        changes = None
+        up = True
+        self.log_collection_start(due)
+
+        # 1. LB 목록 조회 (KT Cloud API 호출)
+        if "topology" in due:
+            with trace_span("list_lb_info"):
+                lb_list = materialize(
+                    self.network.list_lb_info(records=True, stream=KTCLOUD_STREAM_JSON)
+                )
+            changes, up = self.apply_lb_list(lb_list, now)
+
+        # 2. 각 LB별 서버 정보 수집
+        targets = self.server_fetch_targets(due, changes, now)
+        if targets:
+            with trace_span("fetch_servers", lbs=len(targets)):
+                self.apply_lb_servers(
+                    self.fan_out(self.fetch_lb_servers, targets, "servers", "서버 정보"), now
+                )
+
+        # 3. LB별 사용량 수집
+        lb_list = self.collected["lb_list"]
+        if "usage" in due and lb_list:
+            with trace_span("fetch_usage", lbs=len(lb_list)):
+                self.collected["lb_usage"] = self.fan_out(
+                    self.fetch_lb_usage, lb_list, "usage", "사용량"
+                )
+            self.next_due["usage"] = now + self.schedule_intervals["usage"]
+
+        temp_data = self.build_temp_data(now, changes, up)
+        logger.info(f"[{self.name}] 임시 데이터 수집 완료")
+
+        return temp_data
+
+    async def collect_data_to_temp_async(self, due=None):
+        """collect_data_to_temp()의 asyncio 버전 - LB별 조회를 event loop에서 동시에 진행"""
+        now = time.time()
+        if due is None:
+            due = self.due_data_classes(now)
+        changes = None
+        up = True
+        self.log_collection_start(due)
+
+        if "topology" in due:
+            with trace_span("list_lb_info"):
+                lb_list = await self.network.list_lb_info(
+                    records=True, stream=KTCLOUD_STREAM_JSON
+                )
+            changes, up = self.apply_lb_list(lb_list, now)
+
+        targets = self.server_fetch_targets(due, changes, now)
+        if targets:
+            with trace_span("fetch_servers", lbs=len(targets)):
+                self.apply_lb_servers(
+                    await self.fan_out_async(
+                        self.fetch_lb_servers_async, targets, "servers", "서버 정보"
+                    ),
+                    now,
+                )
+
+        lb_list = self.collected["lb_list"]
+        if "usage" in due and lb_list:
+            with trace_span("fetch_usage", lbs=len(lb_list)):
+                self.collected["lb_usage"] = await self.fan_out_async(
+                    self.fetch_lb_usage_async, lb_list, "usage", "사용량"
+                )
+            self.next_due["usage"] = now + self.schedule_intervals["usage"]
+
+        temp_data = self.build_temp_data(now, changes, up)
+        logger.info(f"[{self.name}] 임시 데이터 수집 완료")
+
+        return temp_data
+
+    def log_collection_start(self, due):
+        logger.info(
+            f"[{self.name}] 임시 저장소에 데이터 수집 시작 - 대상: {', '.join(due) or '없음'}"
+        )
+
+    def apply_lb_list(self, lb_list, now):
+        """
+        조회한 LB 목록을 인벤토리와 최근 수집 결과에 반영
+        Args:
+            lb_list (list): list_lb_info() 결과 (조회 실패 시 None)
+            now (float): 수집 시작 시간
+        Returns:
+            tuple: (이전 수집 대비 변경 사항, 수집 성공 여부)
+        """
+        collected = self.collected
+        if lb_list is None:
+            # 조회 실패 - 직전 LB 목록(인벤토리)을 그대로 유지하고 수집 실패(up=False)로 처리하여
+            # build_temp_data()에서 모든 LB를 stale로 표시, 서버 정보 주기에 맞춰 다시 조회
+            logger.warning(f"[{self.name}] LB 목록 조회 실패 - 직전 LB 목록 유지")
+            self.schedule_retry(now, ["topology"])
+            return {"added": [], "removed": [], "changed": []}, False
+
+        if self.shard is not None:
+            # shard 모드 - 이 레플리카 몫의 LB만 서버/사용량을 조회하고 노출
+            lb_list = [lb for lb in lb_list if self.owns(lb)]
+        if lb_list:
+            logger.info(f"[{self.name}] LB {len(lb_list)}개 발견")
+        else:
+            # 조회는 성공했지만 LB 없음 - 목록을 비우고 서버 정보 주기에 맞춰 다시 조회
+            logger.warning(f"[{self.name}] LB 목록이 비어있습니다.")
+
+        # 이전 수집 주기 대비 변경 사항 계산 (변경된 LB만 레이블을 다시 생성)
+        changes = self.inventory.update(lb_list)
+        logger.info(
+            f"[{self.name}] LB 변경 사항 - 추가: {len(changes['added'])}개, "
+            f"삭제: {len(changes['removed'])}개, 변경: {len(changes['changed'])}개"
+        )
+
+        # 삭제된 LB의 서버/사용량 데이터 제거
+        for lb_id in changes["removed"]:
+            collected["lb_servers"].pop(lb_id, None)
+            collected["lb_usage"].pop(lb_id, None)
+            collected["lb_server_times"].pop(lb_id, None)
+            collected["lb_server_failed"].discard(lb_id)
+
+        collected["lb_list"] = lb_list
+        if lb_list:
+            self.next_due["topology"] = now + self.schedule_intervals["topology"]
+        else:
+            self.schedule_retry(now, ["topology"])
+        return changes, True
+
+    def apply_lb_servers(self, results, now):
+        """
+        LB별 서버 정보 조회 결과를 최근 수집 결과에 반영
+        조회에 실패한 LB(결과 None)는 마지막으로 성공한 서버 정보를 그대로 두고 실패로 표시합니다.
+        (SERVER_CACHE_TTL이 지나면 build_temp_data()에서 제거)
+        Args:
+            results (dict): lb_id -> 서버 목록 (조회 실패 시 None)
+            now (float): 수집 시작 시간
+        """
+        collected = self.collected
+        failed = []
+        for lb_id, servers in results.items():
+            if servers is None:
+                collected["lb_server_failed"].add(lb_id)
+                failed.append(lb_id)
+                continue
+            collected["lb_servers"][lb_id] = servers
+            collected["lb_server_times"][lb_id] = now
+            collected["lb_server_failed"].discard(lb_id)
+        if failed:
+            cached = sum(1 for lb_id in failed if lb_id in collected["lb_server_times"])
+            logger.warning(
+                f"[{self.name}] LB {len(failed)}개 서버 정보 조회 실패 - "
+                f"직전 데이터 사용: {cached}개"
+            )
+
+    def server_fetch_targets(self, due, changes, now):
+        """
+        서버 정보를 조회할 LB 목록
+        주기가 돌아오면 전체 LB, 아니면 새로 추가/변경된 LB만 조회합니다.
+        """
+        lb_list = self.collected["lb_list"]
+        if "servers" in due:
+            self.next_due["servers"] = now + self.schedule_intervals["servers"]
+            return lb_list
+        if not changes:
+            return []
+        resolve_ids = set(changes["added"] + changes["changed"])
+        return [lb for lb in lb_list if lb.lb_id in resolve_ids]
+
+    def build_temp_data(self, now, changes=None, up=True):
+        """
+        종류별 최근 수집 결과를 합쳐 스냅샷 생성에 사용할 임시 데이터 구성
+        직전 조회가 실패한 LB(수집 대상 전체 또는 LB 목록 조회가 실패한 경우 모든 LB)의 서버 정보는 stale로 표시하고,
+        마지막 성공 후 SERVER_CACHE_TTL이 지났으면 제거합니다.
+        """
+        collected = self.collected
+        lb_list = collected["lb_list"]
+        lb_servers = collected["lb_servers"]
+        server_times = collected["lb_server_times"]
+
+        lb_data_age = {}
+        lb_stale = set()
+        for lb in lb_list:
+            lb_id = lb.lb_id
+            if up and lb_id not in collected["lb_server_failed"]:
+                if lb_id in server_times:
+                    lb_data_age[lb_id] = max(0.0, now - server_times[lb_id])
+                continue
+            lb_stale.add(lb_id)
+            if lb_id not in server_times:
+                continue
+            age = now - server_times[lb_id]
+            if age > SERVER_CACHE_TTL:
+                # 캐시 만료 - 서버 메트릭 제거 (LB는 stale로 남음)
+                lb_servers.pop(lb_id, None)
+                server_times.pop(lb_id)
+                continue
+            lb_data_age[lb_id] = age
+
+        # 서비스 타입별 개수 카운트
+        service_type_counts = {}
+        for lb in lb_list:
+            service_type = lb.service_type  # 서비스 타입 (HTTP, HTTPS, TCP 등)
+            service_type_counts[service_type] = (
+                service_type_counts.get(service_type, 0) + 1
+            )
+
+        # 수집 주기 예산 초과 여부와 취소한 조회 수
+        dropped, self.budget_dropped = self.budget_dropped, {"servers": 0, "usage": 0}
+        remaining = kcl.ku.remaining_time()
+        budget_exceeded = any(dropped.values()) or (
+            remaining is not None and remaining <= 0
+        )
+        if budget_exceeded:
+            logger.warning(
+                f"[{self.name}] 수집 주기 예산 초과 - 취소한 조회: "
+                f"서버 정보 {dropped['servers']}개, 사용량 {dropped['usage']}개"
+            )
+
+        # 종류별 최근 수집 결과를 합친 임시 데이터
+        return {
+            "lb_list": lb_list,  # LB 기본 정보 목록
+            "lb_servers": {  # LB별 서버 상세 정보
+                lb.lb_id: lb_servers.get(lb.lb_id, []) for lb in lb_list
+            },
+            "lb_usage": dict(collected["lb_usage"]),  # LB별 최근 사용량
+            "lb_data_age": lb_data_age,  # LB별 서버 정보 나이 (초)
+            "lb_stale": lb_stale,  # 직전 조회 실패로 캐시된 서버 정보를 사용한 LB
+            "service_type_counts": service_type_counts,  # 서비스 타입별 카운트
+            "lb_changes": changes
+            or {"added": [], "removed": [], "changed": []},  # LB 변경 사항
+            "up": up,  # 수집 성공 여부
+            "budget_exceeded": budget_exceeded,  # 수집 주기 예산 초과 여부
+            "budget_dropped": dropped,  # 예산 초과로 취소한 종류별 LB 조회 수
+            "collection_time": now,  # 수집 시작 시간
+        }
+
+    def fan_out(self, fetch, lb_list, kind, description):
+        """
+        LB별 조회 함수를 대상의 스레드 풀(fetch_executor)로 동시에 실행
+        동시 조회 개수가 1 이하이면 기존과 같이 순차 조회합니다.
+        수집 주기 예산(CYCLE_BUDGET)이 끝나면 시작하지 않은 조회는 취소하고 결과를 None으로 처리합니다.
+        진행 중인 조회는 기다리지 않지만 timeout이 남은 예산 이하로 제한되어 있어 곧 끝나고 스레드를 반환합니다.
+        Args:
+            fetch (callable): LB 정보를 받아 (lb_id, 결과)를 반환하는 함수
+            lb_list (list): 조회 대상 LB 목록
+            kind (str): 데이터 종류 (servers, usage), 예산 초과로 취소한 조회 수 집계에 사용
+            description (str): 로그에 표시할 조회 대상 이름
+        Returns:
+            dict: lb_id -> 결과 (lb_list 순서 유지)
+        """
+        results = {}
+        if LB_FETCH_CONCURRENCY <= 1:
+            for i, lb in enumerate(lb_list):
+                try:
+                    lb_id, result = fetch(lb)
+                except kcl.ku.DeadlineExceeded:
+                    lb_id, result = lb.lb_id, None
+                    self.budget_dropped[kind] += 1
+                results[lb_id] = result
+                logger.debug(f"LB {i+1}/{len(lb_list)} '{lb.lb_name}' {description} 조회")
+            return results
+
+        workers = min(LB_FETCH_CONCURRENCY, len(lb_list))
+        futures = [context_submit(self.fetch_executor, fetch, lb) for lb in lb_list]
+        try:
+            wait_futures(futures, timeout=kcl.ku.remaining_time())
+        finally:
+            # 예산이 끝날 때까지 시작하지 않은 조회는 취소 (다음 수집 주기의 조회보다 먼저 실행되지 않도록)
+            for future in futures:
+                future.cancel()
+        for lb, future in zip(lb_list, futures):
+            # 예산이 끝날 때까지 완료되지 않았거나 deadline으로 중단된 조회
+            if (
+                not future.done()
+                or future.cancelled()
+                or isinstance(future.exception(), kcl.ku.DeadlineExceeded)
+            ):
+                results[lb.lb_id] = None
+                self.budget_dropped[kind] += 1
+                continue
+            lb_id, result = future.result()
+            results[lb_id] = result
+        logger.info(
+            f"[{self.name}] LB {description} 동시 조회 완료 - {len(lb_list)}개, 동시 조회 개수: {workers}"
+        )
+        return results
+
+    async def fan_out_async(self, fetch, lb_list, kind, description):
+        """
+        fan_out()의 asyncio 버전 - LB별 조회 coroutine을 동시에 실행
+        진행 중인 요청 수는 LB_FETCH_CONCURRENCY로 제한하고, connection 수는 HTTP_POOL_SIZE로 제한됩니다.
+        수집 주기 예산이 끝나면 남은 task를 취소하고 결과를 None으로 처리합니다.
+        Returns:
+            dict: lb_id -> 결과 (lb_list 순서 유지)
+        """
+        limit = asyncio.Semaphore(max(1, LB_FETCH_CONCURRENCY))
+
+        async def limited(lb):
+            async with limit:
+                return await fetch(lb)
+
+        # coroutine마다 task(컨텍스트 복사본)를 만들고 예산이 끝날 때까지 대기
+        tasks = [asyncio.ensure_future(limited(lb)) for lb in lb_list]
+        if not tasks:
+            return {}
+        _, pending = await asyncio.wait(tasks, timeout=kcl.ku.remaining_time())
+        for task in pending:
+            task.cancel()
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
+
+        results = {}
+        for lb, task in zip(lb_list, tasks):
+            if task.cancelled() or isinstance(
+                task.exception(), kcl.ku.DeadlineExceeded
+            ):
+                results[lb.lb_id] = None
+                self.budget_dropped[kind] += 1
+                continue
+            lb_id, result = task.result()
+            results[lb_id] = result
+        logger.info(
+            f"[{self.name}] LB {description} 동시 조회 완료 - {len(lb_list)}개, "
+            f"동시 요청 개수: {min(LB_FETCH_CONCURRENCY, len(lb_list))}"
+        )
+        return results
 
-# .env 파일에서 환경 변수 로드
-load_dotenv()
+    def fetch_lb_servers(self, lb):
+        """
+        LB 하나에 연결된 서버 정보 조회 (스레드 풀에서 동시에 호출됨)
+        조회 실패 시 예외를 전파하지 않고 None으로 처리합니다. (apply_lb_servers()에서 직전 데이터 사용)
+        Args:
+            lb (LBRecord): list_lb_info()가 반환한 LB 정보
+        Returns:
+            tuple: (lb_id, 서버 목록 또는 None)
+        """
+        lb_id = lb.lb_id
+        try:
+            with trace_span("list_lb_server", detail=True, lb_id=lb_id):
+                servers = materialize(
+                    self.network.list_lb_server(
+                        lb_id,
+                        timeout=LB_FETCH_TIMEOUT,
+                        records=True,
+                        stream=KTCLOUD_STREAM_JSON,
+                    )
+                )
+            # API 오류 응답이면 SDK가 None을 돌려줌 (서버가 없는 LB는 빈 목록)
+            return lb_id, servers
+        except kcl.ku.DeadlineExceeded:
+            # 수집 주기 예산 초과는 fan_out()에서 집계
+            raise
+        except Exception as e:
+            # 특정 LB 처리 실패 시 실패로 표시하고 계속 진행
+            logger.error(f"LB {lb.lb_name} 데이터 수집 실패: {e}")
+            return lb_id, None
 
-# 환경 변수에서 KT Cloud 접속 정보 및 설정값 읽기
-CLOUD_ID = os.getenv("CLOUD_ID")  # KT Cloud 계정 ID
-CLOUD_PASSWORD = os.getenv("CLOUD_PASSWORD")  # KT Cloud 계정 비밀번호
-CLOUD_ZONE = os.getenv("CLOUD_ZONE")  # KT Cloud 존 정보 (예: DX-M1)
-EXPORTER_PORT = 9105  # Prometheus 메트릭 노출 포트
-SCRAPE_INTERVAL = 60  # 메트릭 수집 주기 (초)
+    async def fetch_lb_servers_async(self, lb):
+        """fetch_lb_servers()의 asyncio 버전"""
+        lb_id = lb.lb_id
+        try:
+            with trace_span("list_lb_server", detail=True, lb_id=lb_id):
+                servers = await self.network.list_lb_server(
+                    lb_id,
+                    timeout=LB_FETCH_TIMEOUT,
+                    records=True,
+                    stream=KTCLOUD_STREAM_JSON,
+                )
+            return lb_id, servers
+        except kcl.ku.DeadlineExceeded:
+            raise
+        except Exception as e:
+            logger.error(f"LB {lb.lb_name} 데이터 수집 실패: {e}")
+            return lb_id, None
 
-# 로깅 설정 - 시간, 로거명, 레벨, 메시지 형태로 출력
-logging.basicConfig(
-    level=logging.INFO, format="%(asctime)s  %(name)s-%(levelname)s - %(message)s"
-)
-logger = logging.getLogger(__name__)
+    def fetch_lb_usage(self, lb):
+        """
+        LB 하나의 최근 사용량 조회 (어제~오늘 중 가장 최근 날짜)
+        Args:
+            lb (LBRecord): list_lb_info()가 반환한 LB 정보
+        Returns:
+            tuple: (lb_id, 사용량 정보 또는 None)
+        """
+        lb_id = lb.lb_id
+        try:
+            with trace_span("get_lb_usage", detail=True, lb_id=lb_id):
+                usage = self.network.get_lb_usage(
+                    lb.lb_name, *self.usage_date_range(), timeout=LB_FETCH_TIMEOUT
+                )
+            return lb_id, self.latest_usage(usage)
+        except kcl.ku.DeadlineExceeded:
+            raise
+        except Exception as e:
+            logger.error(f"LB {lb.lb_name} 사용량 수집 실패: {e}")
+            return lb_id, None
+
+    async def fetch_lb_usage_async(self, lb):
+        """fetch_lb_usage()의 asyncio 버전"""
+        lb_id = lb.lb_id
+        try:
+            with trace_span("get_lb_usage", detail=True, lb_id=lb_id):
+                usage = await self.network.get_lb_usage(
+                    lb.lb_name, *self.usage_date_range(), timeout=LB_FETCH_TIMEOUT
+                )
+            return lb_id, self.latest_usage(usage)
+        except kcl.ku.DeadlineExceeded:
+            raise
+        except Exception as e:
+            logger.error(f"LB {lb.lb_name} 사용량 수집 실패: {e}")
+            return lb_id, None
+
+    @staticmethod
+    def usage_date_range():
+        """사용량 조회 기간 (어제, 오늘)"""
+        today = datetime.date.today()
+        start_date = (today - datetime.timedelta(days=1)).strftime("%Y-%m-%d")
+        return start_date, today.strftime("%Y-%m-%d")
+
+    @staticmethod
+    def latest_usage(usage):
+        """조회한 사용량 중 가장 최근 날짜 (없으면 None)"""
+        if not usage:
+            return None
+        return max(usage, key=lambda item: item.get("date", ""))
 
 
 class AtomicKTCloudLBExporter:
@@ -42,8 +1968,12 @@ class AtomicKTCloudLBExporter:
     - 메트릭 업데이트 중 충돌 감지 및 처리
     """
 
-    def __init__(self):
-        """익스포터 초기화 - 메트릭 정의 및 KT Cloud 연결 설정"""
+    def __init__(self, targets=None):
+        """
+        익스포터 초기화 - 메트릭 정의 및 KT Cloud 연결 설정
+        Args:
+            targets (list): load_targets() 형식의 수집 대상 목록 (None이면 환경 변수에서 읽음)
+        """
 
         # Prometheus 메트릭 레지스트리 생성 (독립적인 메트릭 관리)
         self.registry = CollectorRegistry()
@@ -51,243 +1981,213 @@ class AtomicKTCloudLBExporter:
         # 스레드 안전성을 위한 재귀락 (Reentrant Lock)
         # 같은 스레드에서 여러 번 락을 획득할 수 있음
         self.update_lock = threading.RLock()
-        # 현재 업데이트 상태 플래그
-        self.is_updating = False
-        # 메트릭 저장소 (현재 사용되지 않지만 확장성을 위해 유지)
-        self.current_metrics = {}
-        self.temp_metrics = {}
-
-        # Prometheus 메트릭 정의
-        # 1. 전체 LB 개수
-        self.lb_count = Gauge(
-            "ktcloud_lb_total_count",
-            "Total number of load balancers",  # 전체 로드밸런서 개수
-            registry=self.registry,
-        )
-
-        # 2. LB 기본 정보 (상태, IP, 포트 등)
-        self.lb_info = Gauge(
-            "ktcloud_lb_info",
-            "Load balancer information (value: 1=UP, 0=DOWN)",  # LB 정보 (1=정상, 0=다운)
-            [
-                "lb_id",
-                "lb_name",
-                "service_ip",
-                "service_port",
-                "service_type",
-                "lb_option",
-                "healthcheck_type",
-                "zone",
-            ],  # 레이블들
-            registry=self.registry,
-        )
+        # 수집 루프 상태 (/healthz, /readyz 응답에 사용)
+        self.cycle_in_progress = False  # 수집 주기 진행 여부
+        self.cycle_start_time = None  # 진행 중인 수집 주기의 시작 시간
+        self.last_success_time = None  # 마지막 성공 수집(게시) 시간
 
-        # 3. LB별 연결된 서버 개수
-        self.lb_server_count = Gauge(
-            "ktcloud_lb_server_count",
-            "Number of servers connected to load balancer",  # LB에 연결된 서버 수
-            ["lb_id", "lb_name", "zone"],
-            registry=self.registry,
-        )
+        # LB 메트릭 (1~14번)은 수집 주기마다 스냅샷으로 교체되는 Collector로 노출
+        self.snapshot_collector = LBSnapshotCollector()
+        self.registry.register(self.snapshot_collector)
 
-        # 4. LB 내 개별 서버 상태
-        self.lb_server_state = Gauge(
-            "ktcloud_lb_server_state",
-            "Server state in load balancer (1=UP, 0=DOWN)",  # 서버 상태 (1=정상, 0=다운)
-            ["lb_id", "lb_name", "server_ip", "server_port", "zone"],
+        # 익스포터 운영 메트릭들
+        # 15. 메트릭 수집 소요 시간
+        self.scrape_duration = Gauge(
+            "ktcloud_lb_scrape_duration_seconds",
+            "Time spent scraping KT Cloud LB metrics",  # 메트릭 수집에 걸린 시간(초)
             registry=self.registry,
         )
 
-        # 서버 성능 메트릭들
-        # 5. 서버별 현재 연결 수
-        self.server_connections = Gauge(
-            "ktcloud_server_current_connections",
-            "Current number of connections to the server",  # 서버의 현재 연결 수
-            ["lb_id", "lb_name", "server_ip", "server_port", "zone"],
+        # 16. 마지막 성공적인 수집 시간
+        self.last_scrape_timestamp = Gauge(
+            "ktcloud_lb_last_scrape_timestamp",
+            "Timestamp of last successful scrape",  # 마지막 성공 수집 타임스탬프
             registry=self.registry,
         )
 
-        # 6. 서버별 처리량 (KB/s)
-        self.server_throughput_rate = Gauge(
-            "ktcloud_server_throughput_rate_kbps",
-            "Server throughput rate in KB/s",  # 서버 처리량 (KB/초)
-            ["lb_id", "lb_name", "server_ip", "server_port", "zone"],
+        # 17. 업데이트 충돌 발생 횟수 (Prometheus 스크랩과 충돌)
+        self.update_conflicts = Counter(
+            "ktcloud_lb_update_conflicts_total",
+            "Number of times Prometheus scraped during metric updates",  # 업데이트 중 충돌 횟수
             registry=self.registry,
         )
 
-        # 7. 서버별 평균 응답 시간 (TTFB-Time To First Byte)
-        self.server_avg_ttfb = Gauge(
-            "ktcloud_server_avg_ttfb_ms",
-            "Average server Time To First Byte in milliseconds",  # 평균 첫 바이트 응답 시간 (ms)
-            ["lb_id", "lb_name", "server_ip", "server_port", "zone"],
+        # 18. 성공적인 원자적 업데이트 횟수
+        self.atomic_updates = Counter(
+            "ktcloud_lb_atomic_updates_total",
+            "Number of successful atomic metric updates",  # 성공적인 원자적 업데이트 횟수
             registry=self.registry,
         )
 
-        # 8. 서버별 초당 요청 처리량
-        self.server_requests_rate = Gauge(
-            "ktcloud_server_requests_rate_per_sec",
-            "Server requests rate per second",  # 서버별 초당 요청 수
-            ["lb_id", "lb_name", "server_ip", "server_port", "zone"],
+        # 19. 익스포터 정보 (버전, 설정 등)
+        self.exporter_info = Info(
+            "ktcloud_lb_exporter_info",
+            "KT Cloud Load Balancer Exporter Information",  # 익스포터 정보
             registry=self.registry,
         )
 
-        # 9. 서비스 타입별 LB 개수 (HTTP, HTTPS, TCP 등)
-        self.service_type_count = Gauge(
-            "ktcloud_lb_service_type_count",
-            "Count of load balancers by service type",  # 서비스 타입별 LB 개수
-            ["service_type", "zone"],
+        # 20. LB 인벤토리 변경 횟수 (added, removed, changed)
+        self.inventory_changes = Counter(
+            "ktcloud_lb_inventory_changes_total",
+            "Number of load balancers added, removed or changed between collections",  # 수집 주기 간 LB 변경 횟수
+            ["change", "account", "zone"],
             registry=self.registry,
         )
 
-        # 익스포터 운영 메트릭들
-        # 10. 메트릭 수집 소요 시간
-        self.scrape_duration = Gauge(
-            "ktcloud_lb_scrape_duration_seconds",
-            "Time spent scraping KT Cloud LB metrics",  # 메트릭 수집에 걸린 시간(초)
+        # 21. 이 레플리카의 수집 담당 여부 (lease 모드에서 리더가 아니면 0)
+        self.collector_role = Gauge(
+            "ktcloud_lb_exporter_collecting",
+            "Whether this replica collects from KT Cloud (0 = serving the leader snapshot)",  # 수집 담당 여부
+            ["mode", "replica"],
             registry=self.registry,
         )
 
-        # 11. 마지막 성공적인 수집 시간
-        self.last_scrape_timestamp = Gauge(
-            "ktcloud_lb_last_scrape_timestamp",
-            "Timestamp of last successful scrape",  # 마지막 성공 수집 타임스탬프
+        # 22. KT Cloud API 호출 메트릭 (SDK 요청 관찰자로 command별 응답 시간, 상태 코드 등 기록)
+        self.api_metrics = APIMetricsObserver(self.registry)
+        kcl.ku.add_request_observer(self.api_metrics)
+
+        # 23. KT Cloud API 속도 제한 상태 (endpoint별 동시 요청 수 제한, 429/5xx 응답 횟수 등)
+        # 모든 SDK 요청에 적용되도록 kclutil에 등록
+        self.rate_limiter = build_rate_limiter()
+        kcl.ku.set_rate_limiter(self.rate_limiter)
+        if self.rate_limiter is not None:
+            self.registry.register(RateLimiterCollector(self.rate_limiter))
+
+        # 24. 수집 주기 예산 (CYCLE_BUDGET)
+        self.cycle_budget = Gauge(
+            "ktcloud_lb_cycle_budget_seconds",
+            "Time budget of one collection cycle",  # 수집 주기 예산(초)
             registry=self.registry,
         )
+        self.cycle_budget.set(CYCLE_BUDGET)
 
-        # 12. 업데이트 충돌 발생 횟수 (Prometheus 스크랩과 충돌)
-        self.update_conflicts = Counter(
-            "ktcloud_lb_update_conflicts_total",
-            "Number of times Prometheus scraped during metric updates",  # 업데이트 중 충돌 횟수
+        # 25. 수집 주기 예산을 넘긴 횟수 (수집 대상별)
+        self.budget_overruns = Counter(
+            "ktcloud_lb_cycle_budget_overruns_total",
+            "Number of collection cycles that ran out of their time budget",  # 예산 초과 횟수
+            ["account", "zone"],
             registry=self.registry,
         )
 
-        # 13. 성공적인 원자적 업데이트 횟수
-        self.atomic_updates = Counter(
-            "ktcloud_lb_atomic_updates_total",
-            "Number of successful atomic metric updates",  # 성공적인 원자적 업데이트 횟수
+        # 26. 예산 초과로 취소한 LB별 조회 수 (servers, usage)
+        self.budget_dropped = Counter(
+            "ktcloud_lb_cycle_budget_dropped_fetches_total",
+            "Per-LB fetches cancelled because the cycle budget ran out",  # 예산 초과로 취소한 조회 수
+            ["kind", "account", "zone"],
             registry=self.registry,
         )
 
-        # 14. 익스포터 정보 (버전, 설정 등)
-        self.exporter_info = Info(
-            "ktcloud_lb_exporter_info",
-            "KT Cloud Load Balancer Exporter Information",  # 익스포터 정보
-            registry=self.registry,
+        # /metrics 응답 캐시 (수집 주기마다 한 번만 렌더링)
+        self.exposition_cache = ExpositionCache(self.registry)
+
+        # 최근 수집 주기 추적(span tree)과 요청 시 다음 한 주기에 적용할 프로파일러
+        self.tracer = CycleTracer()
+        if self.tracer.traces is not None:
+            kcl.ku.add_request_observer(TraceRequestObserver())
+        self.pending_profiler = None  # POST /debug/profile로 예약된 CycleProfiler
+        self.last_profile = None  # 마지막 프로파일 결과
+
+        # 수집 대상 (계정, 존)별 연결과 수집 상태
+        self.targets = [
+            CollectionTarget(**target)
+            for target in (load_targets() if targets is None else targets)
+        ]
+
+        # 레플리카 간 수집 조정 (COORDINATION_MODE)
+        self.lease = None  # lease 모드의 리더 리스
+        self.is_leader = True  # 이번 주기에 수집을 담당하는지 여부
+        self.shared_snapshot_mtime = None  # 마지막으로 읽은 공유 스냅샷 파일의 수정 시간
+        if COORDINATION_MODE == "lease":
+            self.lease = FileLease(
+                COORDINATION_LEASE_FILE, REPLICA_ID, COORDINATION_LEASE_TTL
+            )
+            self.is_leader = False
+        elif COORDINATION_MODE == "shard":
+            shard = replica_shard()
+            for target in self.targets:
+                target.shard = shard
+            logger.info(f"shard 모드 - 레플리카 {shard[0]}/{shard[1]}")
+        self.collector_role.labels(mode=COORDINATION_MODE, replica=REPLICA_ID).set(
+            1 if self.is_leader else 0
         )
 
         # KT Cloud 연결 초기화
-        self.zone_mgr = None  # KT Cloud Zone Manager
-        self.network = None  # Network Resource Manager
-        self.init_ktcloud_connection()
+        # 지연 초기화이거나 lease 모드이면 HTTP 서버가 먼저 뜨도록 첫 수집에서 연결
+        # asyncio 모드의 연결은 event loop 안에서 만들어야 하므로 run_async()에서 수행
+        if self.lease is None and not KTCLOUD_LAZY_INIT and not KTCLOUD_ASYNC:
+            self.init_ktcloud_connection()
+        self.set_exporter_info()
 
     def init_ktcloud_connection(self):
         """
         KT Cloud 연결 초기화
-        - Zone Manager 생성
-        - Network Resource Manager 생성
-        - 익스포터 정보 설정
+        - 수집 대상별 Zone Manager, Network Resource Manager 생성 (동시에 진행)
         """
         try:
-            logger.info("KT Cloud 연결 초기화 중...")
-
-            # KT Cloud Zone Manager 생성 (인증 및 존 관리)
-            self.zone_mgr = kcl.ZoneManager(CLOUD_ID, CLOUD_PASSWORD, CLOUD_ZONE)
-            # Network Resource Manager 생성 (LB 관련 API 호출)
-            self.network = self.zone_mgr.network_resource()
-
-            # 존 정보 가져오기
-            zone, zone_name = self.zone_mgr.get_zone()
-
-            # 익스포터 정보 메트릭 설정
-            self.exporter_info.info(
-                {
-                    "version": "2.6.0",  # 익스포터 버전
-                    "zone": zone_name,  # KT Cloud 존 이름
-                    "port": str(EXPORTER_PORT),  # 서비스 포트
-                    "scrape_interval": str(SCRAPE_INTERVAL),  # 수집 주기
-                    "data_source": "KT Cloud SDK Atomic",  # 데이터 소스
-                    "description": "Atomic update version to prevent Prometheus scrape conflicts",
-                }
+            logger.info(f"KT Cloud 연결 초기화 중... - 대상 {len(self.targets)}개")
+            self.map_targets(CollectionTarget.connect)
+
+            logger.info(
+                "KT Cloud 연결 성공 - 대상: "
+                + ", ".join(target.name for target in self.targets)
             )
-            logger.info(f"KT Cloud 연결 성공 - Zone: {zone_name}")
         except Exception as e:
             logger.error(f"KT Cloud 연결 실패: {e}")
             raise
 
-    def collect_data_to_temp(self):
+    def set_exporter_info(self):
+        """익스포터 정보 메트릭 설정 (버전, 수집 대상, 수집 주기 등)"""
+        self.exporter_info.info(
+            {
+                "version": "2.6.0",  # 익스포터 버전
+                "zone": ",".join(
+                    sorted({target.zone_name for target in self.targets})
+                ),  # KT Cloud 존 이름
+                "targets": str(len(self.targets)),  # 수집 대상 (계정, 존) 개수
+                "port": str(EXPORTER_PORT),  # 서비스 포트
+                "scrape_interval": str(SCRAPE_INTERVAL),  # 수집 주기
+                "topology_interval": str(TOPOLOGY_INTERVAL),  # LB 목록 수집 주기
+                "server_interval": str(SERVER_INTERVAL),  # 서버 상태/성능 수집 주기
+                "usage_interval": str(USAGE_INTERVAL),  # 사용량 수집 주기 (0=수집 안 함)
+                "cycle_budget": str(CYCLE_BUDGET),  # 수집 주기 예산
+                "coordination_mode": COORDINATION_MODE,  # 레플리카 간 수집 조정 방식
+                "fetch_concurrency": str(LB_FETCH_CONCURRENCY),  # LB별 조회 최대 동시 요청 수
+                "adaptive_concurrency": str(API_ADAPTIVE_CONCURRENCY).lower(),  # 동시 요청 수 자동 조절
+                "data_source": "KT Cloud SDK Atomic",  # 데이터 소스
+                "description": "Atomic update version to prevent Prometheus scrape conflicts",
+            }
+        )
+
+    def map_targets(self, func):
         """
-        1단계: 데이터를 임시 저장소에 수집 (메트릭 업데이트 없음)
-        KT Cloud API를 호출하여 LB 정보를 수집하지만,
-        Prometheus 메트릭은 업데이트하지 않고 임시 저장소에만 보관합니다.
-        이렇게 하면 데이터 수집 중에 Prometheus가 스크랩해도 일관된 데이터를 읽을 수 있습니다.
+        수집 대상별로 func를 동시에 실행 (대상이 하나이면 현재 스레드에서 실행)
         Returns:
-            dict: 수집된 데이터를 담은 딕셔너리
-            - lb_list: LB 목록
-            - lb_servers: LB별 서버 정보
-            - service_type_counts: 서비스 타입별 개수
-            - collection_time: 수집 시간
+            list: self.targets 순서의 실행 결과
         """
-        # 임시 데이터 저장소 초기화
-        temp_data = {
-            "lb_list": [],  # LB 기본 정보 목록
-            "lb_servers": {},  # LB별 서버 상세 정보
-            "service_type_counts": {},  # 서비스 타입별 카운트
-            "collection_time": time.time(),  # 수집 시작 시간
-        }
-        logger.info("임시 저장소에 데이터 수집 시작")
-
-        # 1. LB 목록 조회 (KT Cloud API 호출)
-        lb_list = self.network.list_lb_info()
-        if not lb_list:
-            logger.warning("LB 목록이 비어있습니다.")
-            return temp_data
-
-        temp_data["lb_list"] = lb_list
-        logger.info(f"LB {len(lb_list)}개 발견")
-
-        # 2. 각 LB별 상세 정보 수집
-        zone, zone_name = self.zone_mgr.get_zone()
-        service_type_counts = {}
-
-        # 각 LB에 대해 반복 처리
-        for i, lb in enumerate(lb_list):
-            try:
-                lb_name = lb["lb_name"]  # LB 이름
-                lb_id = lb["lb_id"]  # LB ID
-                service_type = lb["service_type"]  # 서비스 타입 (HTTP, HTTPS, TCP 등)
-
-                # 서비스 타입별 개수 카운트
-                service_type_counts[service_type] = (
-                    service_type_counts.get(service_type, 0) + 1
-                )
-
-                # 해당 LB에 연결된 서버 정보 조회
-                servers = self.network.list_lb_server(lb_id)
-                temp_data["lb_servers"][lb_id] = servers if servers else []
-                logger.debug(
-                    f"LB {i+1}/{len(lb_list)} '{lb_name}': {len(servers) if servers else 0}개 서버"
-                )
-            except Exception as e:
-                # 특정 LB 처리 실패 시 빈 서버 목록으로 처리하고 계속 진행
-                logger.error(f"LB {lb.get('lb_name', 'Unknown')} 데이터 수집 실패: {e}")
-                temp_data["lb_servers"][lb_id] = []
-
-        temp_data["service_type_counts"] = service_type_counts
-        logger.info("임시 데이터 수집 완료")
-
-        return temp_data
-
-    def atomic_update_metrics(self, temp_data):
+        if len(self.targets) == 1:
+            return [func(self.targets[0])]
+        with ThreadPoolExecutor(
+            max_workers=len(self.targets), thread_name_prefix="lb-target"
+        ) as executor:
+            return list(context_map(executor, func, self.targets))
+
+    def atomic_update_metrics(self, collections, collection_time):
         """
         2단계: 수집된 데이터를 원자적으로 메트릭에 업데이트
-        임시 저장소의 데이터를 실제 Prometheus 메트릭으로 업데이트합니다.
-        락을 사용하여 업데이트 중에는 다른 스레드가 접근하지 못하도록 하고,
-        모든 메트릭을 한 번에 업데이트하여 일관성을 보장합니다.
+        임시 저장소의 데이터로 새 메트릭 스냅샷을 락 밖에서 미리 만들고,
+        락 안에서는 스냅샷 참조 교체와 운영 메트릭 갱신만 수행합니다.
+        스크랩은 항상 이전 또는 새 스냅샷 중 하나를 온전히 읽으므로 일관성이 보장됩니다.
         Args:
-            temp_data (dict): collect_data_to_temp()에서 수집된 데이터
+            collections (list): 수집 대상별 (LBInventory, collect_data_to_temp() 결과) 목록
+            collection_time (float): 수집 주기 시작 시간
         """
         update_start = time.time()
 
+        # 새 스냅샷 생성 (락 없이 수행, 레이블/샘플 생성 비용은 여기서 모두 처리)
+        with trace_span("build_snapshot"):
+            snapshot = self.snapshot_collector.build_snapshot(collections)
+        build_duration = time.time() - update_start
+
         # 락 획득 시도 (non-blocking)
         if not self.update_lock.acquire(blocking=False):
             # 락 획득 실패 시 (다른 스레드가 업데이트 중)
@@ -296,173 +2196,30 @@ class AtomicKTCloudLBExporter:
             self.update_lock.acquire()  # 블로킹 모드로 대기
 
         try:
-            self.is_updating = True
             logger.debug("메트릭 원자적 업데이트 시작")
 
-            # 모든 메트릭 초기화 (이전 데이터 제거)
-            self.lb_info.clear()
-            self.lb_server_count.clear()
-            self.lb_server_state.clear()
-            self.server_connections.clear()
-            self.server_throughput_rate.clear()
-            self.server_avg_ttfb.clear()
-            self.server_requests_rate.clear()
-            self.service_type_count.clear()
-
-            # 기본 메트릭 업데이트
-            # 전체 LB 개수 설정
-            self.lb_count.set(len(temp_data["lb_list"]))
-
-            # 존 정보 가져오기
-            zone, zone_name = self.zone_mgr.get_zone()
-
-            # ===LB별 상세 정보 업데이트
-            for lb in temp_data["lb_list"]:
-                try:
-                    # LB 기본 정보 추출
-                    lb_id = str(lb["lb_id"])
-                    lb_name = lb["lb_name"]
-                    service_ip = lb["service_ip"]
-                    service_port = str(lb["service_port"])
-                    service_type = lb["service_type"]
-                    lb_option = lb["lb_option"]  # 로드밸런싱 알고리즘
-                    healthcheck_type = lb["healthcheck_type"]  # 헬스체크 방식
-
-                    # LB 상태 변환 ('UP' -> 1, 'DOWN' -> 0)
-                    state = 1 if lb["state"] == "UP" else 0
-
-                    # LB 기본 정보 메트릭 설정
-                    self.lb_info.labels(
-                        lb_id=lb_id,
-                        lb_name=lb_name,
-                        service_ip=service_ip,
-                        service_port=service_port,
-                        service_type=service_type,
-                        lb_option=lb_option,
-                        healthcheck_type=healthcheck_type,
-                        zone=zone_name,
-                    ).set(state)
-
-                    # 해당 LB의 서버 정보 처리
-                    servers = temp_data["lb_servers"].get(lb["lb_id"], [])
-                    server_count = len(servers)
-
-                    # LB별 연결된 서버 개수 설정
-                    self.lb_server_count.labels(
-                        lb_id=lb_id, lb_name=lb_name, zone=zone_name
-                    ).set(server_count)
-
-                    # 서버별 상세 정보 처리
-                    for server in servers:
-                        try:
-                            # 서버 기본 정보 추출
-                            server_ip = server["vm_ip"]
-                            server_port = str(server["vm_port"])
-
-                            # 서버 상태 변환 ('UP' -> 1, 'DOWN' -> 0)
-                            server_state = 1 if server["state"] == "UP" else 0
-
-                            # 서버 상태 메트릭 설정
-                            self.lb_server_state.labels(
-                                lb_id=lb_id,
-                                lb_name=lb_name,
-                                server_ip=server_ip,
-                                server_port=server_port,
-                                zone=zone_name,
-                            ).set(server_state)
-
-                            # 성능 메트릭 처리
-                            def safe_float(value):
-                                """안전한 float 변환 함수
-                                None, 빈 문자열, 잘못된 형식의 값을 0으로 처리"""
-                                try:
-                                    return (
-                                        float(value)
-                                        if value is not None and value != ""
-                                        else 0
-                                    )
-                                except (ValueError, TypeError):
-                                    return 0
-
-                            # 성능 지표 추출 및 변환
-                            connections = safe_float(
-                                server.get("cursrvrconnections", 0)
-                            )  # 현재 연결 수
-                            throughput = safe_float(
-                                server.get("throughputrate", 0)
-                            )  # 처리량 (KB/s)
-                            ttfb = safe_float(
-                                server.get("avgsvrttfb", 0)
-                            )  # 평균 TTFB (ms)
-                            requests = safe_float(
-                                server.get("requestsrate", 0)
-                            )  # 초당 요청 수
-
-                            # 성능 메트릭들 설정
-                            self.server_connections.labels(
-                                lb_id=lb_id,
-                                lb_name=lb_name,
-                                server_ip=server_ip,
-                                server_port=server_port,
-                                zone=zone_name,
-                            ).set(connections)
-
-                            self.server_throughput_rate.labels(
-                                lb_id=lb_id,
-                                lb_name=lb_name,
-                                server_ip=server_ip,
-                                server_port=server_port,
-                                zone=zone_name,
-                            ).set(throughput)
-
-                            self.server_avg_ttfb.labels(
-                                lb_id=lb_id,
-                                lb_name=lb_name,
-                                server_ip=server_ip,
-                                server_port=server_port,
-                                zone=zone_name,
-                            ).set(ttfb)
-
-                            self.server_requests_rate.labels(
-                                lb_id=lb_id,
-                                lb_name=lb_name,
-                                server_ip=server_ip,
-                                server_port=server_port,
-                                zone=zone_name,
-                            ).set(requests)
-
-                        except Exception as e:
-                            logger.error(
-                                f"서버 {server.get('vm_ip', 'Unknown')} 메트릭 설정 실패: {e}"
-                            )
-
-                except Exception as e:
-                    logger.error(
-                        f"LB {lb.get('lb_name', 'Unknown')} 메트릭 설정 실패: {e}"
-                    )
-
-            # 서비스 타입별 카운트 메트릭 설정
-            for service_type, count in temp_data["service_type_counts"].items():
-                self.service_type_count.labels(
-                    service_type=service_type, zone=zone_name
-                ).set(count)
+            # 스냅샷 게시 (참조 교체)
+            with trace_span("publish"):
+                self.snapshot_collector.publish(snapshot)
 
             # 익스포터 상태 메트릭 업데이트
             # 마지막 성공적인 수집 시간 기록
-            self.last_scrape_timestamp.set(temp_data["collection_time"])
+            self.last_scrape_timestamp.set(collection_time)
 
             # 성공적인 원자적 업데이트 카운터 증가
             self.atomic_updates.inc()
 
-            # 업데이트 소요 시간 계산 및 로깅
-            update_duration = time.time() - update_start
-            logger.info(f"원자적 업데이트 완료 - 소요시간: {update_duration:.3f} 초")
-
         finally:
-            # 락 해제 및 상태 플래그 초기화 (예외 발생 시에도 실행됨)
-            self.is_updating = False
+            # 락 해제 (예외 발생 시에도 실행됨)
             self.update_lock.release()
 
+        # 업데이트 소요 시간 계산 및 로깅
+        update_duration = time.time() - update_start
+        logger.info(
+            f"원자적 업데이트 완료 - 소요시간: {update_duration:.3f} 초 "
+            f"(스냅샷 생성: {build_duration:.3f} 초)"
+        )
+
     def collect_metrics(self):
         """
         메트릭 수집 메인 함수 - 2단계 프로세스로 구성
@@ -470,32 +2227,276 @@ class AtomicKTCloudLBExporter:
         2단계: 원자적 메트릭 업데이트 (Prometheus 메트릭 갱신)
         이렇게 분리함으로써 Prometheus 스크랩 중에도 일관된 데이터를 제공할 수 있습니다.
         """
+        with self.collection_cycle() as start_time:
+            # 1단계: 수집 대상별 데이터 수집 (메트릭 업데이트 없음, 대상별로 동시에 진행)
+            # 모든 API 요청은 수집 주기 예산이 끝나는 시각을 deadline으로 사용
+            with trace_span("collect_targets"), kcl.ku.deadline(CYCLE_BUDGET):
+                results = self.map_targets(CollectionTarget.collect)
+            # 2단계: 원자적 메트릭 업데이트
+            self.publish_results(results, start_time)
+
+    async def collect_metrics_async(self):
+        """
+        collect_metrics()의 asyncio 버전
+        수집 대상별 수집을 task로 동시에 진행하고, 스냅샷 생성과 렌더링은 event loop 스레드에서 수행합니다.
+        """
+        with self.collection_cycle() as start_time:
+            with trace_span("collect_targets"), kcl.ku.deadline(CYCLE_BUDGET):
+                results = await asyncio.gather(
+                    *(target.collect_async() for target in self.targets)
+                )
+            self.publish_results(results, start_time)
+
+    @contextmanager
+    def collection_cycle(self):
+        """
+        수집 주기 하나의 공통 처리 (수집 루프 상태, 추적, 요청된 프로파일)
+        추적 ring buffer에 이번 주기를 기록하고, 프로파일 요청이 있으면 이번 주기만 프로파일합니다.
+        Yields:
+            float: 수집 주기 시작 시간
+        """
         start_time = time.time()
+        self.cycle_start_time = start_time
+        self.cycle_in_progress = True
+        profiler, self.pending_profiler = self.pending_profiler, None
+
+        try:
+            with self.tracer.cycle(
+                "collect_cycle", targets=len(self.targets)
+            ), profiler.profiling() if profiler else nullcontext():
+                logger.info(f"메트릭 수집 시작 - 대상 {len(self.targets)}개")
+                yield start_time
+        except Exception as e:
+            logger.error(f"메트릭 수집 중 오류: {e}")
+            raise
+        finally:
+            self.cycle_in_progress = False
+            if profiler is not None:
+                self.last_profile = {
+                    "profiler": profiler.kind,
+                    "requested_at": profiler.requested_at,
+                    "cycle_started_at": start_time,
+                    "report": profiler.report(),
+                }
+                logger.info(f"수집 주기 프로파일 완료 - {profiler.kind}")
+
+    def publish_results(self, results, start_time):
+        """
+        수집 대상별 수집 결과로 메트릭을 원자적으로 업데이트하고 /metrics 응답 캐시 갱신
+        Args:
+            results (list): self.targets 순서의 collect_data_to_temp() 결과
+            start_time (float): 수집 주기 시작 시간
+        """
+        collections = []
+        for target, temp_data in zip(self.targets, results):
+            for change, lb_ids in temp_data["lb_changes"].items():
+                if lb_ids:
+                    self.inventory_changes.labels(
+                        change=change,
+                        account=target.account,
+                        zone=target.zone_name,
+                    ).inc(len(lb_ids))
+            if temp_data.get("budget_exceeded"):
+                self.budget_overruns.labels(
+                    account=target.account, zone=target.zone_name
+                ).inc()
+            for kind, count in temp_data.get("budget_dropped", {}).items():
+                if count:
+                    self.budget_dropped.labels(
+                        kind=kind, account=target.account, zone=target.zone_name
+                    ).inc(count)
+            collections.append((target.inventory, temp_data))
+
+        collection_duration = time.time() - start_time
+        logger.info(f"데이터 수집 완료 - 소요시간: {collection_duration:.3f}초")
+
+        self.atomic_update_metrics(collections, start_time)
+
+        # 전체 소요 시간 기록 (메트릭으로 노출)
+        total_duration = time.time() - start_time
+        self.scrape_duration.set(total_duration)
+        logger.info(f"전체 메트릭 처리 완료 - 총 소요시간: {total_duration:.3f} 초")
+
+        # /metrics 응답 캐시 갱신 (다음 수집 전까지 모든 스크랩/프로브가 재사용)
+        with trace_span("render"):
+            render_duration = self.exposition_cache.render(start_time)
+        logger.info(f"/metrics 응답 렌더링 완료 - 소요시간: {render_duration:.3f} 초")
+        if self.lease is not None:
+            # lease 모드 - 다른 레플리카가 제공할 수 있도록 공유 스냅샷 기록
+            with trace_span("write_shared_snapshot"):
+                self.exposition_cache.write(COORDINATION_SNAPSHOT_FILE, start_time)
+        self.last_success_time = time.time()
+
+    def coordinate(self):
+        """
+        레플리카 간 수집 조정 - lease 모드에서 리스를 갱신하거나 획득 시도
+        리더가 아니면 리더가 기록한 공유 스냅샷을 다시 읽어 /metrics 응답으로 사용합니다.
+        Returns:
+            bool: 이 레플리카가 수집을 담당하면 True
+        """
+        if self.lease is None:
+            return True
 
+        was_leader = self.is_leader
         try:
-            logger.info("메트릭 수집 시작")
-            # 1단계: 데이터 수집 (메트릭 업데이트 없음)
-            temp_data = self.collect_data_to_temp()
+            self.is_leader = self.lease.try_acquire()
+        except OSError as e:
+            # 리스 파일에 접근할 수 없으면 중복 수집을 피하기 위해 수집하지 않음
+            logger.error(f"리스 확인 실패: {e}")
+            self.is_leader = False
+
+        if self.is_leader != was_leader:
+            logger.info(
+                "리더 리스 획득 - 수집 시작"
+                if self.is_leader
+                else f"리더 아님 (현재 리더: {self.lease.leader}) - 공유 스냅샷 제공"
+            )
+            self.collector_role.labels(
+                mode=COORDINATION_MODE, replica=REPLICA_ID
+            ).set(1 if self.is_leader else 0)
 
-            # LB가 없는 경우 처리
-            if not temp_data["lb_list"]:
-                self.lb_count.set(0)
+        if not self.is_leader:
+            self.load_shared_snapshot()
+        return self.is_leader
+
+    def load_shared_snapshot(self):
+        """리더가 기록한 공유 스냅샷 파일이 바뀌었으면 /metrics 응답 캐시로 적재"""
+        try:
+            mtime = os.stat(COORDINATION_SNAPSHOT_FILE).st_mtime
+            if mtime == self.shared_snapshot_mtime:
+                return
+            with open(COORDINATION_SNAPSHOT_FILE, "rb") as f:
+                body = f.read()
+        except OSError as e:
+            logger.warning(f"공유 스냅샷을 읽을 수 없습니다: {e}")
+            return
+
+        self.exposition_cache.load(body, mtime)
+        self.shared_snapshot_mtime = mtime
+        # 파일 수정 시간은 리더의 수집 시간이므로 /readyz는 리더 데이터의 나이로 판단
+        self.last_success_time = mtime
+        logger.info(f"공유 스냅샷 적재 완료 - {len(body)} bytes")
+
+    def wait_until(self, deadline):
+        """
+        deadline까지 대기
+        lease 모드에서는 리스 유효 시간의 1/3마다 리스를 갱신하고, 역할이 바뀌면 즉시 반환합니다.
+        """
+        leader = self.is_leader
+        while True:
+            remaining = deadline - time.time()
+            if remaining <= 0:
+                return
+            if self.lease is None:
+                time.sleep(remaining)
+                return
+            time.sleep(min(remaining, COORDINATION_LEASE_TTL / 3))
+            if self.coordinate() != leader:
                 return
 
-            collection_duration = time.time() - start_time
-            logger.info(f"데이터 수집 완료 - 소요시간: {collection_duration:.3f}초")
+    async def wait_until_async(self, deadline):
+        """wait_until()의 asyncio 버전 (대기 중에도 event loop의 HTTP 요청은 계속 처리)"""
+        leader = self.is_leader
+        while True:
+            remaining = deadline - time.time()
+            if remaining <= 0:
+                return
+            if self.lease is None:
+                await asyncio.sleep(remaining)
+                return
+            await asyncio.sleep(min(remaining, COORDINATION_LEASE_TTL / 3))
+            if self.coordinate() != leader:
+                return
 
-            # 2단계: 원자적 메트릭 업데이트
-            self.atomic_update_metrics(temp_data)
+    def health_status(self):
+        """
+        수집 루프 상태 조회 (API 호출, 레지스트리 접근 없음)
+        Returns:
+            dict: 마지막 성공 수집 경과 시간, 수집 진행 여부, token 유효 여부 등
+        """
+        now = time.time()
+        last_success = self.last_success_time
+        cycle_start = self.cycle_start_time
+        in_progress = self.cycle_in_progress
+        return {
+            "last_success_age_seconds": (
+                round(now - last_success, 3) if last_success else None
+            ),
+            "cycle_in_progress": in_progress,
+            "cycle_elapsed_seconds": (
+                round(now - cycle_start, 3) if in_progress and cycle_start else None
+            ),
+            "token_valid": all(
+                target.zone_mgr and target.zone_mgr.is_token_valid()
+                for target in self.targets
+            ),
+        }
 
-            # 전체 소요 시간 기록 (메트릭으로 노출)
-            total_duration = time.time() - start_time
-            self.scrape_duration.set(total_duration)
-            logger.info(f"전체 메트릭 처리 완료 - 총 소요시간: {total_duration:.3f} 초")
+    def liveness(self):
+        """/healthz - 수집 주기가 LIVENESS_STALL_SECONDS 이상 멈춰 있으면 실패"""
+        status = self.health_status()
+        elapsed = status["cycle_elapsed_seconds"]
+        ok = elapsed is None or elapsed < LIVENESS_STALL_SECONDS
+        status["status"] = "ok" if ok else "stalled"
+        return ok, status
+
+    def readiness(self):
+        """/readyz - 한 번 이상 메트릭이 게시되었고 READINESS_MAX_AGE 이내이면 성공"""
+        status = self.health_status()
+        age = status["last_success_age_seconds"]
+        ok = age is not None and (READINESS_MAX_AGE <= 0 or age <= READINESS_MAX_AGE)
+        status["status"] = "ok" if ok else "not_ready"
+        return ok, status
+
+    def start_http_server(self, port, addr="0.0.0.0"):
+        """
+        캐시된 /metrics 응답을 제공하는 HTTP 서버를 데몬 스레드로 시작
+        Returns:
+            ThreadingHTTPServer: 시작된 HTTP 서버
+        """
+        httpd = ThreadingHTTPServer((addr, port), ExporterRequestHandler)
+        httpd.daemon_threads = True
+        httpd.responder = ExporterResponder(self)
+        thread = threading.Thread(
+            target=httpd.serve_forever, name="metrics-http", daemon=True
+        )
+        thread.start()
+        return httpd
 
-        except Exception as e:
-            logger.error(f"메트릭 수집 중 오류: {e}")
-            raise
+    async def start_async_http_server(self, port, addr="0.0.0.0"):
+        """
+        asyncio 모드의 HTTP 서버를 현재 event loop에서 시작 (응답은 스레드 서버와 같음)
+        Returns:
+            aiohttp.web.AppRunner: 종료 시 cleanup()을 호출할 runner
+        """
+        from aiohttp import web
+
+        responder = ExporterResponder(self)
+
+        async def handle(request):
+            code, body, content_type, headers = responder.respond(
+                request.method, request.path, parse_qs(request.query_string), request.headers
+            )
+            response = web.Response(status=code, body=body, headers=headers)
+            if content_type:
+                response.headers["Content-Type"] = content_type
+            return response
+
+        app = web.Application()
+        app.router.add_route("*", "/{path:.*}", handle)
+        runner = web.AppRunner(app, access_log=None)
+        await runner.setup()
+        await web.TCPSite(runner, addr, port).start()
+        return runner
+
+    @staticmethod
+    def retry_delay(failures):
+        """
+        수집 루프 오류 후 재시도 대기 시간 (초)
+        ERROR_RETRY_BASE부터 연속 실패마다 두 배로 늘리고 (최대 ERROR_RETRY_MAX), 레플리카들이
+        같은 시점에 KT Cloud API로 몰리지 않도록 jitter를 적용합니다.
+        """
+        return kcl.ku.backoff_delay(failures, ERROR_RETRY_BASE, ERROR_RETRY_MAX)
 
     def run(self):
         """
@@ -509,51 +2510,136 @@ class AtomicKTCloudLBExporter:
         )
         logger.info("원자적 메트릭 업데이트로 Prometheus 스크랩 충돌 방지")
 
+        if KTCLOUD_ASYNC:
+            try:
+                asyncio.run(self.run_async())
+            except KeyboardInterrupt:
+                logger.info("사용자 중단 요청")
+            return
+
         # Prometheus HTTP 서버 시작 (메트릭 노출용)
-        start_http_server(EXPORTER_PORT, registry=self.registry)
+        self.start_http_server(EXPORTER_PORT)
         logger.info(f"메트릭 서버 시작: http://localhost:{EXPORTER_PORT}/metrics")
 
         # 메인 실행 루프
+        failures = 0  # 연속 실패 횟수 (재시도 대기 시간 계산)
         while True:
             try:
                 cycle_start = time.time()
 
+                if not self.coordinate():
+                    # lease 모드의 리더가 아닌 레플리카 - 수집하지 않고 리스 갱신 주기마다 다시 확인
+                    self.wait_until(cycle_start + COORDINATION_LEASE_TTL / 3)
+                    continue
+
                 # 메트릭 수집 실행
                 self.collect_metrics()
+                failures = 0
 
-                # 다음 수집까지의 대기 시간 계산
+                # 다음 수집까지의 대기 시간 계산 (가장 먼저 돌아오는 데이터 종류 기준)
                 elapsed = time.time() - cycle_start
-                sleep_time = max(0, SCRAPE_INTERVAL - elapsed)
+                next_due = min(target.next_due_time() for target in self.targets)
+                sleep_time = max(0, next_due - time.time())
 
                 if sleep_time > 0:
                     logger.info(f"다음 수집까지 {sleep_time:.1f} 초 대기")
-                    time.sleep(sleep_time)
+                    self.wait_until(next_due)
                 else:
                     # 수집 시간이 설정된 주기를 초과한 경우 경고
                     logger.warning(f"수집 시간이 수집 주기를 초과: {elapsed:.1f}초")
 
             except KeyboardInterrupt:
-                # 사용자가 Ctrl+C로 중단한 경우
+                # 사용자가 Ctrl+C로 중단한 경우 - 다른 레플리카가 바로 수집하도록 리스 반환
                 logger.info("사용자 중단 요청")
+                if self.lease is not None and self.is_leader:
+                    self.lease.release()
                 break
             except Exception as e:
-                # 예상치 못한 오류 발생 시 10초 후 재시도
+                # 예상치 못한 오류 발생 시 연속 실패 횟수에 따라 늘어나는 시간만큼 대기 후 재시도
                 logger.error(f"예상치 못한 오류: {e}")
-                logger.info("10초 후 재시도...")
-                time.sleep(10)
+                delay = self.retry_delay(failures)
+                failures += 1
+                logger.info(f"{delay:.1f}초 후 재시도...")
+                time.sleep(delay)
+
+    async def run_async(self):
+        """
+        run()의 asyncio 버전 (KTCLOUD_ASYNC=true)
+        HTTP 서버와 수집 루프를 하나의 event loop에서 실행하고, 종료 시 리스와 connection pool을 정리합니다.
+        """
+        if self.lease is None and not KTCLOUD_LAZY_INIT:
+            # 지연 초기화를 끈 경우 HTTP 서버 시작 전에 모든 대상 연결 (실패하면 종료)
+            logger.info(f"KT Cloud 연결 초기화 중... - 대상 {len(self.targets)}개")
+            await asyncio.gather(*(target.connect_async() for target in self.targets))
+
+        runner = await self.start_async_http_server(EXPORTER_PORT)
+        logger.info(f"메트릭 서버 시작 (asyncio): http://localhost:{EXPORTER_PORT}/metrics")
+
+        failures = 0
+        try:
+            while True:
+                try:
+                    cycle_start = time.time()
+
+                    if not self.coordinate():
+                        await self.wait_until_async(
+                            cycle_start + COORDINATION_LEASE_TTL / 3
+                        )
+                        continue
+
+                    await self.collect_metrics_async()
+                    failures = 0
+
+                    elapsed = time.time() - cycle_start
+                    next_due = min(target.next_due_time() for target in self.targets)
+                    sleep_time = max(0, next_due - time.time())
+
+                    if sleep_time > 0:
+                        logger.info(f"다음 수집까지 {sleep_time:.1f} 초 대기")
+                        await self.wait_until_async(next_due)
+                    else:
+                        logger.warning(f"수집 시간이 수집 주기를 초과: {elapsed:.1f}초")
+
+                except Exception as e:
+                    logger.error(f"예상치 못한 오류: {e}")
+                    delay = self.retry_delay(failures)
+                    failures += 1
+                    logger.info(f"{delay:.1f}초 후 재시도...")
+                    await asyncio.sleep(delay)
+        finally:
+            # 종료(Ctrl+C 포함) 시 다른 레플리카가 바로 수집하도록 리스 반환
+            if self.lease is not None and self.is_leader:
+                self.lease.release()
+            await asyncio.gather(
+                *(
+                    target.zone_mgr.close()
+                    for target in self.targets
+                    if target.zone_mgr is not None
+                ),
+                return_exceptions=True,
+            )
+            await runner.cleanup()
 
 
 def main():
     """메인 함수 - 프로그램 진입점
     환경 변수 검증 후 익스포터 실행
     """
-    # 필수 환경 변수 존재 여부 확인
-    if not all([CLOUD_ID, CLOUD_PASSWORD, CLOUD_ZONE]):
-        logger.error("환경 변수 누락: CLOUD_ID, CLOUD_PASSWORD, CLOUD_ZONE")
+    # 수집 대상 환경 변수 (KTCLOUD_TARGETS 또는 CLOUD_ID, CLOUD_PASSWORD, CLOUD_ZONE) 확인
+    try:
+        targets = load_targets()
+        if COORDINATION_MODE == "shard":
+            replica_shard()
+    except ValueError as e:
+        logger.error(f"수집 대상 설정 오류: {e}")
+        return
+
+    if COORDINATION_MODE not in ("none", "lease", "shard"):
+        logger.error(f"지원하지 않는 COORDINATION_MODE: {COORDINATION_MODE}")
         return
 
     # 익스포터 인스턴스 생성 및 실행
-    exporter = AtomicKTCloudLBExporter()
+    exporter = AtomicKTCloudLBExporter(targets)
     exporter.run()
 
 
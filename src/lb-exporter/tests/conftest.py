@@ -0,0 +1,9 @@
+# 테스트에서 SDK 모듈(kclutil, kcldx 등)과 bench의 가상 데이터 생성 함수를 import 할 수 있도록 경로 추가
+# 실행 방법 : cd src/lb-exporter && python -m pytest -q tests
+
+import os
+import sys
+
+EXPORTER_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+sys.path.insert(0, os.path.join(EXPORTER_DIR, "bench"))
+sys.path.insert(0, EXPORTER_DIR)
@@ -0,0 +1,153 @@
+# JsonArrayStream이 본문을 어느 위치에서 나누어 넣어도 json.loads로 전체를 파싱한 결과와
+# 같은 배열 항목과 배열 밖의 값(fields)을 돌려주는지 확인
+
+import json
+import random
+
+import pytest
+
+import kclutil as ku
+
+PATH = ("listloadbalancersresponse", "loadbalancer")
+
+# 문자열 escape, multi-byte UTF-8, surrogate pair, 숫자 형식, 중첩 값을 포함한 응답
+RESPONSE = {
+    "meta": {"skipped": [1, 2, {"loadbalancer": "not this one"}]},
+    "listloadbalancersresponse": {
+        "count": 4,
+        "loadbalancer": [
+            {
+                "loadbalancerid": 45486,
+                "name": '한글-lb "quoted" \\ back/slash',
+                "serviceip": "172.25.0.181",
+                "established": -12,
+                "rate": 1.5e-3,
+                "big": 12345678901234567890,
+                "ratio": -0.25,
+                "ok": True,
+                "failed": False,
+                "url": None,
+                "emoji": "\U0001f600 é",
+                "servers": [{"ip": "10.0.0.1"}, [], {}],
+            },
+            {},
+            [],
+            "plain string",
+            0,
+            -7.0,
+            None,
+        ],
+        "success": True,
+        "nested": {"httpStatus": 200, "list": [1.0, "]", "}", ","]},
+    },
+}
+
+
+def expected(response):
+    container = response[PATH[0]]
+    fields = {key: value for key, value in container.items() if key != PATH[1]}
+    return container.get(PATH[1], []), {PATH[0]: fields}
+
+
+def encodings(response):
+    return [
+        json.dumps(response).encode("utf-8"),
+        json.dumps(response, ensure_ascii=False).encode("utf-8"),
+        json.dumps(response, ensure_ascii=False, indent=2).encode("utf-8"),
+        json.dumps(response, separators=(",", ":")).encode("utf-8"),
+    ]
+
+
+def parse_chunks(chunks, parse_item=None):
+    stream = ku.JsonArrayStream(PATH, parse_item)
+    items = []
+    for chunk in chunks:
+        items.extend(stream.feed(chunk))
+    items.extend(stream.close())
+    return items, stream.document()
+
+
+@pytest.mark.parametrize(
+    "body", encodings(RESPONSE), ids=["ascii", "utf8", "indent", "compact"]
+)
+def test_split_at_every_byte(body):
+    items, document = expected(RESPONSE)
+    for split in range(len(body) + 1):
+        assert parse_chunks([body[:split], body[split:]]) == (items, document), split
+
+
+@pytest.mark.parametrize(
+    "body", encodings(RESPONSE), ids=["ascii", "utf8", "indent", "compact"]
+)
+def test_one_byte_chunks(body):
+    assert parse_chunks([body[i : i + 1] for i in range(len(body))]) == expected(
+        RESPONSE
+    )
+
+
+def test_random_chunks():
+    rng = random.Random(22)
+    for body in encodings(RESPONSE):
+        for _ in range(200):
+            cuts = sorted(rng.sample(range(1, len(body)), rng.randint(1, 20)))
+            chunks = [body[a:b] for a, b in zip([0] + cuts, cuts + [len(body)])]
+            assert parse_chunks(chunks) == expected(RESPONSE)
+
+
+def test_parse_item_applied_to_each_item():
+    body = json.dumps(RESPONSE).encode("utf-8")
+    items, _ = parse_chunks([body], parse_item=repr)
+    assert items == [repr(item) for item in expected(RESPONSE)[0]]
+
+
+@pytest.mark.parametrize(
+    "response",
+    [
+        {PATH[0]: {"count": 0}},
+        {PATH[0]: {PATH[1]: [], "count": 0}},
+        {PATH[0]: {}},
+    ],
+)
+def test_empty_or_missing_array(response):
+    body = json.dumps(response).encode("utf-8")
+    for split in range(len(body) + 1):
+        assert parse_chunks([body[:split], body[split:]]) == expected(response)
+
+
+def test_lb_records_match_json_loads():
+    # 실제 사용처와 같이 lb_info_record로 변환한 결과 비교
+    item = {
+        "loadbalancerid": "1",
+        "name": "lb-1",
+        "serviceip": "172.25.0.1",
+        "serviceport": "80",
+        "servicetype": "http",
+        "loadbalanceroption": "roundrobin",
+        "healthchecktype": "http",
+        "healthcheckurl": "/health",
+        "establishedconn": "3",
+        "ciphergroupname": "",
+        "networkid": "subnet",
+        "state": "UP",
+    }
+    response = {PATH[0]: {PATH[1]: [item, dict(item, name="lb-2")], "count": 2}}
+    body = json.dumps(response).encode("utf-8")
+    for split in range(len(body) + 1):
+        items, _ = parse_chunks([body[:split], body[split:]], ku.lb_info_record)
+        assert items == ku.parse_list_lb_info_records(response)
+
+
+@pytest.mark.parametrize(
+    "body",
+    [
+        b"",
+        b'{"listloadbalancersresponse": {"loadbalancer": [{"a": 1}',
+        b'{"listloadbalancersresponse": {"loadbalancer": [1, 2',
+        b'{"listloadbalancersresponse": {"count": 1',
+    ],
+)
+def test_truncated_body_raises(body):
+    stream = ku.JsonArrayStream(PATH)
+    stream.feed(body)
+    with pytest.raises(ValueError):
+        stream.close()
@@ -0,0 +1,144 @@
+# LBRecord/LBServerRecord 목록이 기존 dict 결과(parse_list_lb_info, parse_list_lb_server)와
+# 같은 값을 제공하는지 확인
+
+import json
+
+import pytest
+
+import kclutil as ku
+from bench_lb_records import make_responses
+
+# 서버 성능 지표 (레코드는 float로 변환하여 보관)
+METRIC_KEYS = ("cursrvrconnections", "throughputrate", "avgsvrttfb", "requestsrate")
+
+
+# 익스포터가 dict 결과의 성능 지표에 적용하던 변환 (None, 빈 문자열, 잘못된 형식은 0)
+def exporter_float(value):
+    try:
+        return float(value) if value is not None and value != "" else 0
+    except (ValueError, TypeError):
+        return 0
+
+
+@pytest.fixture(scope="module")
+def responses():
+    lb_text, server_texts = make_responses(200, 4)
+    return json.loads(lb_text), [json.loads(text) for text in server_texts]
+
+
+def lb_item(**overrides):
+    item = {
+        "loadbalancerid": "1",
+        "name": "lb",
+        "serviceip": "172.25.0.1",
+        "serviceport": "80",
+        "servicetype": "http",
+        "loadbalanceroption": "roundrobin",
+        "healthchecktype": "http",
+        "healthcheckurl": "/health",
+        "establishedconn": "3",
+        "ciphergroupname": "",
+        "networkid": "subnet",
+        "state": "UP",
+    }
+    item.update(overrides)
+    return item
+
+
+def server_item(**overrides):
+    item = {
+        "ipaddress": "10.0.0.1",
+        "loadbalancerid": "1",
+        "virtualmachineid": "vm",
+        "publicport": "80",
+        "state": "UP",
+        "serviceid": "1000",
+        "cursrvrconnections": "5",
+        "throughputrate": "1.5",
+        "avgsvrttfb": "10",
+        "requestsrate": "2",
+    }
+    item.update(overrides)
+    return item
+
+
+def assert_lb_equal(records, dicts):
+    assert len(records) == len(dicts)
+    for record, info in zip(records, dicts):
+        assert record._asdict() == info
+        for key, value in info.items():
+            assert record.get(key) == value
+        assert record.get("unknown") is None
+        assert record.get("unknown", "default") == "default"
+
+
+def assert_servers_equal(records, dicts):
+    assert len(records) == len(dicts)
+    for record, info in zip(records, dicts):
+        assert set(record._fields) == set(info)
+        for key, value in info.items():
+            if key in METRIC_KEYS:
+                assert record.get(key) == exporter_float(value)
+            else:
+                assert record.get(key) == value
+        assert record.get("unknown") is None
+
+
+def test_lb_records_match_dicts(responses):
+    lb_res, _ = responses
+    assert_lb_equal(
+        ku.parse_list_lb_info_records(lb_res), ku.parse_list_lb_info(lb_res)
+    )
+
+
+def test_server_records_match_dicts(responses):
+    _, server_responses = responses
+    for res in server_responses:
+        assert_servers_equal(
+            ku.parse_list_lb_server_records(res), ku.parse_list_lb_server(res)
+        )
+
+
+@pytest.mark.parametrize(
+    "item",
+    [
+        lb_item(),
+        # tcp healthcheck는 url을 무시
+        lb_item(healthchecktype="tcp", healthcheckurl="/ignored"),
+        lb_item(healthchecktype="https", healthcheckurl="/secure"),
+        lb_item(loadbalancerid=45486, establishedconn=0, state="DOWN"),
+    ],
+)
+def test_lb_record_edge_cases(item):
+    res = {"listloadbalancersresponse": {"loadbalancer": [item]}}
+    assert_lb_equal(ku.parse_list_lb_info_records(res), ku.parse_list_lb_info(res))
+
+
+@pytest.mark.parametrize("value", ["", None, "abc", "1.5", "0", 7, 2.25, "1e3"])
+def test_server_record_metric_values(value):
+    res = {
+        "listloadbalancerwebserversresponse": {
+            "loadbalancerwebserver": [
+                server_item(**{key: value for key in METRIC_KEYS})
+            ]
+        }
+    }
+    assert_servers_equal(
+        ku.parse_list_lb_server_records(res), ku.parse_list_lb_server(res)
+    )
+
+
+def test_lb_without_servers():
+    # 연결된 서버가 없는 LB는 응답에 loadbalancerwebserver 항목이 없음
+    res = {"listloadbalancerwebserversresponse": {"count": 0}}
+    assert ku.parse_list_lb_server_records(res) == ku.parse_list_lb_server(res) == []
+
+
+def test_missing_field_raises_like_dicts():
+    item = lb_item()
+    del item["networkid"]
+    res = {"listloadbalancersresponse": {"loadbalancer": [item]}}
+    with pytest.raises(KeyError):
+        ku.parse_list_lb_info(res)
+    with pytest.raises(KeyError):
+        ku.parse_list_lb_info_records(res)
@@ -0,0 +1,92 @@
+# get_request_body()의 미리 파싱한 template 방식이 기존 yaml 변환 방식(_get_request_body_yaml)과
+# 같은 body를 만드는지 확인
+
+import re
+
+import pytest
+
+import kclutil as ku
+
+# 치환 값 종류별 예시 (template 방식으로 처리되는 값과 yaml 방식으로 넘어가는 값을 모두 포함)
+VALUES = [
+    "web-vm01",
+    "172.25.0.0/24",
+    "0.0.0.0/0",
+    "TCP",
+    "true",
+    "null",
+    "123",
+    "0x1F",
+    "1e3",
+    "",
+    " leading and trailing ",
+    "a: b",
+    "# comment",
+    "- item",
+    "[1, 2]",
+    "{not a placeholder}",
+    "한글 이름",
+    "it's",
+    "tab\there",
+    "line\nbreak",
+    "I2Iv YmluL2Jhc2g=",
+    50,
+    0,
+    -1,
+    3.5,
+    True,
+    None,
+]
+
+
+def placeholder_names(command):
+    return sorted(set(re.findall(r"\{(\w+)\}", ku.request_body_dict[command])))
+
+
+# yaml 방식의 결과 또는 예외 (예외는 종류와 메시지로 비교)
+def build(func, command, kwargs):
+    try:
+        return func(command, **kwargs)
+    except Exception as e:
+        return type(e), str(e)
+
+
+@pytest.mark.parametrize("command", sorted(ku.request_body_dict))
+@pytest.mark.parametrize("value", VALUES, ids=repr)
+def test_template_matches_yaml(command, value):
+    kwargs = {name: value for name in placeholder_names(command)}
+    assert build(ku.get_request_body, command, kwargs) == build(
+        ku._get_request_body_yaml, command, kwargs
+    )
+
+
+@pytest.mark.parametrize("command", sorted(ku.request_body_dict))
+def test_template_matches_yaml_mixed_values(command):
+    # placeholder마다 다른 값을 넣어 위치가 바뀌지 않는지 확인
+    names = placeholder_names(command)
+    kwargs = {name: f"{name}-{i}" for i, name in enumerate(names)}
+    assert ku.get_request_body(command, **kwargs) == ku._get_request_body_yaml(
+        command, **kwargs
+    )
+
+
+@pytest.mark.parametrize(
+    "command", [c for c in sorted(ku.request_body_dict) if placeholder_names(c)]
+)
+def test_missing_value_raises_like_yaml(command):
+    # 치환 값이 빠지면 두 방식 모두 같은 KeyError
+    kwargs = {name: "x" for name in placeholder_names(command)[1:]}
+    with pytest.raises(KeyError) as fast:
+        ku.get_request_body(command, **kwargs)
+    with pytest.raises(KeyError) as slow:
+        ku._get_request_body_yaml(command, **kwargs)
+    assert fast.value.args == slow.value.args
+
+
+def test_template_is_not_modified():
+    # 반환한 body를 수정해도 다음 호출 결과에 영향이 없어야 함
+    body = ku.get_request_body("make_token", user_id="user", user_pw="pw")
+    body["auth"]["identity"]["password"]["user"]["name"] = "changed"
+    assert ku.get_request_body("make_token", user_id="user", user_pw="pw") == (
+        ku._get_request_body_yaml("make_token", user_id="user", user_pw="pw")
+    )
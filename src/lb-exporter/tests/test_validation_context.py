@@ -0,0 +1,340 @@
+# ValidationContext의 index 조회로 실행한 validate_* 결과(검사 결과와 메시지)가
+# 목록 전체를 순회하는 기존 방식과 같은지 확인
+
+import io
+import copy
+import random
+import contextlib
+
+import pytest
+
+import kclutil as ku
+from bench_validation import LinearContext, make_inventory, make_forms
+
+SUBNETS = [f"Tier{i}" for i in range(5)]
+CIDRS = ["10.0.0.0/24", "10.0.1.0/24", "all", "0.0.0.0/0"]
+
+
+def random_inventory(rng):
+    """이름, ip가 자주 겹치는 작은 기존 자원 목록"""
+    vms = [
+        {
+            "vm_name": f"vm-{rng.randint(0, 80)}",
+            "vm_id": f"id{i}",
+            "flavor_name": "2x4",
+            "subnets": [{"privateip": f"10.0.0.{rng.randint(1, 90)}"}],
+        }
+        for i in range(60)
+    ]
+    lbs = [
+        {
+            "lb_name": f"lb-{rng.randint(0, 30)}",
+            "service_ip": f"10.1.0.{rng.randint(1, 10)}",
+            "service_port": str(rng.choice([80, 443, 8080])),
+        }
+        for _ in range(25)
+    ]
+    ips = [
+        {
+            "publicip": f"211.0.0.{i}",
+            "type": rng.choice(["STATICNAT", "PORTFORWARDING", "NONE"]),
+        }
+        for i in range(30)
+    ]
+    pfs = [
+        {
+            "name": f"PF_{i}",
+            "publicip": f"211.0.0.{rng.randint(0, 29)}",
+            "privateip": f"10.0.0.{rng.randint(1, 90)}",
+            "public_port": str(rng.choice([22, 80, 443])),
+            "private_port": str(rng.choice([22, 80, 443])),
+        }
+        for i in range(30)
+    ]
+    sns = [
+        {
+            "name": f"SN_{i}",
+            "publicip": f"211.0.0.{rng.randint(0, 29)}",
+            "privateip": rng.choice(
+                [f"10.0.0.{rng.randint(1, 90)}", f"10.1.0.{rng.randint(1, 10)}"]
+            ),
+        }
+        for i in range(20)
+    ]
+    fws = []
+    for i in range(80):
+        service = {"protocol": rng.choice(["TCP", "UDP", "ALL"])}
+        if rng.random() < 0.5:
+            port = str(rng.choice([22, 80]))
+            service.update(startPort=port, endPort=port)
+        dst_net = rng.choice(SUBNETS + ["external"])
+        fws.append(
+            {
+                "acl_id": f"acl{i}",
+                "src_nets": [{"name": rng.choice(SUBNETS) + "_Sub"}],
+                "dst_nets": [
+                    {"name": dst_net + ("_Sub" if rng.random() < 0.8 else "")}
+                ],
+                "src_addrs": [
+                    {"name": rng.choice(CIDRS)} for _ in range(rng.randint(1, 2))
+                ],
+                "dst_addrs": [
+                    {"name": rng.choice(CIDRS + ["PF_1", "SN_2"])}
+                    for _ in range(rng.randint(1, 2))
+                ],
+                "services": [service],
+                "action": rng.choice(["allow", "deny"]),
+            }
+        )
+    return {
+        "vm_list": vms,
+        "lb_list": lbs,
+        "ip_list": ips,
+        "pf_list": pfs,
+        "sn_list": sns,
+        "fw_list": fws,
+        "subnet_list": [
+            {"subnet_name": s, "startip": "10.0.0.1", "endip": "10.0.0.200"}
+            for s in SUBNETS
+        ],
+        "flavor_list": [{"flavor_name": f} for f in ["2x4", "4x8"]],
+        "image_list": [{"image_name": "img"}],
+        "snapshot_list": [{"snapshot_name": "snap", "size": 50}],
+    }
+
+
+def random_acl(rng, fws):
+    """기존 ACL과 같은 내용 또는 임의의(잘못된 값 포함) firewall form 항목"""
+    acl_type = rng.choice(["net2net", "static_nat", "port_forward"])
+    if rng.random() < 0.4:
+        fw = rng.choice(fws)
+        service = fw["services"][0]
+        acl = {
+            "type": acl_type,
+            "src_cidr": ",".join(
+                "0.0.0.0/0" if a["name"] == "all" else a["name"]
+                for a in fw["src_addrs"]
+            ),
+            "dst_cidr": ",".join(
+                rng.choice(["0.0.0.0/0", "all"]) if a["name"] == "all" else a["name"]
+                for a in fw["dst_addrs"]
+            ),
+            "protocol": service["protocol"],
+            "action": fw["action"],
+            "src_net": fw["src_nets"][0]["name"].replace("_Sub", ""),
+            "dst_net": fw["dst_nets"][0]["name"].replace("_Sub", ""),
+        }
+        if "startPort" in service:
+            acl.update(start_port=service["startPort"], end_port=service["endPort"])
+        return acl
+    cidrs = ["10.0.0.0/24", "10.0.1.0/24", "0.0.0.0/0", "PF_1", "@res_x", "bad cidr!"]
+    acl = {
+        "type": acl_type,
+        "src_net": rng.choice(SUBNETS + ["nope"]),
+        "dst_net": rng.choice(SUBNETS + ["external"]),
+        "src_cidr": rng.choice(cidrs),
+        "dst_cidr": rng.choice(cidrs),
+        "protocol": rng.choice(["TCP", "ALL", "XX"]),
+        "action": rng.choice(["allow", "deny", "x"]),
+    }
+    if rng.random() < 0.5:
+        acl["start_port"] = acl["end_port"] = rng.choice([22, 80, "22"])
+    return acl
+
+
+def random_forms(rng, inv):
+    """신규 생성/변경/삭제 form (기존 자원과 이름, ip가 겹치는 항목 포함)"""
+    key_vm_list = []
+    for i in range(rng.randint(1, 8)):
+        params = {
+            "name": f"vm-{rng.randint(0, 90)}",
+            "key": "k1",
+            "flavor": rng.choice(["2x4", "8x16"]),
+            "subnet": rng.choice(SUBNETS + ["nope"]),
+            "image": rng.choice(["img", "x"]),
+            "root_vol_type": rng.choice(["HDD", "XX"]),
+        }
+        if rng.random() < 0.5:
+            params["fixed_ip"] = f"10.0.0.{rng.randint(1, 90)}"
+        key_vm_list.append({"key": f"v{i}", "params": params})
+    key_lb_list = [
+        {
+            "key": f"l{i}",
+            "params": {
+                "name": f"lb-{rng.randint(0, 40)}",
+                "option": "roundrobin",
+                "service_ip": rng.choice([f"10.1.0.{rng.randint(1, 12)}", "new_001"]),
+                "service_port": rng.choice([80, 443, "8080"]),
+                "service_type": "http",
+                "healthcheck_type": "http",
+                "healthcheck_url": "/",
+                "subnet": rng.choice(SUBNETS),
+                "server_port": 80,
+                "server_list": [
+                    f"vm-{rng.randint(0, 90)}" for _ in range(rng.randint(0, 4))
+                ],
+            },
+        }
+        for i in range(rng.randint(1, 8))
+    ]
+    key_ip_list = []
+    for i in range(rng.randint(1, 8)):
+        ip_type = rng.choice(["port_forward", "static_nat"])
+        params = {
+            "type": ip_type,
+            "public_ip": rng.choice([f"211.0.0.{rng.randint(0, 35)}", "new_001"]),
+            "target": (
+                rng.choice(["vm", "vm", "lb"]) if ip_type == "static_nat" else "vm"
+            ),
+            "target_name": rng.choice(
+                [f"vm-{rng.randint(0, 90)}", f"lb-{rng.randint(0, 30)}", "@res_a"]
+            ),
+        }
+        if ip_type == "port_forward":
+            params.update(
+                private_port=rng.choice([22, 80, 443]),
+                public_port=rng.choice([22, 80, 443]),
+                protocol="TCP",
+            )
+        key_ip_list.append({"key": f"i{i}", "params": params})
+    key_fw_list = [
+        {
+            "key": f"f{i}",
+            "params": [
+                random_acl(rng, inv["fw_list"]) for _ in range(rng.randint(1, 6))
+            ],
+        }
+        for i in range(3)
+    ]
+    return key_vm_list, key_lb_list, key_ip_list, key_fw_list
+
+
+def validate_calls(inv, forms, action):
+    key_vm_list, key_lb_list, key_ip_list, key_fw_list = forms
+    return [
+        (
+            ku.validate_vm_list,
+            (
+                key_vm_list,
+                inv["flavor_list"],
+                inv["subnet_list"],
+                inv["image_list"],
+                inv["snapshot_list"],
+                inv["vm_list"],
+                "DX-M1",
+                action,
+            ),
+        ),
+        (
+            ku.validate_lb_list,
+            (key_lb_list, inv["subnet_list"], inv["vm_list"], inv["lb_list"], action),
+        ),
+        (
+            ku.validate_ip_list,
+            (
+                key_ip_list,
+                inv["vm_list"],
+                inv["lb_list"],
+                inv["ip_list"],
+                inv["pf_list"],
+                inv["sn_list"],
+                action,
+            ),
+        ),
+        (
+            ku.validate_firewall_list,
+            (
+                key_fw_list,
+                inv["subnet_list"],
+                inv["pf_list"],
+                inv["sn_list"],
+                inv["fw_list"],
+                action,
+            ),
+        ),
+        (ku.validate_change_vm_list, (key_vm_list, inv["flavor_list"], inv["vm_list"])),
+        (ku.validate_change_lb_list, (key_lb_list, inv["lb_list"], inv["vm_list"])),
+        (ku.validate_delete_vm_list, (key_vm_list, inv["vm_list"], action)),
+        (ku.validate_delete_lb_list, (key_lb_list, inv["lb_list"], action)),
+        (ku.validate_delete_firewall_list, (key_fw_list, inv["fw_list"], action)),
+    ]
+
+
+def run(func, args, context):
+    """검사 결과 (예외는 종류로 비교)와 검사 중 수정된 form, 출력 메시지 return"""
+    args = copy.deepcopy(args)
+    out = io.StringIO()
+    try:
+        with contextlib.redirect_stdout(out):
+            result = func(*args, context=context)
+    except Exception as e:
+        result = type(e)
+    return result, args[0], out.getvalue()
+
+
+@pytest.mark.parametrize("seed", range(40))
+def test_validate_matches_linear(seed):
+    rng = random.Random(seed)
+    inv = random_inventory(rng)
+    forms = random_forms(rng, inv)
+    action = rng.choice(["all", "part"])
+
+    # VPC와 같이 하나의 context를 여러 검사에서 공유
+    shared = ku.ValidationContext()
+    for func, args in validate_calls(inv, forms, action):
+        expected = run(func, args, LinearContext())
+        assert run(func, args, shared) == expected, func.__name__
+        assert run(func, args, None) == expected, func.__name__
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_search_acl_matches_linear(seed):
+    rng = random.Random(1000 + seed)
+    inv = random_inventory(rng)
+    context = ku.ValidationContext()
+    for _ in range(50):
+        acl = random_acl(rng, inv["fw_list"])
+        assert context.search_acl(acl, inv["fw_list"]) == ku.search_acl(
+            acl, inv["fw_list"]
+        ), acl
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_validate_fixed_ip_matches_linear(seed):
+    rng = random.Random(2000 + seed)
+    inv = random_inventory(rng)
+    context = ku.ValidationContext()
+    for last in range(0, 100):
+        ip_addr = f"10.0.0.{last}"
+        assert context.validate_fixed_ip(ip_addr, inv["vm_list"]) == (
+            ku.validate_fixed_ip(ip_addr, inv["vm_list"])
+        )
+
+
+def test_missing_keys_fall_back_to_linear():
+    # key가 없는 항목이 섞인 목록은 index 대신 기존 함수 사용 (같은 예외, 같은 결과)
+    data = [
+        {"vm_name": "a", "vm_id": "1"},
+        {"vm_id": "2"},
+        {"vm_name": "b", "vm_id": "3"},
+    ]
+    context = ku.ValidationContext()
+    assert context.exists("vm_name", "b", data) == ku.check_exist_in_dict_list(
+        "vm_name", "b", data
+    )
+    assert context.items("vm_name", "b", data, strict=False) == [data[2]]
+    with pytest.raises(KeyError):
+        ku.get_value_in_dict_list("vm_name", "b", "vm_id", data)
+    with pytest.raises(KeyError):
+        context.get_value("vm_name", "b", "vm_id", data)
+
+
+def test_bench_forms_match_linear():
+    # bench와 같은 대량 form (기존 자원과 이름이 겹치지 않는 경우)
+    inv = make_inventory(300)
+    key_vm_list, key_lb_list, key_nat_list, key_fw_list = make_forms(300)
+    shared = ku.ValidationContext()
+    for func, args in validate_calls(
+        inv, (key_vm_list, key_lb_list, key_nat_list, key_fw_list), "all"
+    )[:4]:
+        assert run(func, args, shared) == run(func, args, LinearContext())
@@ -0,0 +1,200 @@
+# VPC의 index 조회(_find, _index)가 기존처럼 목록 전체를 순회해 찾은 결과와 같은지 확인
+# 자원 목록은 bench_vpc_index의 가상 ZoneManager로 제공 (API는 호출하지 않음)
+
+import copy
+import io
+import contextlib
+
+import pytest
+
+import kcldx
+from bench_vpc_index import FakeZoneManager, LinearVPC, make_inventory
+
+
+# 기존 구현과 같이 목록을 순서대로 순회하는 조회 (VPC의 현재 목록 기준)
+def linear_first(items, key, value):
+    return next((item for item in items if item[key] == value), None)
+
+
+def linear_field(items, key, value, field):
+    item = linear_first(items, key, value)
+    return None if item is None else field(item)
+
+
+LOOKUPS = {
+    "_get_vm_id": lambda vpc, v: linear_field(
+        vpc.vm_list, "vm_name", v, lambda i: i["vm_id"]
+    ),
+    "_get_vm_status": lambda vpc, v: linear_field(
+        vpc.vm_list, "vm_id", v, lambda i: i["status"]
+    ),
+    "_get_vm_privateip": lambda vpc, v: linear_field(
+        vpc.vm_list, "vm_name", v, lambda i: i["subnets"][0]["privateip"]
+    ),
+    "_get_lb_id": lambda vpc, v: linear_field(
+        vpc.lb_list, "lb_name", v, lambda i: i["lb_id"]
+    ),
+    "_get_lb_privateip": lambda vpc, v: linear_field(
+        vpc.lb_list, "lb_name", v, lambda i: i["service_ip"]
+    ),
+    "_get_publicip_id": lambda vpc, v: linear_field(
+        vpc.ip_list, "publicip", v, lambda i: i["publicip_id"]
+    ),
+    "_get_flavor_id": lambda vpc, v: linear_field(
+        vpc.flavor_list, "flavor_name", v, lambda i: i["flavor_id"]
+    ),
+    "_get_subnet_id": lambda vpc, v: linear_field(
+        vpc.subnet_list, "subnet_name", v, lambda i: i["subnet_id"]
+    ),
+    "_get_image_id_size": lambda vpc, v: linear_field(
+        vpc.image_list, "image_name", v, lambda i: (i["image_id"], i["min_disk"])
+    ),
+    "_get_snapshot_id": lambda vpc, v: linear_field(
+        vpc.snapshot_list, "snapshot_name", v, lambda i: i["snapshot_id"]
+    ),
+    "_get_portforward_id": lambda vpc, v: linear_field(
+        vpc.pf_list, "name", v, lambda i: i["portforward_id"]
+    ),
+    "_get_portforward_publicip": lambda vpc, v: linear_field(
+        vpc.pf_list, "name", v, lambda i: i["publicip"]
+    ),
+    "_get_staticnat_id": lambda vpc, v: linear_field(
+        vpc.sn_list, "name", v, lambda i: i["staticnat_id"]
+    ),
+    "_get_staticnat_publicip": lambda vpc, v: linear_field(
+        vpc.sn_list, "name", v, lambda i: i["publicip"]
+    ),
+}
+
+
+def make_vpc_inventory():
+    """bench 목록에 이름 중복, ip를 공유하는 port forward/static nat, snapshot을 추가한 목록"""
+    inventory = make_inventory(40, 20, 20)
+    vm_list = inventory["list_vm_info"]
+    # 같은 이름의 VM이 여러 개이면 목록에서 먼저 나온 VM을 사용
+    vm_list.append(dict(vm_list[3], vm_id="vm-id-dup-3", status="STOPPED"))
+    vm_list.insert(0, dict(vm_list[10], vm_id="vm-id-dup-10", status="STOPPED"))
+    inventory["list_lb_info"].append(
+        dict(inventory["list_lb_info"][5], lb_id="lb-id-dup-5")
+    )
+    inventory["list_portforward_info"] = [
+        {
+            "name": f"PF_{i}",
+            "portforward_id": f"pf-id-{i}",
+            "publicip": f"211.1.0.{i % 4}",
+            "privateip": f"172.25.0.{i % 3 + 1}",
+        }
+        for i in range(12)
+    ]
+    inventory["list_snapshot_info"] = [
+        {"snapshot_id": f"snap-id-{i}", "snapshot_name": f"snap-{i % 5}"}
+        for i in range(10)
+    ]
+    return inventory
+
+
+def lookup_values(vpc):
+    """목록에 있는 값과 없는 값을 모두 포함한 조회 인자"""
+    names = [item["vm_name"] for item in vpc.vm_list] + ["missing-vm", None]
+    values = {
+        "_get_vm_id": names,
+        "_get_vm_privateip": names,
+        "_get_vm_status": [item["vm_id"] for item in vpc.vm_list] + ["missing"],
+        "_get_lb_id": [item["lb_name"] for item in vpc.lb_list] + ["missing-lb"],
+        "_get_publicip_id": [item["publicip"] for item in vpc.ip_list] + ["1.1.1.1"],
+        "_get_flavor_id": ["1x2.itl", "64x128.itl", "missing"],
+        "_get_subnet_id": ["Tier0", "Tier31", "Tier32"],
+        "_get_image_id_size": ["image-0", "image-199", "missing"],
+        "_get_snapshot_id": ["snap-0", "snap-4", "missing"],
+        "_get_portforward_id": ["PF_0", "PF_11", "PF_12"],
+        "_get_staticnat_id": [item["name"] for item in vpc.sn_list] + ["SN_x"],
+    }
+    values["_get_lb_privateip"] = values["_get_lb_id"]
+    values["_get_portforward_publicip"] = values["_get_portforward_id"]
+    values["_get_staticnat_publicip"] = values["_get_staticnat_id"]
+    return values
+
+
+def assert_lookups_match(vpc):
+    for name, args in lookup_values(vpc).items():
+        for value in args:
+            assert getattr(vpc, name)(value) == LOOKUPS[name](vpc, value), (name, value)
+    for option, key in (("public", "publicip"), ("private", "privateip")):
+        for ipaddr in {item[key] for item in vpc.pf_list + vpc.sn_list} | {"none"}:
+            assert vpc._get_portforward_info(ipaddr, option) == [
+                item for item in vpc.pf_list if item[key] == ipaddr
+            ]
+            assert vpc._get_staticnat_info(ipaddr, option) == linear_first(
+                vpc.sn_list, key, ipaddr
+            )
+
+
+@pytest.fixture
+def vpc(monkeypatch):
+    # 삭제 함수의 대기 시간 생략
+    monkeypatch.setattr(kcldx.time, "sleep", lambda seconds: None)
+    vpc = kcldx.VPC(FakeZoneManager(make_vpc_inventory()))
+    vpc._init_query("for_validate")
+    return vpc
+
+
+def test_lookups_match_linear_scan(vpc):
+    assert_lookups_match(vpc)
+
+
+def test_get_vm_info_matches_linear_scan(vpc):
+    servers = ["bench-vm-00003", "bench-vm-00010", "bench-vm-00039"]
+    assert vpc._get_vm_info(servers) == [
+        {
+            "id": LOOKUPS["_get_vm_id"](vpc, server),
+            "privateip": LOOKUPS["_get_vm_privateip"](vpc, server),
+        }
+        for server in servers
+    ]
+    with pytest.raises(Exception, match="'missing-vm' does not exist"):
+        vpc._get_vm_info(["bench-vm-00001", "missing-vm"])
+
+
+def test_requery_rebuilds_index(vpc):
+    # 목록을 다시 조회(재할당)하면 이전 index를 사용하지 않음
+    vpc._get_vm_id("bench-vm-00001")
+    vpc.vm_list = list(reversed(vpc.vm_list))
+    assert_lookups_match(vpc)
+    vpc.vm_list = []
+    assert vpc._get_vm_id("bench-vm-00001") is None
+
+
+def test_lookups_match_after_delete(vpc):
+    # 삭제한 자원은 목록과 index에서 함께 제거되고, 남은 자원의 조회 결과는 목록 순회와 같음
+    key_lb_list = [
+        {"key": f"lb{i}", "params": {"name": f"bench-lb-{i:05d}"}, "state": "created"}
+        for i in range(0, 20, 3)
+    ]
+    key_vm_list = [
+        {"key": f"vm{i}", "params": {"name": f"bench-vm-{i:05d}"}, "state": "created"}
+        for i in (3, 10, 11, 25)
+    ]
+    with contextlib.redirect_stdout(io.StringIO()):
+        vpc._delete_lb_list(key_lb_list)
+        vpc._delete_vm_list(key_vm_list)
+    assert "lb-id-0" not in [item["lb_id"] for item in vpc.lb_list]
+    assert "vm-id-25" not in [item["vm_id"] for item in vpc.vm_list]
+    # 이름이 같은 VM은 먼저 나온 것만 삭제되고 나머지는 그대로 조회됨
+    assert vpc._get_vm_id("bench-vm-00003") == "vm-id-dup-3"
+    assert_lookups_match(vpc)
+
+
+def test_delete_messages_match_linear(monkeypatch):
+    monkeypatch.setattr(kcldx.time, "sleep", lambda seconds: None)
+    key_vm_list = [
+        {"key": f"vm{i}", "params": {"name": f"bench-vm-{i:05d}"}, "state": "created"}
+        for i in range(0, 40, 7)
+    ] + [{"key": "skip", "params": {"name": "bench-vm-00001"}, "state": "none"}]
+
+    results = []
+    for vpc_class in (kcldx.VPC, LinearVPC):
+        vpc = vpc_class(FakeZoneManager(make_vpc_inventory()))
+        vpc._init_query("for_validate")
+        with contextlib.redirect_stdout(io.StringIO()):
+            results.append(vpc._delete_vm_list(copy.deepcopy(key_vm_list)))
+    assert results[0] == results[1]